@@ -0,0 +1,206 @@
+import json
+import os
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+
+class AssetManager:
+    """
+    Class caching the images and fonts used by the game so each file is only read from disk once.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the AssetManager class.
+        """
+        self.images = {}
+        self.fonts = {}
+        self.unconverted = set() # Paths of images loaded before a display mode was set
+        self.pending = {} # Path -> (future decoding the file on a worker thread, alpha)
+        self.executor = None # Created on the first background load
+        self.pending_atlas = None # Future building a texture atlas, resolving to its manifest path
+        self.hits = 0
+        self.misses = 0
+        self.background_loads = 0 # Images decoded by the worker threads, which gameplay never waited on
+
+    def get_image(self, path, alpha=True):
+        """
+        Get an image, loading and converting it to the display pixel format on first use.
+
+        Args:
+            path (str): The image file path.
+            alpha (bool): Whether the image keeps per-pixel alpha (sprites) or not (maps).
+
+        Returns:
+            pygame.Surface: The shared surface for the image.
+        """
+        image = self.images.get(path)
+        if image is not None:
+            self.hits += 1
+            if self.unconverted and path in self.unconverted:
+                image = self.convert(path, image, alpha)
+            return image
+
+        if path in self.pending: # Requested before the worker finished, wait for it rather than decoding the file twice
+            future, _ = self.pending.pop(path)
+            self.hits += 1
+            self.unconverted.add(path)
+            return self.convert(path, future.result(), alpha)
+
+        self.misses += 1
+        image = pygame.image.load(path)
+        self.unconverted.add(path)
+        return self.convert(path, image, alpha)
+
+    def convert(self, path, image, alpha):
+        """
+        Convert an image to the display pixel format if a display mode has been set.
+
+        Args:
+            path (str): The image file path.
+            image (pygame.Surface): The loaded image.
+            alpha (bool): Whether the image keeps per-pixel alpha.
+
+        Returns:
+            pygame.Surface: The converted image, or the original one if there is no display yet.
+        """
+        if pygame.display.get_surface() is not None: # convert() needs a display mode, so headless runs keep the raw surface
+            image = image.convert_alpha() if alpha else image.convert()
+            self.unconverted.discard(path)
+        self.images[path] = image
+        return image
+
+    def get_font(self, path, size):
+        """
+        Get a font, creating it on first use.
+
+        Args:
+            path (str): The font file path, or None for the default pygame font.
+            size (int): The font size.
+
+        Returns:
+            pygame.font.Font: The shared font object.
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        font = pygame.font.Font(path, size)
+        self.fonts[key] = font
+        return font
+
+    def preload(self, paths, alpha=True):
+        """
+        Load a list of images ahead of time.
+
+        Args:
+            paths (list): The image file paths.
+            alpha (bool): Whether the images keep per-pixel alpha.
+        """
+        for path in paths:
+            self.get_image(path, alpha)
+
+    def use_atlas(self, manifest_path):
+        """
+        Serve the sprites of a texture atlas as regions of its pages instead of separate images.
+        Every atlas sprite becomes a subsurface of a shared, converted page.
+
+        Args:
+            manifest_path (str): The manifest written by Atlas.build_atlas.
+        """
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        directory = os.path.dirname(manifest_path)
+        pages = [self.get_image(os.path.join(directory, page_file)) for page_file in manifest["pages"]]
+        for path, (page, x, y, width, height) in manifest["sprites"].items():
+            self.images[path] = pages[page].subsurface((x, y, width, height))
+            self.unconverted.discard(path)
+            self.pending.pop(path, None) # A separate copy still loading would replace the atlas region
+
+    def use_atlas_when_built(self, build, *args):
+        """
+        Build a texture atlas on a worker thread and serve its sprites once collect picks it up.
+        Until then sprites keep loading as separate images.
+
+        Args:
+            build (callable): Builds the atlas and returns its manifest path, e.g. Atlas.build_atlas.
+            *args: The arguments of build.
+        """
+        self.pending_atlas = self.submit(build, *args)
+
+    def load_async(self, paths, alpha=True):
+        """
+        Start decoding images on a worker thread. collect picks up the finished ones.
+
+        Args:
+            paths (list): The image file paths. Images already loaded or loading are skipped.
+            alpha (bool): Whether the images keep per-pixel alpha.
+        """
+        for path in paths:
+            if path in self.images or path in self.pending:
+                continue
+            self.pending[path] = (self.submit(pygame.image.load, path), alpha)
+
+    def submit(self, function, *args):
+        """
+        Run a function on one of the worker threads.
+
+        Args:
+            function (callable): The function to run.
+            *args: The arguments of the function.
+
+        Returns:
+            concurrent.futures.Future: The future of the result.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="asset-loader")
+        return self.executor.submit(function, *args)
+
+    def collect(self):
+        """
+        Convert and cache the images the worker threads finished decoding, and switch to the atlas once it is built.
+        Call it from the main thread, e.g. once per frame, so it never waits on file I/O or decoding.
+
+        Returns:
+            int: The number of images still loading.
+        """
+        if self.pending_atlas is not None and self.pending_atlas.done():
+            future = self.pending_atlas
+            self.pending_atlas = None
+            try:
+                self.use_atlas(future.result())
+            except (OSError, pygame.error): # Sprites keep loading as separate images
+                pass
+        if not self.pending:
+            return 0
+        for path, (future, alpha) in list(self.pending.items()):
+            if future.done():
+                del self.pending[path]
+                self.background_loads += 1
+                self.unconverted.add(path)
+                self.convert(path, future.result(), alpha)
+        return len(self.pending)
+
+    def stats(self):
+        """
+        Get the cache statistics.
+
+        Returns:
+            dict: The number of hits, misses (disk loads on the main thread), background loads, cached images,
+            cached fonts and images still loading.
+        """
+        return {"hits": self.hits, "misses": self.misses, "background_loads": self.background_loads,
+                "images": len(self.images), "fonts": len(self.fonts), "loading": len(self.pending)}
+
+    def reset_stats(self):
+        """
+        Reset the hit, miss and background load counters, e.g. at the start of gameplay so later misses show disk I/O.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.background_loads = 0
+
+
+# Shared instance used by every game module
+assets = AssetManager()
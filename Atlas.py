@@ -0,0 +1,169 @@
+import os
+import sys
+import json
+import argparse
+import pygame
+from AssetManager import assets
+from Waves import WaveTable
+
+# Sprites drawn by the player, its projectiles, hit effects and the tutorial (enemy sprites come from the wave table)
+GAMEPLAY_SPRITES = ["Images/PlayerKunKunLeft.png", "Images/PlayerKunKunRight.png", "Images/Splat.png", "Images/KunKunAttack.png",
+                    "Images/Target.png", "Images/TargetSmokeEffect.png", "Images/TargetDestroyEffect.png", "Images/BluePortal.png"]
+ATLAS_DIRECTORY = "Images/Atlas"
+ATLAS_MANIFEST = os.path.join(ATLAS_DIRECTORY, "manifest.json")
+PAGE_SIZE = 1024
+PADDING = 1 # Transparent pixels between sprites
+
+def pack(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """
+    Place rectangles on pages with a shelf packer: the rectangles are sorted by height and laid out
+    left to right on shelves, a new shelf starts when a row is full and a new page when a page is full.
+
+    Args:
+        sizes (dict): Key -> (width, height) of every rectangle.
+        page_size (int): The width and height of a page. Larger rectangles get a page of their own.
+        padding (int): The gap kept around every rectangle.
+
+    Returns:
+        Tuple[list, dict]: The (width, height) of every page and key -> (page, x, y, width, height).
+    """
+    pages = []
+    placements = {}
+    oversized = []
+    shelf_x = shelf_y = shelf_height = 0
+
+    for key, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if width + padding > page_size or height + padding > page_size: # Too large to share a page
+            oversized.append((key, width, height))
+            continue
+
+        if pages and shelf_x + width + padding > page_size: # Start a new shelf
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+        if not pages or shelf_y + height + padding > page_size: # Start a new page
+            pages.append((page_size, page_size))
+            shelf_x = shelf_y = shelf_height = 0
+
+        placements[key] = (len(pages) - 1, shelf_x, shelf_y, width, height)
+        shelf_x += width + padding
+        shelf_height = max(shelf_height, height + padding)
+
+    for key, width, height in oversized:
+        pages.append((width, height))
+        placements[key] = (len(pages) - 1, 0, 0, width, height)
+
+    return pages, placements
+
+def build_atlas(paths, directory=ATLAS_DIRECTORY, page_size=PAGE_SIZE):
+    """
+    Pack sprite images into atlas pages and write the pages and the manifest to a directory.
+    It only reads and writes files, so it can run on a worker thread.
+
+    Args:
+        paths (list): The sprite image file paths.
+        directory (str): Where the pages (atlas_<n>.png) and manifest.json are written.
+        page_size (int): The width and height of a page.
+
+    Returns:
+        str: The manifest file path.
+    """
+    images = {path: pygame.image.load(path) for path in dict.fromkeys(paths)}
+    page_sizes, placements = pack({path: image.get_size() for path, image in images.items()}, page_size)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for path, (page, x, y, _, _) in placements.items():
+        image = images[path]
+        if image.get_flags() & pygame.SRCALPHA:
+            pages[page].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_ADD) # Adding onto transparent pixels copies colour and alpha exactly
+        else:
+            pages[page].blit(image, (x, y)) # Opaque, or transparent through a colorkey that the plain blit skips
+
+    os.makedirs(directory, exist_ok=True)
+    page_files = []
+    for index, page in enumerate(pages):
+        page_file = f"atlas_{index}.png"
+        pygame.image.save(page, os.path.join(directory, page_file))
+        page_files.append(page_file)
+
+    manifest_path = os.path.join(directory, "manifest.json")
+    with open(manifest_path, "w") as manifest_file:
+        json.dump({"pages": page_files, "sprites": {path: list(placement) for path, placement in sorted(placements.items())}}, manifest_file, indent=1)
+    return manifest_path
+
+def atlas_is_current(paths, manifest_path=ATLAS_MANIFEST):
+    """
+    Check if the atlas exists, holds every sprite and is newer than all of them.
+
+    Args:
+        paths (list): The sprite image file paths.
+        manifest_path (str): The manifest file path.
+
+    Returns:
+        bool: True if the atlas can be used as it is.
+    """
+    if not os.path.exists(manifest_path):
+        return False
+    with open(manifest_path) as manifest_file:
+        sprites = json.load(manifest_file)["sprites"]
+    built = os.path.getmtime(manifest_path)
+    return all(path in sprites and os.path.getmtime(path) <= built for path in paths)
+
+def load_or_build_atlas(paths, manifest_path=ATLAS_MANIFEST, background=False):
+    """
+    Make the AssetManager serve sprites from the atlas, building the atlas first if it is missing or out of date.
+    The game keeps loading separate images if the sprites or the atlas directory are not available.
+
+    Args:
+        paths (list): The sprite image file paths.
+        manifest_path (str): The manifest file path.
+        background (bool): Whether a missing or out of date atlas is built on a worker thread instead,
+            the AssetManager switches to it when collect finds it built.
+
+    Returns:
+        bool: True if the atlas is used, or will be once it is built.
+    """
+    try:
+        if not atlas_is_current(paths, manifest_path):
+            if background:
+                assets.use_atlas_when_built(build_atlas, paths, os.path.dirname(manifest_path))
+                return True
+            build_atlas(paths, os.path.dirname(manifest_path))
+        assets.use_atlas(manifest_path)
+    except (OSError, pygame.error):
+        return False
+    return True
+
+def sprite_paths():
+    """
+    Get every sprite drawn during gameplay and the tutorial: player, effects and every enemy type of the wave table.
+
+    Returns:
+        list: The sprite image file paths.
+    """
+    return GAMEPLAY_SPRITES + WaveTable().sprite_paths()
+
+def main(argv=None):
+    """
+    Build the atlas from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Pack every game sprite into texture atlas pages.")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--output", default=ATLAS_DIRECTORY, help="Directory the pages and manifest.json are written to.")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    paths = sprite_paths()
+    manifest_path = build_atlas(paths, args.output, args.page_size)
+    with open(manifest_path) as manifest_file:
+        pages = json.load(manifest_file)["pages"]
+    print(f"Packed {len(paths)} sprites into {len(pages)} page(s), manifest written to {manifest_path}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
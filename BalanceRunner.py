@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import time
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Simulations run headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from Game import Game, WIDTH, HEIGHT, BASE_TICK_RATE
+from Waves import WaveTable, WAVE_TABLE_PATH
+from Benchmark import percentile
+from Controller import ScriptedPlayer
+
+def init_worker():
+    """
+    Set up pygame in a worker process. Images can only be loaded once a display mode is set,
+    nothing is drawn so no other subsystem is needed.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+def simulate(seed, max_seconds=600, wave_table_path=WAVE_TABLE_PATH, tick_rate=BASE_TICK_RATE):
+    """
+    Play one headless game with a scripted player, without the banners between waves.
+
+    Args:
+        seed (int): The seed of the scripted player.
+        max_seconds (float): The game time after which the run is stopped.
+        wave_table_path (str): The wave table to play.
+        tick_rate (int): The simulation tick rate.
+
+    Returns:
+        dict: The seed, the outcome ("defeat", "victory" or "timeout"), the game time in seconds and, for every wave played,
+              its number, the seconds it lasted, the damage taken, the kills and how it ended ("cleared", "defeat" or "timeout").
+    """
+    game = Game(tick_rate=tick_rate, wave_delays=False, wave_table=WaveTable(wave_table_path))
+    player = ScriptedPlayer(seed)
+    waves = []
+
+    wave_number = game.wave_number
+    wave_start = 0
+    health_start = game.player.health
+    kills_start = 0
+
+    def end_wave(tick, wave_outcome):
+        """
+        Record the wave that just ended.
+        """
+        if wave_number == 0: # The start of the game is not a wave
+            return
+        waves.append({
+            "wave": wave_number,
+            "seconds": (tick - wave_start) / tick_rate,
+            "damage_taken": round(health_start - game.player.health, 2),
+            "kills": game.enemies_killed + game.projectile_enemies_killed - kills_start,
+            "outcome": wave_outcome,
+        })
+
+    outcome = "timeout"
+    max_ticks = int(max_seconds * tick_rate)
+    tick = 0
+    while tick < max_ticks:
+        result = game.step(player.next_input(game))
+        tick += 1
+        if result == "defeat" or result == "victory":
+            outcome = result
+            break
+        if game.wave_number != wave_number: # The next wave spawned
+            end_wave(tick, "cleared")
+            wave_number = game.wave_number
+            wave_start = tick
+            health_start = game.player.health
+            kills_start = game.enemies_killed + game.projectile_enemies_killed
+    end_wave(tick, "cleared" if outcome == "victory" else outcome)
+    game.end()
+
+    return {"seed": seed, "outcome": outcome, "seconds": tick / tick_rate, "waves": waves}
+
+def summarize(values):
+    """
+    Summarize a list of numbers.
+
+    Args:
+        values (list): The numbers.
+
+    Returns:
+        dict: mean, p50 and p90.
+    """
+    ordered = sorted(values)
+    return {"mean": sum(ordered) / len(ordered), "p50": percentile(ordered, 0.5), "p90": percentile(ordered, 0.9)}
+
+def aggregate(results):
+    """
+    Combine the waves of many simulations into difficulty statistics per wave.
+
+    Args:
+        results (list): The results of simulate.
+
+    Returns:
+        dict: The outcome counts and, for every wave, how many runs reached it, cleared it and died in it,
+              with the seconds it lasted, the damage taken and the kills summarized over the runs.
+    """
+    outcomes = {}
+    per_wave = {}
+    for result in results:
+        outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+        for wave in result["waves"]:
+            per_wave.setdefault(wave["wave"], []).append(wave)
+
+    waves = {}
+    for wave_number, records in sorted(per_wave.items()):
+        cleared = sum(1 for record in records if record["outcome"] == "cleared")
+        waves[wave_number] = {
+            "reached": len(records),
+            "cleared": cleared,
+            "defeats": sum(1 for record in records if record["outcome"] == "defeat"),
+            "clear_rate": cleared / len(records),
+            "seconds": summarize([record["seconds"] for record in records]),
+            "damage_taken": summarize([record["damage_taken"] for record in records]),
+            "kills": summarize([record["kills"] for record in records]),
+        }
+    return {"runs": len(results), "outcomes": outcomes, "waves": waves}
+
+def main(argv=None):
+    """
+    Run a batch of simulations from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Play many headless games with a scripted player and report how hard every wave is.")
+    parser.add_argument("--runs", type=int, default=1000, help="Number of simulated games.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes, 1 runs everything in this process.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first run, run i uses seed + i.")
+    parser.add_argument("--max-minutes", type=float, default=10, help="Game time after which a run is stopped.")
+    parser.add_argument("--wave-table", default=WAVE_TABLE_PATH, help="The wave table to play, e.g. an edited copy of Waves.json.")
+    parser.add_argument("--tick-rate", type=int, default=BASE_TICK_RATE)
+    parser.add_argument("--output", default="balance_results.json", help="Where to write the JSON results.")
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed, args.seed + args.runs)
+    run = partial(simulate, max_seconds=args.max_minutes * 60, wave_table_path=args.wave_table, tick_rate=args.tick_rate)
+    start = time.perf_counter()
+    if args.workers == 1:
+        init_worker()
+        results = list(map(run, seeds))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as executor:
+            # Send the seeds in chunks so the workers are not waiting on the parent between short runs
+            results = list(executor.map(run, seeds, chunksize=max(1, args.runs // (args.workers * 8))))
+    elapsed = time.perf_counter() - start
+
+    summary = aggregate(results)
+    summary["wave_table"] = args.wave_table
+    summary["max_minutes"] = args.max_minutes
+    summary["seed"] = args.seed
+
+    print(f"{args.runs} runs on {args.workers} worker(s) in {elapsed:.1f} s, outcomes: {summary['outcomes']}")
+    print(f"{'wave':>4} {'reached':>7} {'cleared':>8} {'defeats':>7} {'seconds p50/p90':>16} {'damage mean/p90':>16} {'kills mean':>10}")
+    for wave_number, stats in summary["waves"].items():
+        seconds = stats["seconds"]
+        damage = stats["damage_taken"]
+        print(f"{wave_number:>4} {stats['reached']:>7} {stats['clear_rate']:>8.0%} {stats['defeats']:>7} "
+              f"{seconds['p50']:>7.1f}/{seconds['p90']:<8.1f} {damage['mean']:>7.0f}/{damage['p90']:<8.0f} {stats['kills']['mean']:>10.1f}")
+
+    with open(args.output, "w") as output_file:
+        json.dump({"summary": summary, "runs": results}, output_file, indent=1)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
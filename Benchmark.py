@@ -0,0 +1,238 @@
+import os
+import sys
+import math
+import json
+import time
+import random
+import argparse
+import platform
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Benchmarks run headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from Game import Game, FrameInput, WIDTH, HEIGHT
+from Waves import WaveTable
+from ProjectilePool import projectile_pool
+from EffectPool import effect_pool
+
+PHASES = ["movement", "enemy_fire", "collision", "draw"]
+SCENARIOS = ["melee", "projectile", "fluid", "mixed"]
+UNKILLABLE = 10 ** 9 # Health given to the player and enemies so entity counts stay constant during a run
+KIND_TYPES = {"melee": "civil_protection", "projectile": "regular_soldier", "fluid": "worker"} # Wave table enemy type of every kind
+
+def create_enemy(kind, x, y, player, waves):
+    """
+    Create an unkillable enemy of the given kind with the stats of its Stage One / Stage Two counterpart.
+
+    Args:
+        kind (str): "melee", "projectile" or "fluid".
+        x (int): The x-coordinate of the enemy.
+        y (int): The y-coordinate of the enemy.
+        player (Player): The player targeted by the enemy.
+        waves (WaveTable): The wave table the enemy types come from.
+
+    Returns:
+        Enemy, ProjectileEnemy or FluidEnemy: The new enemy.
+    """
+    return waves.template(KIND_TYPES[kind]).spawn(x, y, player, UNKILLABLE)
+
+def build_scenario(scenario, count, screen, rng, use_enemy_store=False):
+    """
+    Build a game populated with a fixed set of enemies.
+
+    Args:
+        scenario (str): One of SCENARIOS. "mixed" spawns count enemies of every kind.
+        count (int): The number of enemies of each kind.
+        screen (pygame.Surface): The screen the game draws on.
+        rng (random.Random): The random generator used for spawn positions.
+        use_enemy_store (bool): Whether the game advances enemies through an EnemyStore.
+
+    Returns:
+        Game: The game, ready to be stepped.
+    """
+    game = Game(screen, use_enemy_store=use_enemy_store)
+    game.wave_number = 1 # Skip the start of the game so no wave gets spawned
+    game.player.set_health(UNKILLABLE)
+
+    kinds = ["melee", "projectile", "fluid"] if scenario == "mixed" else [scenario]
+    lists = {"melee": game.enemies, "projectile": game.projectile_enemies, "fluid": game.fluid_enemies}
+    for kind in kinds:
+        for _ in range(count):
+            lists[kind].append(create_enemy(kind, rng.randrange(WIDTH), rng.randrange(HEIGHT), game.player, game.waves))
+    return game
+
+def percentile(sorted_values, fraction):
+    """
+    Get a percentile from a sorted list using the nearest-rank method.
+
+    Args:
+        sorted_values (list): The sorted samples.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The sample at that percentile.
+    """
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(samples):
+    """
+    Summarize frame time samples.
+
+    Args:
+        samples (list): Times in seconds.
+
+    Returns:
+        dict: p50, p95, p99 and mean in milliseconds.
+    """
+    ordered = sorted(samples)
+    summary = {name: percentile(ordered, fraction) * 1000 for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+    summary["mean"] = sum(ordered) / len(ordered) * 1000
+    return summary
+
+def run_scenario(scenario, count, projectile_count, frames, warmup, seed, screen, use_enemy_store=False, flow_field_crowd=None):
+    """
+    Run one scenario and time every phase of every frame.
+
+    Args:
+        scenario (str): One of SCENARIOS.
+        count (int): The number of enemies of each kind.
+        projectile_count (int): The number of live player projectiles kept on screen.
+        frames (int): The number of measured frames.
+        warmup (int): The number of frames run before measuring.
+        seed (int): The random seed.
+        screen (pygame.Surface): The screen the game draws on.
+        use_enemy_store (bool): Whether the game advances enemies through an EnemyStore.
+        flow_field_crowd (int): The number of enemies from which they follow the flow field, the wave table's if None.
+
+    Returns:
+        dict: The result entry for the scenario.
+    """
+    rng = random.Random(seed)
+    game = build_scenario(scenario, count, screen, rng, use_enemy_store)
+    if flow_field_crowd is not None:
+        game.flow_field_crowd = flow_field_crowd
+    player = game.player
+    timings = {phase: [] for phase in PHASES + ["frame"]}
+    clock = time.perf_counter
+    no_input = FrameInput(cursor_position=(WIDTH // 2, 0))
+
+    for frame in range(warmup + frames):
+        while len(player.projectiles) < projectile_count: # Keep the player spamming shots in random directions
+            player.shoot((rng.randrange(WIDTH), rng.randrange(HEIGHT)))
+
+        start = clock()
+        effect_pool.update(game.dt) # The phases of Game.step, each timed on its own
+        game.apply_input(no_input)
+        game.update_movement()
+        after_movement = clock()
+        game.update_enemy_fire()
+        after_fire = clock()
+        game.update_collisions()
+        game.update_waves()
+        after_collision = clock()
+        game.draw(screen)
+        end = clock()
+
+        if frame >= warmup:
+            timings["movement"].append(after_movement - start)
+            timings["enemy_fire"].append(after_fire - after_movement)
+            timings["collision"].append(after_collision - after_fire)
+            timings["draw"].append(end - after_collision)
+            timings["frame"].append(end - start)
+
+    pool_counts = projectile_pool.counts()
+    game.end()
+
+    return {
+        "scenario": scenario,
+        "enemies": count,
+        "projectiles": projectile_count,
+        "pool": pool_counts,
+        "enemy_bullets": game.enemy_bullets.count,
+        "phases": {phase: summarize(samples) for phase, samples in timings.items()},
+    }
+
+def compare(results, baseline_path):
+    """
+    Print the p50 frame time ratio of every scenario against a previous results file.
+
+    Args:
+        results (dict): The results of this run.
+        baseline_path (str): Path of the results file to compare against.
+    """
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    previous = {(entry["scenario"], entry["enemies"], entry["projectiles"]): entry for entry in baseline["results"]}
+
+    print(f"\nComparison against {baseline_path} (p50 frame ms, new / old):")
+    for entry in results["results"]:
+        old = previous.get((entry["scenario"], entry["enemies"], entry["projectiles"]))
+        if old is None:
+            continue
+        new_p50 = entry["phases"]["frame"]["p50"]
+        old_p50 = old["phases"]["frame"]["p50"]
+        ratio = new_p50 / old_p50 if old_p50 else float("inf")
+        print(f"{entry['scenario']:>10} x{entry['enemies']:<5} {new_p50:8.3f} / {old_p50:8.3f}  ({ratio:.2f}x)")
+
+def main(argv=None):
+    """
+    Run the benchmark suite from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Headless frame loop benchmark.")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--counts", nargs="+", type=int, default=[10, 25, 50, 100, 200], help="Enemy counts (per kind) to measure.")
+    parser.add_argument("--projectiles", type=int, default=100, help="Live player projectiles kept on screen.")
+    parser.add_argument("--frames", type=int, default=300, help="Measured frames per run.")
+    parser.add_argument("--warmup", type=int, default=30, help="Frames run before measuring.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--label", default="", help="Free-form label stored in the results, e.g. a commit hash.")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="A previous results file to compare against.")
+    parser.add_argument("--enemy-store", action="store_true", help="Advance enemies with the NumPy EnemyStore.")
+    parser.add_argument("--flow-field-crowd", type=int,
+                        help="Enemy count from which enemies follow the flow field (0 for always, a large number for never), "
+                             "the wave table's flow_field_crowd if not given.")
+    args = parser.parse_args(argv)
+    if args.flow_field_crowd is None:
+        args.flow_field_crowd = WaveTable().flow_field_crowd
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = {
+        "label": args.label,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": args.frames,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "enemy_store": args.enemy_store,
+        "flow_field_crowd": args.flow_field_crowd,
+        "results": [],
+    }
+
+    print(f"{'scenario':>10} {'enemies':>7} " + " ".join(f"{phase + ' p50/p99':>22}" for phase in PHASES + ["frame"]))
+    for scenario in args.scenarios:
+        for count in args.counts:
+            entry = run_scenario(scenario, count, args.projectiles, args.frames, args.warmup, args.seed, screen, args.enemy_store, args.flow_field_crowd)
+            results["results"].append(entry)
+            print(f"{scenario:>10} {count:>7} " + " ".join(f"{entry['phases'][phase]['p50']:10.3f}/{entry['phases'][phase]['p99']:<11.3f}" for phase in PHASES + ["frame"]))
+
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,167 @@
+import numpy as np
+
+class BulletEngine:
+    """
+    Class simulating every enemy bullet in the game in flat NumPy arrays,
+    so bullets are moved, culled and tested against the player in bulk.
+    Bullets belong to the engine, not to the enemy that fired them, so they outlive their shooter.
+    """
+    def __init__(self, capacity=256, margin=50):
+        """
+        Initializes a new instance of the BulletEngine class.
+
+        Args:
+            capacity (int): The number of bullets the arrays hold before they have to grow.
+            margin (int): How far outside the playfield a bullet may fly before it is culled.
+        """
+        self.margin = margin
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.previous_x = np.zeros(capacity) # Positions at the previous tick, used to interpolate drawing
+        self.previous_y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.damage = np.zeros(capacity, dtype=np.int64)
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+
+        # Sprite ids index these, the sizes are used for the hit boxes
+        self.sprite_ids = {}
+        self.sprite_images = []
+        self.sprite_widths = np.zeros(0)
+        self.sprite_heights = np.zeros(0)
+
+    def sprite_id(self, image):
+        """
+        Get the id of a bullet image, registering it on first use.
+
+        Args:
+            image (pygame.Surface): The bullet image.
+
+        Returns:
+            int: The sprite id.
+        """
+        sprite = self.sprite_ids.get(image)
+        if sprite is None:
+            sprite = len(self.sprite_images)
+            self.sprite_ids[image] = sprite
+            self.sprite_images.append(image)
+            self.sprite_widths = np.append(self.sprite_widths, image.get_width())
+            self.sprite_heights = np.append(self.sprite_heights, image.get_height())
+        return sprite
+
+    def spawn(self, x, y, velocity_x, velocity_y, damage, image):
+        """
+        Add a bullet.
+
+        Args:
+            x (float): The x-coordinate of the bullet center.
+            y (float): The y-coordinate of the bullet center.
+            velocity_x (float): The horizontal velocity.
+            velocity_y (float): The vertical velocity.
+            damage (int): The damage dealt to the player on hit.
+            image (pygame.Surface): The bullet image.
+        """
+        if self.count == len(self.x): # Double the arrays when they are full
+            for name in ("x", "y", "previous_x", "previous_y", "velocity_x", "velocity_y", "damage", "sprite"):
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+
+        index = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.previous_x[index] = x
+        self.previous_y[index] = y
+        self.velocity_x[index] = velocity_x
+        self.velocity_y[index] = velocity_y
+        self.damage[index] = damage
+        self.sprite[index] = self.sprite_id(image)
+        self.count += 1
+
+    def keep(self, mask):
+        """
+        Remove every bullet not selected by a mask, keeping the live bullets packed at the front of the arrays.
+
+        Args:
+            mask (numpy.ndarray): Boolean mask over the live bullets, True for bullets to keep.
+        """
+        kept = int(np.count_nonzero(mask))
+        if kept == self.count:
+            return
+        for array in (self.x, self.y, self.previous_x, self.previous_y, self.velocity_x, self.velocity_y, self.damage, self.sprite):
+            array[:kept] = array[:self.count][mask]
+        self.count = kept
+
+    def update(self, playfield, dt=1):
+        """
+        Move every bullet and cull the ones that left the playfield (plus the margin).
+
+        Args:
+            playfield (pygame.Rect): The visible area of the game.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        count = self.count
+        if count == 0:
+            return
+        x = self.x[:count]
+        y = self.y[:count]
+        self.previous_x[:count] = x
+        self.previous_y[:count] = y
+        x += self.velocity_x[:count] * dt
+        y += self.velocity_y[:count] * dt
+
+        margin = self.margin
+        self.keep((x > playfield.left - margin) & (x < playfield.right + margin) & (y > playfield.top - margin) & (y < playfield.bottom + margin))
+
+    def collide(self, rect):
+        """
+        Remove the bullets hitting a rectangle.
+
+        Args:
+            rect (pygame.Rect): The rectangle to test, e.g. the player's.
+
+        Returns:
+            list: The damage of every bullet that hit.
+        """
+        count = self.count
+        if count == 0:
+            return []
+        sprite = self.sprite[:count]
+        hit = ((np.abs(self.x[:count] - rect.centerx) * 2 < self.sprite_widths[sprite] + rect.width) &
+               (np.abs(self.y[:count] - rect.centery) * 2 < self.sprite_heights[sprite] + rect.height))
+        if not hit.any():
+            return []
+
+        damages = self.damage[:count][hit].tolist()
+        self.keep(~hit)
+        return damages
+
+    def draw(self, screen, alpha=1):
+        """
+        Draw every bullet with a single blits call.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+            alpha (float): How far between the previous and the current tick to draw the bullets.
+        """
+        count = self.count
+        if count == 0:
+            return
+        sprite = self.sprite[:count]
+        x = self.x[:count]
+        y = self.y[:count]
+        if alpha < 1:
+            previous_x = self.previous_x[:count]
+            previous_y = self.previous_y[:count]
+            x = previous_x + (x - previous_x) * alpha
+            y = previous_y + (y - previous_y) * alpha
+        left = (x - self.sprite_widths[sprite] / 2).tolist()
+        top = (y - self.sprite_heights[sprite] / 2).tolist()
+        images = self.sprite_images
+        screen.blits([(images[sprite_id], (left[index], top[index])) for index, sprite_id in enumerate(sprite.tolist())], doreturn=False)
+
+    def clear(self):
+        """
+        Remove every bullet.
+        """
+        self.count = 0
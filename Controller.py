@@ -0,0 +1,222 @@
+import abc
+import math
+import random
+import pygame
+from Game import FrameInput
+
+# Movement keys held for each direction the scripted player can walk in, the empty tuple stands still
+DIRECTIONS = [(), (pygame.K_w,), (pygame.K_s,), (pygame.K_a,), (pygame.K_d,),
+              (pygame.K_w, pygame.K_a), (pygame.K_w, pygame.K_d), (pygame.K_s, pygame.K_a), (pygame.K_s, pygame.K_d)]
+DIAGONAL_THRESHOLD = math.sin(math.radians(22.5)) # A direction this far off an axis also presses the other axis' key
+
+class Controller(abc.ABC):
+    """
+    Class representing something that plays the game instead of a person. Every simulation tick it is asked
+    for the input of the tick, which Game.step applies to the player exactly like real key presses and clicks,
+    so a controlled game can also be recorded, replayed and run headless at full speed.
+
+    Subclasses implement next_input, the helpers here press and release movement keys and find the nearest enemy.
+    Like the game's own timers, their intervals are in 60 Hz frames and advance by game.dt every tick,
+    so they play the same at every tick rate.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the Controller class.
+        """
+        self.keys = () # Movement keys held down
+
+    @abc.abstractmethod
+    def next_input(self, game):
+        """
+        Decide the input of the next tick.
+
+        Args:
+            game (Game): The game being played.
+
+        Returns:
+            FrameInput: The input for the tick.
+        """
+
+    def hold(self, keys, events):
+        """
+        Press the given movement keys and release every other held one.
+
+        Args:
+            keys (tuple): The movement keys to hold.
+            events (list): The events of the tick, the key events are appended to it.
+        """
+        events.extend(pygame.event.Event(pygame.KEYUP, key=key) for key in self.keys if key not in keys)
+        events.extend(pygame.event.Event(pygame.KEYDOWN, key=key) for key in keys if key not in self.keys)
+        self.keys = keys
+
+    def nearest_enemy(self, game):
+        """
+        Find the enemy closest to the player.
+
+        Args:
+            game (Game): The game being played.
+
+        Returns:
+            tuple: The center of the nearest enemy, or None if there are no enemies.
+        """
+        player_x, player_y = game.player.rect.center
+        nearest = None
+        nearest_distance = None
+        for enemy in game.enemies + game.projectile_enemies + game.fluid_enemies:
+            center_x, center_y = enemy.rect.center
+            distance = (center_x - player_x) ** 2 + (center_y - player_y) ** 2
+            if nearest is None or distance < nearest_distance:
+                nearest = (center_x, center_y)
+                nearest_distance = distance
+        return nearest
+
+class ScriptedPlayer(Controller):
+    """
+    Class playing the game with a fixed strategy driven by a seeded random generator, so every run can be repeated:
+    it walks in a random direction that changes every few seconds and clicks at the nearest enemy a few times
+    per second, missing by a random amount.
+    """
+    def __init__(self, seed, fire_interval=10, aim_error=24, turn_interval=90):
+        """
+        Initializes a new instance of the ScriptedPlayer class.
+
+        Args:
+            seed (int): The random seed.
+            fire_interval (float): 60 Hz frames between two shots.
+            aim_error (float): Standard deviation of the aiming error in pixels.
+            turn_interval (float): 60 Hz frames between two changes of direction.
+        """
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.fire_interval = fire_interval
+        self.aim_error = aim_error
+        self.turn_interval = turn_interval
+        self.fire_timer = fire_interval # Frames left until the next shot
+        self.turn_timer = 0 # Frames left until the next change of direction, it picks one on the first tick
+
+    def next_input(self, game):
+        """
+        Decide the input of the next tick.
+
+        Args:
+            game (Game): The game being played.
+
+        Returns:
+            FrameInput: The input for the tick.
+        """
+        rng = self.rng
+        events = []
+
+        if self.turn_timer <= 0:
+            self.hold(rng.choice(DIRECTIONS), events)
+            self.turn_timer += self.turn_interval
+        self.turn_timer -= game.dt
+
+        self.fire_timer -= game.dt
+        fire = self.fire_timer <= 0
+        if fire: # A shot due while there is no enemy is skipped
+            self.fire_timer += self.fire_interval
+
+        target = self.nearest_enemy(game)
+        if target is None:
+            return FrameInput(events, game.cursor_position)
+        if fire:
+            aim = (round(target[0] + rng.gauss(0, self.aim_error)), round(target[1] + rng.gauss(0, self.aim_error)))
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=aim))
+        return FrameInput(events, target)
+
+class KitingBot(Controller):
+    """
+    Class playing the game by kiting: it walks away from the nearest enemy once it gets close, circling around it
+    so the walls do not trap the player, and keeps shooting at the nearest enemy.
+    """
+    def __init__(self, fire_interval=6, danger_radius=250, wall_margin=80, circling=0.6):
+        """
+        Initializes a new instance of the KitingBot class.
+
+        Args:
+            fire_interval (float): 60 Hz frames between two shots.
+            danger_radius (float): The distance from the nearest enemy below which the bot walks away.
+            wall_margin (float): The distance from a wall below which the bot is pushed back into the arena.
+            circling (float): How much the bot walks around the nearest enemy instead of straight away from it.
+        """
+        super().__init__()
+        self.fire_interval = fire_interval
+        self.danger_radius = danger_radius
+        self.wall_margin = wall_margin
+        self.circling = circling
+        self.fire_timer = fire_interval # Frames left until the next shot
+
+    def next_input(self, game):
+        """
+        Decide the input of the next tick.
+
+        Args:
+            game (Game): The game being played.
+
+        Returns:
+            FrameInput: The input for the tick.
+        """
+        events = []
+        self.fire_timer -= game.dt
+        fire = self.fire_timer <= 0
+        if fire: # A shot due between waves is skipped
+            self.fire_timer += self.fire_interval
+
+        target = self.nearest_enemy(game)
+        if target is None: # Nothing to run from between waves
+            self.hold((), events)
+            return FrameInput(events, game.cursor_position)
+
+        player_x, player_y = game.player.rect.center
+        away_x = player_x - target[0]
+        away_y = player_y - target[1]
+        distance = math.hypot(away_x, away_y)
+        move_x = move_y = 0.0
+        if 0 < distance < self.danger_radius:
+            away_x /= distance
+            away_y /= distance
+            move_x = away_x - away_y * self.circling # The perpendicular part circles around the enemy
+            move_y = away_y + away_x * self.circling
+
+        boundary = game.boundary
+        margin = self.wall_margin
+        if player_x - boundary.left < margin:
+            move_x += 1
+        elif boundary.right - player_x < margin:
+            move_x -= 1
+        if player_y - boundary.top < margin:
+            move_y += 1
+        elif boundary.bottom - player_y < margin:
+            move_y -= 1
+
+        self.hold(self.direction_keys(move_x, move_y), events)
+        if fire:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=target))
+        return FrameInput(events, target)
+
+    def direction_keys(self, move_x, move_y):
+        """
+        Get the movement keys that walk closest to a direction.
+
+        Args:
+            move_x (float): The horizontal part of the direction.
+            move_y (float): The vertical part of the direction.
+
+        Returns:
+            tuple: The keys to hold, empty to stand still.
+        """
+        length = math.hypot(move_x, move_y)
+        if length == 0:
+            return ()
+        threshold = DIAGONAL_THRESHOLD * length
+        keys = []
+        if move_y < -threshold:
+            keys.append(pygame.K_w)
+        elif move_y > threshold:
+            keys.append(pygame.K_s)
+        if move_x < -threshold:
+            keys.append(pygame.K_a)
+        elif move_x > threshold:
+            keys.append(pygame.K_d)
+        return tuple(keys)
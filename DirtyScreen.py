@@ -0,0 +1,129 @@
+import pygame
+
+class DirtyScreen:
+    """
+    Class wrapping the display surface to track the rectangles drawn on every frame,
+    so only the changed regions are restored from the background and pushed to the display.
+
+    It is used in place of the display surface: blit, blits and fill are recorded, everything else is passed through.
+    """
+    def __init__(self, surface):
+        """
+        Initializes a new instance of the DirtyScreen class.
+
+        Args:
+            surface (pygame.Surface): The display surface.
+        """
+        self.surface = surface
+        self.background = None
+        self.dirty = [] # Rectangles drawn this frame
+        self.previous = [] # Rectangles drawn last frame, they have to be cleaned this frame
+        self.full_refresh = True
+
+    def __getattr__(self, name):
+        """
+        Pass every other Surface method, e.g. get_width or get_rect, on to the display surface.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            object: The attribute of the display surface.
+        """
+        return getattr(self.surface, name)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Draw an image on the display surface and record the area it covered.
+
+        Args:
+            source (pygame.Surface): The image to draw.
+            dest (tuple or pygame.Rect): The top left to draw it at.
+            area (pygame.Rect): The part of the image to draw, all of it if None.
+            special_flags (int): Blend flags.
+
+        Returns:
+            pygame.Rect: The area that was drawn.
+        """
+        rect = self.surface.blit(source, dest, area, special_flags)
+        self.dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        """
+        Draw a sequence of images on the display surface and record the areas they covered.
+
+        Args:
+            blit_sequence (iterable): (source, dest) tuples, optionally followed by area and special_flags.
+            doreturn (bool): Whether to return the drawn areas.
+
+        Returns:
+            list: The drawn areas, or None if doreturn is False.
+        """
+        rects = self.surface.blits(blit_sequence)
+        self.dirty.extend(rects)
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        """
+        Fill the display surface, or part of it, and record the filled area.
+
+        Args:
+            color (tuple): The fill colour.
+            rect (pygame.Rect): The area to fill, the whole surface if None.
+            special_flags (int): Blend flags.
+
+        Returns:
+            pygame.Rect: The area that was filled.
+        """
+        filled = self.surface.fill(color, rect, special_flags)
+        self.dirty.append(filled)
+        return filled
+
+    def set_background(self, background):
+        """
+        Start a frame: clean the areas drawn last frame by restoring them from the background.
+        The whole screen is redrawn when the background changes.
+
+        Args:
+            background (pygame.Surface): The image behind every sprite, e.g. the stage map. The screen is cleared to black if None.
+        """
+        if background is not self.background:
+            self.background = background
+            self.full_refresh = True
+
+        if self.full_refresh:
+            self.restore(self.surface.get_rect())
+        else:
+            for rect in self.previous:
+                self.restore(rect)
+
+    def restore(self, rect):
+        """
+        Copy a region of the background back onto the display surface without recording it.
+
+        Args:
+            rect (pygame.Rect): The region to restore.
+        """
+        if self.background is None:
+            self.surface.fill((0, 0, 0), rect)
+        else:
+            self.surface.blit(self.background, rect, rect)
+
+    def invalidate(self):
+        """
+        Redraw and push the whole screen on the next frame, e.g. after a menu was drawn over the game.
+        """
+        self.full_refresh = True
+
+    def present(self):
+        """
+        Push the areas drawn this frame and the areas cleaned from last frame to the display.
+        """
+        if self.full_refresh:
+            pygame.display.flip()
+            self.full_refresh = False
+        else:
+            pygame.display.update(self.previous + self.dirty)
+        self.previous = self.dirty
+        self.dirty = []
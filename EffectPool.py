@@ -0,0 +1,144 @@
+import numpy as np
+
+SPLAT_IMAGE = "Images/Splat.png"
+GROUND = 0 # Layer drawn under the enemies, e.g. splats where enemies were hit and flames
+OVERLAY = 1 # Layer drawn over the player, e.g. splats where the player was hit
+
+class EffectPool:
+    """
+    Class keeping every short-lived visual effect (splats, flames) in fixed-size NumPy arrays.
+    Entities only emit an effect, the pool ages all of them in bulk every tick and draws each layer with one blits call,
+    so the capacity bounds what effects cost however many hits a frame has. Effects are not simulated,
+    so nothing in the game state depends on them.
+    """
+    def __init__(self, capacity=128):
+        """
+        Initializes a new instance of the EffectPool class.
+
+        Args:
+            capacity (int): The most effects alive at once. Once it is reached, new effects replace the oldest ones.
+        """
+        self.count = 0
+        self.left = np.zeros(capacity) # Top left of the effect image, effects do not move
+        self.top = np.zeros(capacity)
+        self.remaining = np.zeros(capacity) # Lifetime left in 60 Hz frames
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+        self.layer = np.zeros(capacity, dtype=np.int8)
+        self.last_key = None # (sprite, left, top, layer) of the last emitted effect and its index, while the index is valid
+        self.last_index = 0
+        self.evicted = 0 # Index replaced next while the pool is full, the live effects are kept oldest first
+
+        # Sprite ids index these
+        self.sprite_ids = {}
+        self.sprite_images = []
+        self.sprite_widths = []
+        self.sprite_heights = []
+
+    def sprite_id(self, image):
+        """
+        Get the id of an effect image, registering it on first use.
+
+        Args:
+            image (pygame.Surface): The effect image.
+
+        Returns:
+            int: The sprite id.
+        """
+        sprite = self.sprite_ids.get(image)
+        if sprite is None:
+            sprite = len(self.sprite_images)
+            self.sprite_ids[image] = sprite
+            self.sprite_images.append(image)
+            self.sprite_widths.append(image.get_width())
+            self.sprite_heights.append(image.get_height())
+        return sprite
+
+    def emit(self, image, center, lifetime, layer=GROUND):
+        """
+        Add an effect. The same effect emitted again at the same spot, e.g. the player's splat for every enemy
+        touching it, only restarts the lifetime of the first one.
+
+        Args:
+            image (pygame.Surface): The effect image.
+            center (tuple): Where the center of the image is drawn.
+            lifetime (float): How long the effect is shown, in 60 Hz frames.
+            layer (int): GROUND or OVERLAY.
+        """
+        sprite = self.sprite_id(image)
+        left = center[0] - self.sprite_widths[sprite] / 2
+        top = center[1] - self.sprite_heights[sprite] / 2
+        key = (sprite, left, top, layer)
+        if key == self.last_key:
+            self.remaining[self.last_index] = lifetime
+            return
+
+        if self.count == len(self.remaining): # Full, the oldest effect makes room
+            index = self.evicted
+            self.evicted = (index + 1) % self.count
+        else:
+            index = self.count
+            self.count += 1
+        self.left[index] = left
+        self.top[index] = top
+        self.remaining[index] = lifetime
+        self.sprite[index] = sprite
+        self.layer[index] = layer
+        self.last_key = key
+        self.last_index = index
+
+    def update(self, dt=1):
+        """
+        Age every effect and remove the expired ones, keeping the live effects packed at the front of the arrays.
+
+        Args:
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        count = self.count
+        if count == 0:
+            return
+        remaining = self.remaining[:count]
+        remaining -= dt
+        alive = remaining > 0
+        kept = int(np.count_nonzero(alive))
+        if kept == count:
+            return
+        evicted = self.evicted
+        if evicted == 0:
+            survivors = alive
+        else: # The pool wrapped, the oldest effects start at the eviction index: rotate them back to the front
+            survivors = np.concatenate((np.flatnonzero(alive[evicted:]) + evicted, np.flatnonzero(alive[:evicted])))
+        for array in (self.left, self.top, self.remaining, self.sprite, self.layer):
+            array[:kept] = array[:count][survivors]
+        self.count = kept
+        self.last_key = None # The effects moved
+        self.evicted = 0 # The oldest surviving effect is at the front again
+
+    def draw(self, screen, layer=GROUND):
+        """
+        Draw every effect of a layer with a single blits call.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+            layer (int): GROUND or OVERLAY.
+        """
+        count = self.count
+        if count == 0:
+            return
+        selected = np.flatnonzero(self.layer[:count] == layer)
+        if len(selected) == 0:
+            return
+        images = self.sprite_images
+        screen.blits([(images[sprite], (left, top)) for sprite, left, top
+                      in zip(self.sprite[selected].tolist(), self.left[selected].tolist(), self.top[selected].tolist())], doreturn=False)
+
+    def clear(self):
+        """
+        Remove every effect.
+        """
+        self.count = 0
+        self.last_key = None
+        self.evicted = 0
+
+
+# Shared pool every entity emits its effects into, a new game clears it
+effect_pool = EffectPool()
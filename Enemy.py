@@ -1,55 +1,66 @@
 import math
 import pygame
+from EffectPool import effect_pool
 
 class Enemy:
     """
     Class representing melee enemies in the game.
+
+    The stats and images every enemy of a type has in common live on its EnemyTemplate,
+    an enemy only keeps its own state, in slots rather than a per-instance __dict__.
     """
+    __slots__ = ("x", "y", "health", "target", "enemy_type", "attack_timer", "is_destroyed", "enemy_image", "rect", "previous_topleft")
     enemies_killed = 0
+    radius = 100000 # Distance for tracking Player
+    splat_duration = 8 # Frames the splat of a hit is shown for
 
-    def __init__(self, x, y, health, speed, target, left_image, right_image, damage, attack_cooldown):
+    def __init__(self, x, y, enemy_type, target, health=None):
         """
         Initializes a new instance of the Enemy class.
 
         Args:
             x (int): The initial x-coordinate of the enemy.
             y (int): The initial y-coordinate of the enemy.
-            health (int): The initial health of the enemy.
-            speed (float): The movement speed of the enemy.
+            enemy_type (EnemyTemplate): The type of the enemy: speed, damage, attack cooldown and images.
             target (Player): The player object targeted by the enemy.
-            left_image (pygame.Surface): The image of the enemy facing left.
-            right_image (pygame.Surface): The image of the enemy facing right.
-            damage (int): The damage dealt by the enemy.
-            attack_cooldown (int): The cooldown period between enemy attacks.
+            health (int): The initial health of the enemy, the health of its type if None.
         """
         self.x = x
         self.y = y
-        self.health = health
-        self.speed = speed
+        self.enemy_type = enemy_type
+        self.health = enemy_type.health if health is None else health
         self.target = target
-        self.radius = 100000  # Distance for tracking Player
-        self.damage = damage
-        self.attack_cooldown = attack_cooldown
         self.attack_timer = 0
-        self.hit_position = None  # Initialize hit position
         self.is_destroyed = False
-        self.splat_duration = 120
-        self.splat_timer = 0
 
-        # Load enemy images
-        self.enemy_left_image = left_image
-        self.enemy_right_image = right_image
-        self.enemy_image = self.enemy_left_image
+        self.enemy_image = enemy_type.left_image
         self.rect = self.enemy_image.get_rect(topleft=(x, y))
+        self.previous_topleft = self.rect.topleft # Position at the previous simulation tick, used to interpolate drawing
+
+    @property
+    def speed(self):
+        """float: The movement speed of the enemy."""
+        return self.enemy_type.speed
+
+    @property
+    def damage(self):
+        """int: The damage dealt by the enemy."""
+        return self.enemy_type.damage
+
+    @property
+    def attack_cooldown(self):
+        """int: The cooldown period between enemy attacks."""
+        return self.enemy_type.attack_cooldown
 
-    def move_towards(self, target_x, target_y, other_enemies):
+    def move_towards(self, target_x, target_y, enemy_grid, dt=1):
         """
         Move the enemy towards the specified coordinates while avoiding collisions with other enemies.
 
         Args:
             target_x (int): X-coordinate of the target position.
             target_y (int): Y-coordinate of the target position.
-            other_enemies (list): List of other Enemy objects in the game.
+            enemy_grid (SpatialGrid): Grid holding every enemy in the game.
+            dt (float): The length of the simulation tick in 60 Hz frames.
         """
         delta_x = target_x - self.x
         delta_y = target_y - self.y
@@ -60,21 +71,55 @@ class Enemy:
             direction_x = delta_x / distance 
             direction_y = delta_y / distance
 
-            new_x = self.x + direction_x * self.speed
-            new_y = self.y + direction_y * self.speed
+            speed = self.enemy_type.speed
+            new_x = self.x + direction_x * speed * dt
+            new_y = self.y + direction_y * speed * dt
+            self.place(new_x, new_y, direction_x, enemy_grid)
+
+    def follow(self, flow_field, target_x, target_y, enemy_grid, dt=1):
+        """
+        Move the enemy one step in the direction of its cell of a flow field.
+        Next to the target, where the cells are too coarse to aim with, it steers straight at the target instead.
+
+        Args:
+            flow_field (FlowField): Field leading to the target.
+            target_x (int): X-coordinate of the target position.
+            target_y (int): Y-coordinate of the target position.
+            enemy_grid (SpatialGrid): Grid holding every enemy in the game.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        direction = flow_field.direction(self.x, self.y)
+        if direction is None:
+            self.move_towards(target_x, target_y, enemy_grid, dt)
+            return
+        direction_x, direction_y = direction
+        speed = self.enemy_type.speed
+        self.place(self.x + direction_x * speed * dt, self.y + direction_y * speed * dt, direction_x, enemy_grid)
+
+    def place(self, new_x, new_y, direction_x, enemy_grid):
+        """
+        Move the enemy to new coordinates, pushed out of any enemy it would overlap, and face the direction of movement.
 
-            for enemy in other_enemies:
-                if enemy != self and pygame.Rect(new_x, new_y, self.rect.width, self.rect.height).colliderect(enemy.rect):
-                    new_x, new_y = self.avoid_overlap(new_x, new_y, enemy.rect)
+        Args:
+            new_x (float): The new x-coordinate.
+            new_y (float): The new y-coordinate.
+            direction_x (float): The horizontal direction of movement.
+            enemy_grid (SpatialGrid): Grid holding every enemy in the game.
+        """
+        moved_rect = pygame.Rect(new_x, new_y, self.rect.width, self.rect.height)
+        for enemy in enemy_grid.query(moved_rect): # Only enemies in neighbouring cells can overlap
+            if enemy is not self and moved_rect.colliderect(enemy.rect):
+                new_x, new_y = self.avoid_overlap(new_x, new_y, enemy.rect)
+                moved_rect.topleft = (new_x, new_y)
 
-            self.x = new_x
-            self.y = new_y
-            self.rect.topleft = (self.x, self.y)
+        self.x = new_x
+        self.y = new_y
+        self.rect.topleft = (self.x, self.y)
 
-            if direction_x > 0: # If moving right, change image to right_image
-                self.enemy_image = self.enemy_right_image
-            elif direction_x < 0: # If moving left, change image to left_image
-                self.enemy_image = self.enemy_left_image
+        if direction_x > 0: # If moving right, change image to right_image
+            self.enemy_image = self.enemy_type.right_image
+        elif direction_x < 0: # If moving left, change image to left_image
+            self.enemy_image = self.enemy_type.left_image
 
     def avoid_overlap(self, new_x, new_y, other_rect):
         """
@@ -99,20 +144,27 @@ class Enemy:
 
         return new_x, new_y
 
-    def draw(self, screen):
+    def draw(self, screen, position=None):
         """
         Draw the enemy on the specified screen.
 
         Args:
             screen (pygame.Surface): The screen to draw the enemy on.
+            position (tuple): Where to draw the top left of the enemy, the current position if None.
         """
-        if self.hit_position is not None:
-            splat_image = pygame.image.load("Images/Splat.png")
-            splat_rect = splat_image.get_rect(center=self.hit_position)
-            screen.blit(splat_image, splat_rect)
-            self.hit_position = None
+        sprites = []
+        self.collect_blits(sprites, position)
+        screen.blits(sprites, doreturn=False)
 
-        screen.blit(self.enemy_image, self.rect)
+    def collect_blits(self, sprites, position=None):
+        """
+        Add the sprite of the enemy to the blit sequence of the render pass. Its hit effects are drawn by the effect pool.
+
+        Args:
+            sprites (list): (image, position) pairs of the enemy sprites.
+            position (tuple): Where to draw the top left of the enemy, the current position if None.
+        """
+        sprites.append((self.enemy_image, self.rect if position is None else position))
 
     def is_enemy_destroyed(self):
         """
@@ -123,81 +175,76 @@ class Enemy:
         """
         return self.is_destroyed
 
-    def receive_damage(self, damage, hit_position, screen):
+    def receive_damage(self, damage, hit_position):
         """
         Receive damage and update the enemy's state.
 
         Args:
             damage (int): Amount of damage received.
             hit_position (Tuple[int, int]): Position where the enemy was hit.
-            screen (pygame.Surface): The screen to display the hit effect.
         """
         self.health -= damage
-        if self.health <= 0: 
-            self.hit_position = hit_position # If hit dead, get hit position and blit image and change is_destroyed to True
-            splat_image = pygame.image.load("Images/Splat.png")
-            splat_rect = splat_image.get_rect(center=self.hit_position)
-            screen.blit(splat_image, splat_rect)
-            
+        effect_pool.emit(self.enemy_type.splat_image, hit_position, self.splat_duration) # Splat where the enemy was hit
+        if self.health <= 0: # If hit dead, change is_destroyed to True
             self.is_destroyed = True 
             Enemy.enemies_killed += 1
-        else: # Otherwise, just get hit position (Splat will be blitted in another function)
-            self.hit_position = hit_position
 
-    def update(self, projectiles, player, other_enemies, screen):
+    def update_movement(self, enemy_grid, dt=1, flow_field=None):
         """
-        Update the state of the enemy in the game loop.
+        Move the enemy towards the player if it is within tracking distance.
 
         Args:
-            projectiles (list): List of projectiles in the game.
-            player (Player): The player object.
-            other_enemies (list): List of other Enemy objects in the game.
-            screen (pygame.Surface): The screen to display the enemy and effects.
+            enemy_grid (SpatialGrid): Grid holding every enemy in the game.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+            flow_field (FlowField): Field leading to the player, followed instead of steering straight at the player if given.
         """
+        # Distances are measured from the exact position, not the rounded rect, the same as the EnemyStore does
         player_coords = self.target.get_coords()
-        distance_to_player = math.sqrt((self.rect.x - player_coords[0]) ** 2 + (self.rect.y - player_coords[1]) ** 2)
+        if flow_field is not None:
+            delta_x = self.x - player_coords[0]
+            delta_y = self.y - player_coords[1]
+            if delta_x * delta_x + delta_y * delta_y <= self.radius * self.radius: # Squared distances, no square root per enemy
+                self.follow(flow_field, player_coords[0], player_coords[1], enemy_grid, dt)
+            return
 
-        if distance_to_player <= self.radius:
-            self.move_towards(player_coords[0], player_coords[1], other_enemies)
+        distance_to_player = math.sqrt((self.x - player_coords[0]) ** 2 + (self.y - player_coords[1]) ** 2)
 
-        self.attack_timer += 1 # Attack if not on cooldown
-        if self.attack_timer >= self.attack_cooldown:
-            self.attack_timer = 0
-            self.deal_damage_to_player(player)
+        if distance_to_player <= self.radius:
+            self.move_towards(player_coords[0], player_coords[1], enemy_grid, dt)
 
-        if self.splat_timer > 0: # Splat timer countdown
-            self.splat_timer -= 1
-            if self.splat_timer == 0: # If splat timer ends, remove the effect
-                self.hit_position = None
+    def update_attack(self, player, dt=1):
+        """
+        Advance the attack cooldown, attacking the player when it runs out.
 
-        self.check_collision(projectiles, screen)
+        Args:
+            player (Player): The player object.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        self.attack_timer += dt # Attack if not on cooldown
+        if self.attack_timer >= self.enemy_type.attack_cooldown:
+            self.attack(player)
 
-    def check_collision(self, projectiles, screen):
+    def attack(self, player):
         """
-        Check for collisions with projectiles and update the enemy state.
+        Attack the player and restart the attack cooldown.
 
         Args:
-            projectiles (list): List of projectiles in the game.
-            screen (pygame.Surface): The screen to display effects.
+            player (Player): The player object.
         """
-        for projectile in projectiles: # Keep track of projectiles and if they collide with Enemy
-            if self.rect.colliderect(projectile.rect):
-                self.receive_damage(projectile.damage, projectile.rect.center, screen)
-                projectiles.remove(projectile)
-                break
+        self.attack_timer = 0
+        self.deal_damage_to_player(player)
 
-    def deal_damage_to_player(self, player):
+    def deal_damage_to_player(self, player, scale=1):
         """
-        Deal damage to the player.
+        Deal damage to the player if the enemy touches it. The player shows the splat of the hit.
 
         Args:
             player (Player): The player object.
+            scale (float): Fraction of the damage to deal, the tick length for damage dealt on every tick of contact.
         """
         player_rect = player.rect
         if self.rect.colliderect(player_rect):
-            player.handle_damage(self.damage)
-            self.hit_position = player_rect.center
-            self.splat_timer = self.splat_duration # Begin splat timer countdown for blitting the splat image.
+            player.handle_damage(self.enemy_type.damage * scale)
 
     def get_orientation(self):
         """
@@ -0,0 +1,123 @@
+import numpy as np
+from ProjectileEnemy import STOP_DISTANCE
+
+class EnemyStore:
+    """
+    Class keeping the chase and attack state of every enemy in contiguous NumPy arrays,
+    so movement, distance checks and cooldowns are advanced for all enemies at once.
+
+    Enemy objects stay the interface the rest of the game uses: after every update the store
+    writes positions, facing and attack timers back to them. Health stays on the objects because
+    hits are applied one projectile at a time.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the EnemyStore class.
+        """
+        self.load([], [], [])
+
+    def load(self, enemies, projectile_enemies, fluid_enemies):
+        """
+        Copy the state of the enemies into the arrays. Call it whenever enemies are added or removed.
+
+        The enemies are kept in the order Game moves them without a store, because overlap avoidance pushes
+        each enemy out of the ones placed before it, so the order changes where they end up.
+
+        Args:
+            enemies (list): Enemy objects.
+            projectile_enemies (list): ProjectileEnemy objects.
+            fluid_enemies (list): FluidEnemy objects.
+        """
+        entities = list(enemies) + list(projectile_enemies) + list(fluid_enemies)
+        self.entities = entities
+        self.ranged = np.zeros(len(entities), dtype=bool) # True for the ProjectileEnemies
+        self.ranged[len(enemies):len(enemies) + len(projectile_enemies)] = True
+        self.ranged_list = self.ranged.tolist()
+
+        self.x = np.array([enemy.x for enemy in entities], dtype=np.float64)
+        self.y = np.array([enemy.y for enemy in entities], dtype=np.float64)
+        self.speed = np.array([enemy.speed for enemy in entities], dtype=np.float64)
+        self.radius = np.array([enemy.radius for enemy in entities], dtype=np.float64)
+        self.attack_timer = np.array([enemy.attack_timer for enemy in entities], dtype=np.float64)
+        self.attack_cooldown = np.array([enemy.attack_cooldown for enemy in entities], dtype=np.float64)
+        self.velocity_x = np.zeros(len(entities))
+        self.velocity_y = np.zeros(len(entities))
+        self.in_range = np.zeros(len(entities), dtype=bool)
+
+        # ProjectileEnemies stop once they are close enough to shoot, melee enemies keep walking
+        self.stop_distance = np.where(self.ranged, STOP_DISTANCE, 0.0)
+
+    def move(self, target_x, target_y, enemy_grid, dt=1, flow_field=None):
+        """
+        Move every enemy in range towards the target and write the new positions back to the enemy objects.
+
+        Args:
+            target_x (int): X-coordinate of the target (the player).
+            target_y (int): Y-coordinate of the target.
+            enemy_grid (SpatialGrid): Grid holding every enemy, used to push melee enemies out of each other.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+            flow_field (FlowField): Field leading to the target, followed instead of steering straight at it if given.
+        """
+        delta_x = target_x - self.x
+        delta_y = target_y - self.y
+        distance = np.hypot(delta_x, delta_y)
+
+        self.in_range = distance <= self.radius
+        moving = self.in_range & (distance > self.stop_distance) & (distance > 0)
+        step = np.divide(self.speed * dt, distance, out=np.zeros_like(distance), where=moving)
+        self.velocity_x = delta_x * step
+        self.velocity_y = delta_y * step
+        if flow_field is not None:
+            field_x, field_y, steer = flow_field.sample(self.x, self.y)
+            follow = moving & steer # Enemies next to the target keep steering straight at it
+            self.velocity_x[follow] = field_x[follow] * self.speed[follow] * dt
+            self.velocity_y[follow] = field_y[follow] * self.speed[follow] * dt
+        self.x += self.velocity_x
+        self.y += self.velocity_y
+
+        moved = np.flatnonzero(moving).tolist()
+        new_x = self.x.tolist()
+        new_y = self.y.tolist()
+        velocity_x = self.velocity_x.tolist()
+        entities = self.entities
+        ranged = self.ranged_list
+
+        for index in moved:
+            enemy = entities[index]
+            if ranged[index]:
+                enemy.place(new_x[index], new_y[index], velocity_x[index])
+            else:
+                enemy.place(new_x[index], new_y[index], velocity_x[index], enemy_grid)
+                # Overlap avoidance may have pushed the enemy, keep the arrays in step with it
+                self.x[index] = enemy.x
+                self.y[index] = enemy.y
+
+    def tick_attacks(self, dt=1):
+        """
+        Advance every attack cooldown and write the timers back to the enemy objects.
+
+        Args:
+            dt (float): The length of the simulation tick in 60 Hz frames.
+
+        Returns:
+            list: The enemies that attack or fire this frame, in the order Game moves them.
+        """
+        timer = self.attack_timer
+        cooldown = self.attack_cooldown
+        ranged = self.ranged
+        melee = ~ranged
+
+        # Melee enemies count up and attack when the cooldown is reached
+        timer[melee] += dt
+        attacking = melee & (timer >= cooldown)
+
+        # ProjectileEnemies fire when the cooldown is reached and the player is in range, then count up
+        attacking |= ranged & self.in_range & (timer >= cooldown)
+        timer[attacking] = 0
+        timer[ranged] += dt
+
+        entities = self.entities
+        for enemy, attack_timer in zip(entities, timer.tolist()):
+            enemy.attack_timer = attack_timer
+
+        return [entities[index] for index in np.flatnonzero(attacking).tolist()]
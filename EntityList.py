@@ -0,0 +1,41 @@
+class EntityList(list):
+    """
+    Class representing a list of entities that are marked dead during a frame and removed together at its end,
+    so a kill costs O(1) and iterating the list never skips an entity.
+    """
+    def __init__(self, entities=()):
+        """
+        Initializes a new instance of the EntityList class.
+
+        Args:
+            entities (iterable): The initial entities.
+        """
+        super().__init__(entities)
+        self.dead_count = 0
+
+    def mark_dead(self):
+        """
+        Record that one more entity of the list was destroyed. It stays in the list until compact is called.
+        """
+        self.dead_count += 1
+
+    def compact(self):
+        """
+        Remove every destroyed entity in a single pass, keeping the order of the others.
+        Nothing is done if no entity was marked dead since the last call.
+
+        Returns:
+            list: The removed entities.
+        """
+        if self.dead_count == 0:
+            return []
+        alive = []
+        removed = []
+        for entity in self:
+            if entity.is_destroyed:
+                removed.append(entity)
+            else:
+                alive.append(entity)
+        self[:] = alive
+        self.dead_count = 0
+        return removed
@@ -0,0 +1,176 @@
+import math
+import heapq
+import numpy as np
+
+CELL_SIZE = 32
+# (column, row, cost) of every step to a neighbouring cell, diagonals cost sqrt(2)
+STEPS = [(-1, -1, math.sqrt(2)), (0, -1, 1.0), (1, -1, math.sqrt(2)), (-1, 0, 1.0),
+         (1, 0, 1.0), (-1, 1, math.sqrt(2)), (0, 1, 1.0), (1, 1, math.sqrt(2))]
+
+class FlowField:
+    """
+    Class representing a grid of directions that lead from every cell to the target along the shortest path
+    around blocked cells, so a chasing enemy only has to look up the direction of its cell instead of steering itself.
+
+    The distances are computed with Dijkstra's algorithm from the target's cell (8 neighbours, a diagonal step
+    may not cut the corner of a blocked cell), and only when the target moves to another cell.
+    """
+    def __init__(self, width, height, cell_size=CELL_SIZE, blocked=()):
+        """
+        Initializes a new instance of the FlowField class.
+
+        Args:
+            width (int): The width of the area covered by the field.
+            height (int): The height of the area covered by the field.
+            cell_size (int): The width and height of a cell.
+            blocked (iterable): (column, row) of every cell enemies can not walk through, e.g. walls of a map.
+        """
+        self.cell_size = cell_size
+        self.columns = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.passable = np.ones((self.rows, self.columns), dtype=bool)
+        for column, row in blocked:
+            self.passable[row, column] = False
+
+        self.distance = np.full((self.rows, self.columns), np.inf) # Path length to the target in cells
+        self.direction_x = np.zeros((self.rows, self.columns))
+        self.direction_y = np.zeros((self.rows, self.columns))
+        self.steer = np.zeros((self.rows, self.columns), dtype=bool) # False where enemies steer straight at the target instead
+        self.vectors = [] # Row -> column -> (direction_x, direction_y) or None, for looking up one enemy at a time
+        self.target_cell = None
+        self.rebuild_count = 0
+
+    def cell(self, x, y):
+        """
+        Get the cell holding a point. Points outside the field belong to the nearest border cell.
+
+        Args:
+            x (float): The x-coordinate.
+            y (float): The y-coordinate.
+
+        Returns:
+            tuple: The (column, row) of the cell.
+        """
+        column = min(max(int(x) // self.cell_size, 0), self.columns - 1)
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        return column, row
+
+    def update(self, target_x, target_y):
+        """
+        Point the field at the target, rebuilding it if the target moved to another cell.
+
+        Args:
+            target_x (float): X-coordinate of the target (the player).
+            target_y (float): Y-coordinate of the target.
+
+        Returns:
+            bool: True if the field was rebuilt.
+        """
+        target_cell = self.cell(target_x, target_y)
+        if target_cell == self.target_cell:
+            return False
+        self.target_cell = target_cell
+        self.build_distances(target_cell)
+        self.build_directions(target_cell)
+        self.rebuild_count += 1
+        return True
+
+    def build_distances(self, target_cell):
+        """
+        Compute the path length from every cell to the target cell.
+
+        Args:
+            target_cell (tuple): The (column, row) of the target.
+        """
+        columns = self.columns
+        rows = self.rows
+        passable = self.passable.tolist() # Plain lists are much faster than NumPy for one cell at a time
+        distance = [[math.inf] * columns for _ in range(rows)]
+        target_column, target_row = target_cell
+        distance[target_row][target_column] = 0.0
+        queue = [(0.0, target_column, target_row)]
+
+        while queue:
+            cell_distance, column, row = heapq.heappop(queue)
+            if cell_distance > distance[row][column]: # Already reached through a shorter path
+                continue
+            for step_column, step_row, cost in STEPS:
+                next_column = column + step_column
+                next_row = row + step_row
+                if not (0 <= next_column < columns and 0 <= next_row < rows) or not passable[next_row][next_column]:
+                    continue
+                if step_column and step_row and not (passable[row][next_column] and passable[next_row][column]):
+                    continue # Diagonal steps can not squeeze between two blocked cells
+                next_distance = cell_distance + cost
+                if next_distance < distance[next_row][next_column]:
+                    distance[next_row][next_column] = next_distance
+                    heapq.heappush(queue, (next_distance, next_column, next_row))
+
+        self.distance = np.array(distance)
+
+    def build_directions(self, target_cell):
+        """
+        Point every cell at the neighbour its shortest path goes through.
+
+        Args:
+            target_cell (tuple): The (column, row) of the target.
+        """
+        rows = self.rows
+        columns = self.columns
+        padded_distance = np.pad(self.distance, 1, constant_values=np.inf)
+        padded_passable = np.pad(self.passable, 1, constant_values=False)
+
+        # Path length through each of the 8 neighbours, for every cell at once
+        through = np.empty((len(STEPS), rows, columns))
+        for index, (step_column, step_row, cost) in enumerate(STEPS):
+            neighbour = padded_distance[1 + step_row:1 + step_row + rows, 1 + step_column:1 + step_column + columns] + cost
+            if step_column and step_row:
+                open_corner = (padded_passable[1:1 + rows, 1 + step_column:1 + step_column + columns]
+                               & padded_passable[1 + step_row:1 + step_row + rows, 1:1 + columns])
+                neighbour = np.where(open_corner, neighbour, np.inf)
+            through[index] = neighbour
+        best = through.argmin(axis=0)
+
+        units = np.array([(step_column, step_row) for step_column, step_row, _ in STEPS], dtype=np.float64)
+        units /= np.hypot(units[:, 0], units[:, 1])[:, None]
+        self.direction_x = units[best, 0]
+        self.direction_y = units[best, 1]
+
+        # The cells are too coarse to aim with next to the target, and unreachable cells have no path
+        row_index, column_index = np.indices((rows, columns))
+        target_column, target_row = target_cell
+        near_target = (np.abs(column_index - target_column) <= 1) & (np.abs(row_index - target_row) <= 1)
+        self.steer = np.isfinite(self.distance) & ~near_target
+
+        self.vectors = [[(x, y) if steer else None for x, y, steer in zip(row_x, row_y, row_steer)]
+                        for row_x, row_y, row_steer in zip(self.direction_x.tolist(), self.direction_y.tolist(), self.steer.tolist())]
+
+    def direction(self, x, y):
+        """
+        Get the direction an enemy at a point should move in.
+
+        Args:
+            x (float): The x-coordinate of the enemy.
+            y (float): The y-coordinate of the enemy.
+
+        Returns:
+            tuple: The unit (direction_x, direction_y), or None if the enemy should steer straight at the target.
+        """
+        column, row = self.cell(x, y)
+        return self.vectors[row][column]
+
+    def sample(self, x, y):
+        """
+        Get the directions of many enemies at once.
+
+        Args:
+            x (numpy.ndarray): The x-coordinates of the enemies.
+            y (numpy.ndarray): The y-coordinates of the enemies.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The unit direction of every enemy
+            and whether it follows the field (False where it should steer straight at the target).
+        """
+        columns = np.clip(x // self.cell_size, 0, self.columns - 1).astype(np.int64)
+        rows = np.clip(y // self.cell_size, 0, self.rows - 1).astype(np.int64)
+        return self.direction_x[rows, columns], self.direction_y[rows, columns], self.steer[rows, columns]
@@ -0,0 +1,421 @@
+import pygame
+from Player import Player
+from Waves import WaveTable
+from SpatialGrid import SpatialGrid
+from FlowField import FlowField
+from EnemyStore import EnemyStore
+from ProjectilePool import projectile_pool
+from BulletEngine import BulletEngine
+from EffectPool import effect_pool, GROUND, OVERLAY
+from DirtyScreen import DirtyScreen
+from Hud import Hud, text_cache, HUD_COLOR
+from Profiler import Profiler
+from AssetManager import assets
+from EntityList import EntityList
+from ProjectileEnemy import ProjectileEnemy
+from FluidEnemy import FluidEnemy
+
+# Constants
+WIDTH, HEIGHT = 800, 600
+PLAYER_HEALTH = 30000
+BASE_TICK_RATE = 60 # Speeds, cooldowns and timers are tuned in frames of a 60 FPS game
+START_DELAY = 180 # Frames the "Game Starting" banner is shown for
+WAVE_DELAY = 300 # Frames the "Wave completed" banner is shown for
+
+class FrameInput:
+    """
+    Class holding the player input for a single simulation step.
+    """
+    def __init__(self, events=(), cursor_position=(0, 0)):
+        """
+        Initializes a new instance of the FrameInput class.
+
+        Args:
+            events (list): The pygame events (key and mouse button presses) for this step.
+            cursor_position (tuple): The position of the cursor.
+        """
+        self.events = events
+        self.cursor_position = cursor_position
+
+class Game:
+    """
+    Class holding the state of a game session: the player, the enemies and the wave progression.
+    It only touches the display in draw, so it can be stepped headless (e.g. with SDL's dummy video driver).
+    """
+    def __init__(self, screen=None, use_enemy_store=False, tick_rate=BASE_TICK_RATE, wave_delays=True, profiler=None, wave_table=None):
+        """
+        Initializes a new instance of the Game class.
+
+        Args:
+            screen (pygame.Surface): The surface the game is drawn on. An off-screen surface is created if None.
+            use_enemy_store (bool): Whether enemy movement and cooldowns are advanced in bulk by an EnemyStore.
+            tick_rate (int): The number of simulation steps per second. Every step advances the game by 1 / tick_rate seconds.
+            wave_delays (bool): Whether a banner is shown between waves. If False, the next wave spawns on the step after a wave is cleared.
+            profiler (Profiler): Records how long every phase of a step takes. A disabled one is created if None.
+            wave_table (WaveTable): The waves to play, the ones of Waves.json if None.
+        """
+        if screen is None:
+            screen = pygame.Surface((WIDTH, HEIGHT))
+        self.screen = screen
+        self.boundary = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.wave_delays = wave_delays
+        self.waves = wave_table if wave_table is not None else WaveTable() # Enemy templates are built once per game, spawning only creates the enemies
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.tick_rate = tick_rate
+        self.dt = BASE_TICK_RATE / tick_rate # Length of a step in 60 FPS frames, scales every speed and timer
+
+        self.player = Player(screen)
+        self.enemies = EntityList()
+        self.projectile_enemies = EntityList()
+        self.fluid_enemies = EntityList()
+        self.enemy_grid = SpatialGrid()
+        self.flow_field = FlowField(WIDTH, HEIGHT)
+        self.flow_field_crowd = self.waves.flow_field_crowd # Enemies on screen from which they follow the flow field
+        self.enemy_bullets = BulletEngine()
+        effect_pool.clear() # Splats and flames of a previous game are not shown
+        self.enemy_store = EnemyStore() if use_enemy_store else None
+        self.enemy_store_stale = True # Set whenever enemies are added or removed
+
+        self.wave_number = 0
+        self.enemies_killed = 0
+        self.projectile_enemies_killed = 0
+        self.frame = 0
+        self.cursor_position = (0, 0)
+        self.hud = Hud(WIDTH, HEIGHT)
+
+        # Wave transition state: while transition_timer is set the game is frozen behind a banner
+        self.transition_timer = None
+        self.banner_text = None
+        self.preparation = None # Generator doing the setup of the next wave in small pieces, one per step
+        self.staged_wave = None # (enemies, projectile_enemies, fluid_enemies) of the next wave once it is prepared
+
+    def step(self, inputs):
+        """
+        Advance the game by one fixed simulation tick.
+
+        Args:
+            inputs (FrameInput): The player input for this tick.
+
+        Returns:
+            str: "defeat" if the player died, "victory" if the final wave was cleared,
+                 "wave_cleared" if a wave was cleared (the transition to the next wave starts), otherwise None.
+        """
+        profiler = self.profiler
+        effect_pool.update(self.dt) # Effects fade during wave transitions too, the ones emitted this tick are shown from this tick on
+        self.apply_input(inputs)
+        profiler.lap("events")
+        if self.transition_timer is not None:
+            outcome = self.update_transition()
+            profiler.lap("waves")
+            return outcome
+        self.update_movement()
+        self.update_enemy_fire()
+        profiler.lap("enemy_fire")
+        self.update_collisions()
+        profiler.lap("collision")
+        outcome = self.update_waves()
+        profiler.lap("waves")
+        return outcome
+
+    def apply_input(self, inputs):
+        """
+        Pass the input of this frame on to the player.
+
+        Args:
+            inputs (FrameInput): The player input for this frame.
+        """
+        self.frame += 1
+        self.cursor_position = inputs.cursor_position
+
+        playing = self.transition_timer is None
+        for event in inputs.events:
+            self.player.handle_movement(event) # Key releases still count during a transition so the player does not keep walking
+            if playing:
+                self.player.handle_shooting(event)
+
+    def remember_positions(self):
+        """
+        Record where the player and the enemies are before they move, so draw can interpolate between two ticks.
+        """
+        player = self.player
+        player.previous_topleft = player.rect.topleft
+        for enemy in self.enemies + self.projectile_enemies + self.fluid_enemies:
+            enemy.previous_topleft = enemy.rect.topleft
+
+    def update_movement(self):
+        """
+        Move the player, the enemies and every projectile.
+        """
+        profiler = self.profiler
+        self.remember_positions()
+        dt = self.dt
+        player = self.player
+        player.move_player(dt)
+        profiler.lap("player")
+        player.update_projectiles(dt)
+        profiler.lap("projectiles")
+
+        enemy_grid = self.enemy_grid
+        enemy_grid.rebuild(self.enemies, self.projectile_enemies, self.fluid_enemies) # Built once per frame for overlap avoidance
+
+        flow_field = None
+        if len(self.enemies) + len(self.projectile_enemies) + len(self.fluid_enemies) >= self.flow_field_crowd:
+            flow_field = self.flow_field
+            player_coords = player.get_coords()
+            flow_field.update(player_coords[0], player_coords[1]) # Only rebuilt when the player enters another cell
+
+        if self.enemy_store is not None:
+            if self.enemy_store_stale:
+                self.enemy_store.load(self.enemies, self.projectile_enemies, self.fluid_enemies)
+                self.enemy_store_stale = False
+            player_coords = player.get_coords()
+            self.enemy_store.move(player_coords[0], player_coords[1], enemy_grid, dt, flow_field)
+            profiler.lap("enemies") # The store moves every kind of enemy at once
+        else:
+            for enemy in self.enemies:
+                enemy.update_movement(enemy_grid, dt, flow_field)
+            profiler.lap("enemies")
+
+            for projectile_enemy in self.projectile_enemies:
+                projectile_enemy.update_movement(player, dt, flow_field)
+            profiler.lap("projectile_enemies")
+
+            for fluid_enemy in self.fluid_enemies:
+                fluid_enemy.update_movement(enemy_grid, dt, flow_field)
+            profiler.lap("fluid_enemies")
+
+        player.move_within(self.boundary, dt)
+        player.update(self.cursor_position, dt)
+        profiler.lap("player")
+
+        # Drop projectiles that left the screen so they stop being updated, drawn and collision checked
+        projectile_pool.cull(player.projectiles, self.boundary)
+        self.enemy_bullets.update(self.boundary, dt)
+        profiler.lap("projectiles")
+
+    def update_enemy_fire(self):
+        """
+        Advance the enemy attack cooldowns, attacking or firing at the player when they run out.
+        """
+        dt = self.dt
+        player = self.player
+        if self.enemy_store is not None:
+            for enemy in self.enemy_store.tick_attacks(dt):
+                if isinstance(enemy, ProjectileEnemy):
+                    enemy.fire_projectile(player, self.enemy_bullets)
+                else:
+                    enemy.attack(player)
+            return
+
+        for enemy in self.enemies:
+            enemy.update_attack(player, dt)
+
+        for projectile_enemy in self.projectile_enemies:
+            projectile_enemy.update_attack(player, self.enemy_bullets, dt)
+
+        for fluid_enemy in self.fluid_enemies:
+            fluid_enemy.update_attack(player, dt)
+
+    def update_collisions(self):
+        """
+        Resolve player projectiles hitting enemies and enemies or their projectiles hitting the player.
+        """
+        player = self.player
+
+        # One broadphase pass over all player projectiles, using the grid built for this frame's movement
+        for projectile, enemy in self.enemy_grid.find_collisions(player.projectiles):
+            if not enemy.is_enemy_destroyed(): # Projectiles pass through enemies killed earlier in the batch
+                enemy.receive_damage(projectile.damage, projectile.rect.center)
+                projectile_pool.release(projectile)
+                if enemy.is_enemy_destroyed(): # Killed enemies stay in their list until the end of the step
+                    self.entity_list(enemy).mark_dead()
+
+        for enemy in self.enemies + self.fluid_enemies: # Contact damage is dealt every tick, so it is scaled by the tick length
+            enemy.deal_damage_to_player(player, self.dt)
+
+        for damage in self.enemy_bullets.collide(player.rect): # Every enemy bullet is tested against the player in one pass
+            player.handle_damage(damage)
+
+    def update_waves(self):
+        """
+        Remove destroyed enemies and check whether the player died or the wave was cleared.
+
+        Returns:
+            str: "defeat", "victory", "wave_cleared" or None, see step.
+        """
+        self.remove_destroyed()
+
+        if self.player.is_destroyed():
+            return "defeat"
+
+        # Check if all enemies are destroyed, then finish the game or move on to a new wave
+        if not self.enemies and not self.projectile_enemies and not self.fluid_enemies:
+            if self.wave_number == self.waves.final_wave:
+                return "victory"
+            self.begin_transition()
+            return "wave_cleared"
+
+        return None
+
+    def end(self):
+        """
+        Return the player's shots still in flight to the shared projectile pool and drop the effects, once the game is over.
+        Every game draws from the same pool, so the next game starts with all of them free.
+        """
+        projectile_pool.release_all(self.player.projectiles)
+        effect_pool.clear()
+
+    def entity_list(self, enemy):
+        """
+        Get the list an enemy belongs to.
+
+        Args:
+            enemy (Enemy, ProjectileEnemy or FluidEnemy): The enemy.
+
+        Returns:
+            EntityList: The enemies, projectile_enemies or fluid_enemies list.
+        """
+        if isinstance(enemy, ProjectileEnemy):
+            return self.projectile_enemies
+        if isinstance(enemy, FluidEnemy):
+            return self.fluid_enemies
+        return self.enemies
+
+    def remove_destroyed(self):
+        """
+        Remove the enemies marked dead this step from the enemy lists, in one pass per list, and count the kills.
+        """
+        melee_fallen = self.enemies.compact() + self.fluid_enemies.compact()
+        projectile_fallen = self.projectile_enemies.compact()
+        if not melee_fallen and not projectile_fallen:
+            return
+        self.enemy_store_stale = True
+
+        self.enemies_killed += len(melee_fallen)
+        self.projectile_enemies_killed += len(projectile_fallen)
+
+    def begin_transition(self):
+        """
+        Freeze the game behind the banner announcing the start of the game or the completed wave,
+        and start preparing the next wave.
+        """
+        if self.wave_number == 0: # If Wave is 0 (hasn't started yet) alert the Player that the game is starting
+            self.banner_text = "Game Starting in 3 Seconds!"
+            self.transition_timer = START_DELAY if self.wave_delays else 0
+        else: # Otherwise, announce the completed and the upcoming wave
+            self.banner_text = f"Wave {self.wave_number} completed! Wave {self.wave_number + 1} starting..."
+            self.transition_timer = WAVE_DELAY if self.wave_delays else 0
+        self.waves.preload(self.wave_number + 1) # Decode the next stage's images on a worker thread during the banner
+        self.preparation = self.prepare_wave(self.wave_number + 1)
+
+    def prepare_wave(self, wave_number):
+        """
+        Set up a wave ahead of time, one piece per call to next, so the work is spread over the transition steps.
+
+        Args:
+            wave_number (int): The wave to prepare.
+        """
+        self.stage_map(wave_number) # Load and convert the map of the wave's stage
+        yield
+        staged_wave = ([], [], [])
+        self.waves.spawn_wave(staged_wave[0], staged_wave[1], staged_wave[2], wave_number, self.player)
+        self.staged_wave = staged_wave
+
+    def update_transition(self):
+        """
+        Advance the wave transition by one step, doing one piece of the next wave's setup,
+        and spawn the next wave once the banner time is over.
+
+        Returns:
+            None: Nothing happens to the player during a transition.
+        """
+        loading = assets.collect() # Convert the images the worker threads finished
+        if self.preparation is not None and not loading: # Set the wave up once its images are in, so it does not wait on decoding
+            next(self.preparation, None)
+        self.transition_timer -= self.dt
+        if self.transition_timer <= 0:
+            self.next_wave()
+        return None
+
+    def next_wave(self):
+        """
+        End the transition: move on to the next wave and spawn its enemies.
+        """
+        if self.preparation is not None:
+            for _ in self.preparation: # Finish whatever setup the transition did not get to, waiting for images still loading
+                pass
+        self.wave_number += 1
+        enemies, projectile_enemies, fluid_enemies = self.staged_wave
+        self.enemies.extend(enemies)
+        self.projectile_enemies.extend(projectile_enemies)
+        self.fluid_enemies.extend(fluid_enemies)
+        self.enemy_store_stale = True
+
+        self.transition_timer = None
+        self.banner_text = None
+        self.preparation = None
+        self.staged_wave = None
+
+    def stage_map(self, wave_number=None):
+        """
+        Get the floor map for a wave.
+
+        Args:
+            wave_number (int): The wave, the current one if None.
+
+        Returns:
+            pygame.Surface: The map image, or None after the final stage.
+        """
+        if wave_number is None:
+            wave_number = self.wave_number
+        return self.waves.stage_map(wave_number)
+
+    def interpolate(self, entity, alpha):
+        """
+        Get where to draw an entity between its position at the previous tick and its current one.
+
+        Args:
+            entity (Enemy, ProjectileEnemy or Player): An entity with rect and previous_topleft attributes.
+            alpha (float): How far the render time is between the previous and the current tick, from 0 to 1.
+
+        Returns:
+            tuple: The top left to draw the entity at.
+        """
+        previous_x, previous_y = entity.previous_topleft
+        return (previous_x + (entity.rect.x - previous_x) * alpha, previous_y + (entity.rect.y - previous_y) * alpha)
+
+    def draw(self, screen, alpha=1):
+        """
+        Draw the current state of the game.
+
+        Args:
+            screen (pygame.Surface): The screen to draw on.
+            alpha (float): How far the render time is between the previous and the current tick, from 0 to 1.
+                           Below 1, moving entities are drawn between their last two positions.
+        """
+        if self.transition_timer is not None: # Nothing moves during a transition
+            alpha = 1
+
+        stage_map = self.stage_map()
+        if isinstance(screen, DirtyScreen): # Only the regions drawn over last frame are restored from the map
+            screen.set_background(stage_map)
+        elif stage_map is not None:
+            screen.blit(stage_map, (0, 0))
+
+        # Render pass: every layer is drawn with one blits call, the effects under the enemies, then the enemy sprites
+        effect_pool.draw(screen, GROUND)
+        interpolating = alpha < 1
+        sprites = []
+        for enemy in self.enemies + self.projectile_enemies + self.fluid_enemies:
+            enemy.collect_blits(sprites, self.interpolate(enemy, alpha) if interpolating else None)
+        screen.blits(sprites, doreturn=False)
+        self.enemy_bullets.draw(screen, alpha)
+
+        self.player.draw(self.interpolate(self.player, alpha) if interpolating else None)
+        effect_pool.draw(screen, OVERLAY)
+        self.player.draw_projectiles(alpha)
+        self.hud.draw(screen, self.player.health, self.wave_number)
+
+        if self.banner_text is not None:
+            banner = text_cache.render(assets.get_font(None, 48), self.banner_text, HUD_COLOR)
+            screen.blit(banner, banner.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
@@ -0,0 +1,107 @@
+from collections import OrderedDict
+from AssetManager import assets
+
+HUD_COLOR = (255, 255, 255)
+
+class TextCache:
+    """
+    Class memoizing rendered text surfaces by font, string and colour,
+    evicting the least recently used surface once the cache is full.
+    """
+    def __init__(self, capacity=256):
+        """
+        Initializes a new instance of the TextCache class.
+
+        Args:
+            capacity (int): The number of text surfaces kept.
+        """
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """
+        Get a rendered text surface, rasterizing it only if it is not cached.
+
+        Args:
+            font (pygame.font.Font): The font, shared through the AssetManager.
+            text (str): The text to render.
+            color (tuple): The text colour.
+
+        Returns:
+            pygame.Surface: The antialiased text. It is shared, so it must not be drawn on.
+        """
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False) # Evict the least recently used text
+        return surface
+
+    def stats(self):
+        """
+        Get the cache statistics.
+
+        Returns:
+            dict: The number of hits, misses (renders) and cached surfaces.
+        """
+        return {"hits": self.hits, "misses": self.misses, "surfaces": len(self.surfaces)}
+
+
+# Shared cache used for every piece of text drawn during gameplay
+text_cache = TextCache()
+
+class Hud:
+    """
+    Class drawing the gameplay HUD: the player's health and the current wave.
+    Each label is only looked up again when the value it shows changes.
+    """
+    def __init__(self, width, height):
+        """
+        Initializes a new instance of the Hud class.
+
+        Args:
+            width (int): The width of the screen.
+            height (int): The height of the screen.
+        """
+        self.font = None # Fetched on the first draw, so headless games never need the font module
+        self.health_position = (10, height - 50)
+        self.wave_bottomright = (width - 20, height - 30)
+
+        self.health = None
+        self.health_label = None
+        self.wave_number = None
+        self.wave_label = None
+        self.wave_rect = None
+
+    def draw(self, screen, health, wave_number):
+        """
+        Draw the HUD.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+            health (float): The player's health.
+            wave_number (int): The current wave.
+        """
+        if self.font is None:
+            self.font = assets.get_font(None, 36)
+        health = int(health)
+        if health != self.health:
+            self.health = health
+            self.health_label = text_cache.render(self.font, f"Health: {health}", HUD_COLOR)
+
+        if wave_number != self.wave_number:
+            self.wave_number = wave_number
+            self.wave_label = text_cache.render(self.font, f"Current Wave: {wave_number}", HUD_COLOR)
+            self.wave_rect = self.wave_label.get_rect(bottomright=self.wave_bottomright)
+
+        screen.blit(self.wave_label, self.wave_rect)
+        screen.blit(self.health_label, self.health_position)
@@ -0,0 +1,121 @@
+import struct
+import pygame
+from Game import FrameInput
+
+MAGIC = b"HLIN"
+VERSION = 1
+HEADER = struct.Struct("<4sHH") # Magic, format version, simulation tick rate
+RECORD = struct.Struct("<IBihh") # Tick, record kind, key or mouse button, x, y
+
+# Record kinds
+KEY_DOWN = 0
+KEY_UP = 1
+MOUSE_DOWN = 2
+CURSOR = 3
+END = 4 # Marks the last tick of the session, which may have had no input
+
+class InputRecorder:
+    """
+    Class writing the player input of every simulation tick to a compact binary log.
+    Only changes are stored: key presses and releases, mouse clicks and cursor moves.
+    """
+    def __init__(self, path, tick_rate):
+        """
+        Initializes a new instance of the InputRecorder class and opens the log file.
+
+        Args:
+            path (str): The log file path.
+            tick_rate (int): The simulation tick rate of the recorded game.
+        """
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, tick_rate))
+        self.tick = 0
+        self.cursor_position = None
+
+    def record(self, inputs):
+        """
+        Record the input of the next tick. Call it once per Game.step, with the same input.
+
+        Args:
+            inputs (FrameInput): The player input for the tick.
+        """
+        self.tick += 1
+        tick = self.tick
+        write = self.file.write
+        for event in inputs.events:
+            if event.type == pygame.KEYDOWN:
+                write(RECORD.pack(tick, KEY_DOWN, event.key, 0, 0))
+            elif event.type == pygame.KEYUP:
+                write(RECORD.pack(tick, KEY_UP, event.key, 0, 0))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                write(RECORD.pack(tick, MOUSE_DOWN, event.button, event.pos[0], event.pos[1]))
+
+        if inputs.cursor_position != self.cursor_position:
+            self.cursor_position = inputs.cursor_position
+            write(RECORD.pack(tick, CURSOR, 0, self.cursor_position[0], self.cursor_position[1]))
+
+    def close(self):
+        """
+        Mark the end of the session, then flush and close the log file.
+        """
+        self.file.write(RECORD.pack(self.tick, END, 0, 0, 0))
+        self.file.close()
+
+class InputReplayer:
+    """
+    Class reading an input log and handing back the input of every tick, so a recorded session can be stepped again.
+    """
+    def __init__(self, path):
+        """
+        Initializes a new instance of the InputReplayer class and reads the whole log.
+
+        Args:
+            path (str): The log file path.
+
+        Raises:
+            ValueError: If the file is not an input log of a supported version.
+        """
+        with open(path, "rb") as log_file:
+            data = log_file.read()
+        magic, version, self.tick_rate = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input log")
+
+        self.ticks = {} # Tick -> list of (kind, code, x, y)
+        self.last_tick = 0
+        for record in RECORD.iter_unpack(data[HEADER.size:]):
+            tick = record[0]
+            self.ticks.setdefault(tick, []).append(record[1:])
+            self.last_tick = tick
+
+        self.tick = 0
+        self.cursor_position = (0, 0)
+
+    def finished(self):
+        """
+        Check if every recorded tick was replayed.
+
+        Returns:
+            bool: True if there is no input left.
+        """
+        return self.tick >= self.last_tick
+
+    def next_input(self):
+        """
+        Get the input of the next tick.
+
+        Returns:
+            FrameInput: The recorded input, with the events rebuilt as pygame events.
+        """
+        self.tick += 1
+        events = []
+        for kind, code, x, y in self.ticks.get(self.tick, ()):
+            if kind == KEY_DOWN:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=code))
+            elif kind == KEY_UP:
+                events.append(pygame.event.Event(pygame.KEYUP, key=code))
+            elif kind == MOUSE_DOWN:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=code, pos=(x, y)))
+            elif kind == CURSOR:
+                self.cursor_position = (x, y)
+        return FrameInput(events, self.cursor_position)
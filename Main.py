@@ -1,23 +1,77 @@
+import time
+startup_start = time.perf_counter() # Taken before pygame and the game modules are imported, for --startup-timing
+
+import sys
+import argparse
 import pygame
-import math
 from Player import Player
 from Target import Target
-from Enemy import Enemy
-from ProjectileEnemy import ProjectileEnemy
-from FluidEnemy import FluidEnemy
+from Game import Game, FrameInput, WIDTH, HEIGHT, PLAYER_HEALTH
+from AssetManager import assets
+from ProjectilePool import projectile_pool
+from DirtyScreen import DirtyScreen
+from Hud import text_cache
+from Profiler import Profiler
+from InputLog import InputRecorder
+from Controller import KitingBot
+from Waves import WaveTable
+from Atlas import GAMEPLAY_SPRITES, load_or_build_atlas, sprite_paths
 
 # Constants
-WIDTH, HEIGHT = 800, 600
 TITLE_COLOR = (255, 255, 255)
 BUTTON_COLOR = (100, 100, 100)
 FPS = 60
-WAVE_NUMBER = 0
+RENDER_FPS = 120 # Frame cap of the game screen, the simulation itself always runs at SIMULATION_RATE
+SIMULATION_RATE = 60
+MAX_STEPS_PER_FRAME = 5 # After a long stall the simulation slows down instead of trying to catch up all at once
+
+game_screen = None
+clock = None
+dirty_rendering = False # Set by --dirty, only redraws and pushes the regions that changed during gameplay
+profile_path = None # Set by --profile, where the frame profile of a game is written when it ends
+record_path = None # Set by --record, where the input of a game is logged for Replay.py
+autopilot = False # Set by --autopilot, the kiting bot plays instead of the keyboard and mouse
+use_atlas = True # Cleared by --no-atlas
+startup_timing = False # Set by --startup-timing, prints how long every startup phase took
+startup_phases = [] # (phase, time it ended) until the first menu frame is shown
+startup_finished = False
+
+def mark_startup(phase):
+    """
+    Record the end of a startup phase. Nothing is recorded once the first menu frame was shown.
 
-pygame.init() # Init Pygame
+    Args:
+        phase (str): The phase that just ended.
+    """
+    if not startup_finished:
+        startup_phases.append((phase, time.perf_counter()))
 
-game_screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption('Game Menu')
-clock = pygame.time.Clock()
+def finish_startup():
+    """
+    End the startup once the first menu frame is on screen: load the texture atlas (or start building it),
+    start decoding the sprites and the first stage's maps in the background and print the startup timing if --startup-timing is set.
+    Later calls return straight away.
+    """
+    global startup_finished
+    if startup_finished:
+        return
+    mark_startup("first frame")
+    startup_finished = True
+
+    loading_start = time.perf_counter()
+    if use_atlas:
+        load_or_build_atlas(sprite_paths(), background=True) # Built on a worker thread on the first run, sprites are then drawn from a few shared pages
+    assets.load_async(GAMEPLAY_SPRITES) # Sprites the atlas already serves are skipped
+    WaveTable().preload(1) # Later stages are preloaded during the transitions before them
+    loading_time = time.perf_counter() - loading_start
+
+    if startup_timing:
+        previous = startup_start
+        for phase, end in startup_phases:
+            print(f"{phase:<24}{(end - previous) * 1000:8.1f} ms")
+            previous = end
+        print(f"{'first menu frame at':<24}{(previous - startup_start) * 1000:8.1f} ms")
+        print(f"{'atlas and preloading':<24}{loading_time * 1000:8.1f} ms (after the first frame)")
 
 def create_main_menu(screen):
     """
@@ -31,12 +85,12 @@ def create_main_menu(screen):
     """
 
     # Create the labels and rects
-    font_title = pygame.font.Font("Fonts/Freedom-10eM.ttf", 80)
-    font_buttons = pygame.font.Font("Fonts/Freedom-10eM.ttf", 40)
-    title_text = font_title.render("Funny Game", True, TITLE_COLOR)
-    start_text = font_buttons.render("Start", True, BUTTON_COLOR)
-    tutorial_text = font_buttons.render("Tutorial", True, BUTTON_COLOR)
-    exit_text = font_buttons.render("Exit Game", True, BUTTON_COLOR)
+    font_title = assets.get_font("Fonts/Freedom-10eM.ttf", 80)
+    font_buttons = assets.get_font("Fonts/Freedom-10eM.ttf", 40)
+    title_text = text_cache.render(font_title, "Funny Game", TITLE_COLOR) # Rendered once, coming back to the menu reuses the labels
+    start_text = text_cache.render(font_buttons, "Start", BUTTON_COLOR)
+    tutorial_text = text_cache.render(font_buttons, "Tutorial", BUTTON_COLOR)
+    exit_text = text_cache.render(font_buttons, "Exit Game", BUTTON_COLOR)
     title_rect = title_text.get_rect(center=(WIDTH // 2, HEIGHT // 4))
     start_rect = start_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
     tutorial_rect = tutorial_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50))
@@ -82,13 +136,17 @@ def create_main_menu(screen):
                     return "Exit Game"
         return selected_button
 
+    mark_startup("menu")
+
     selected_button = None
     while True:
+        assets.collect()
         game_screen.fill((0, 0, 0))
         draw_buttons(selected_button)
         mouse_pos = pygame.mouse.get_pos()
         selected_button = handle_button_selection(mouse_pos)
         pygame.display.flip()
+        finish_startup() # Game resources are only loaded once the menu is visible
         clock.tick(FPS)
         if selected_button:
             return selected_button
@@ -97,198 +155,86 @@ def run_start_screen():
     """
     Runs the main game screen where the player faces different waves of enemies.
     """
-     
-    global WAVE_NUMBER
-
-    player = Player(game_screen)
-    enemies = []
-    projectile_enemies = []
-    fluid_enemies = []
+    screen = DirtyScreen(game_screen) if dirty_rendering else game_screen
+    profiler = Profiler(enabled=profile_path is not None) # F3 shows the overlay
+    game = Game(screen, tick_rate=SIMULATION_RATE, profiler=profiler)
+    recorder = InputRecorder(record_path, SIMULATION_RATE) if record_path is not None else None
+    controller = KitingBot() if autopilot else None
+    tick_ms = 1000 / SIMULATION_RATE
 
     clock = pygame.time.Clock()
     running = True
     paused = False
-    # Get the maps
-    stone_map = pygame.image.load("Images/StoneBrickFloor.jpg")
-    desert_map = pygame.image.load("Images/DesertFloor.jpg")
-    grass_map = pygame.image.load("Images/GrassFloor.png")
-    
-    
-    screen_boundary = pygame.Rect(0, 0, WIDTH, HEIGHT)
+    assets.preload(["Images/Splat.png", "Images/KunKunAttack.png"]) # Hit and shot sprites are needed mid-frame, so load them before gameplay
 
-    # Create font for Wave Label
-    font = pygame.font.Font(None, 36)
-    wave_label = font.render(f"Current Wave: {WAVE_NUMBER}", True, (255, 255, 255))
-    wave_rect = wave_label.get_rect(bottomright=(WIDTH - 20, HEIGHT - 30))
+    # Rendering runs as fast as RENDER_FPS allows, the game is stepped in fixed ticks to catch up with the elapsed time
+    accumulator = 0
+    pending_events = [] # Input waits for the next tick, so presses are never lost on frames that run no tick
+    clock.tick()
 
     while running:
-        if WAVE_NUMBER < 9:
-            game_screen.blit(stone_map, (0, 0)) # If Wave is under 9, blit stone map
-
-        elif WAVE_NUMBER < 14 and WAVE_NUMBER > 8:
-            game_screen.blit(desert_map, (0, 0)) # If Wave is under 14, blit desert map
-
-        elif WAVE_NUMBER < 18 and WAVE_NUMBER > 13:
-            game_screen.blit(grass_map, (0, 0)) # If Wave is under 18, blit grass map
-
-        game_screen.blit(wave_label, wave_rect) # Blit the current wave label
-
-
-        for event in pygame.event.get():
+        profiler.begin_frame()
+        events = pygame.event.get()
+        pending_events.extend(events)
+        for event in events:
             if event.type == pygame.QUIT:
-                # If user tries to exit screen, clear the stats
-                Enemy.enemies_killed = 0
-                ProjectileEnemy.projectile_enemies_killed = 0
-                WAVE_NUMBER = 0
                 running = False # Close window
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     paused = not paused  # Toggle pause state
+                elif event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+        profiler.lap("events")
 
-            player.handle_movement(event)
-            player.handle_shooting(event)
-
-        if paused: # When paused, if user resumes, continue. If user tries to return to menu, clear stats. If user tries to close window, clear stats and return to menu
+        if paused: # When paused, if user resumes, continue. If user tries to return to menu or close window, return to menu
             pause_option = pause_screen(game_screen)
             if pause_option == "Resume":
                 paused = False
-            elif pause_option == "Menu":
-                Enemy.enemies_killed = 0
-                ProjectileEnemy.projectile_enemies_killed = 0
-                WAVE_NUMBER = 0
-                running = False
-            elif pause_option == "Exit":
-                Enemy.enemies_killed = 0
-                ProjectileEnemy.projectile_enemies_killed = 0
-                WAVE_NUMBER = 0
+            elif pause_option == "Menu" or pause_option == "Exit":
                 running = False
-
-        # Update Player 
-        player.move_player()
-        player.update_projectiles()
-        
-        # Update Enemy
-        for enemy in enemies:
-            enemy.update(player.projectiles, player, enemies + projectile_enemies + fluid_enemies, game_screen)
-            enemy.draw(game_screen)
-            enemy.deal_damage_to_player(player)
-
-            if enemy.is_enemy_destroyed():
-                enemies.remove(enemy)
-                
-        # Update Projectile Enemy
-        for projectile_enemy in projectile_enemies:
-            projectile_enemy.update(player.projectiles, player, game_screen)  
-            projectile_enemy.draw(game_screen)
-            projectile_enemy.deal_damage_to_player(player)
-
-            if projectile_enemy.is_enemy_destroyed():
-                projectile_enemies.remove(projectile_enemy)
-                
-        # Update Fluid Enemy
-        for fluid_enemy in fluid_enemies:
-            fluid_enemy.update(player.projectiles, player, enemies + projectile_enemies + fluid_enemies, game_screen)
-            fluid_enemy.draw(game_screen)
-            fluid_enemy.deal_damage_to_player(player)
-
-            if fluid_enemy.is_enemy_destroyed():
-                fluid_enemies.remove(fluid_enemy)
-                
-        #Check if Player is destroyed, if so, display game over screen and clear stats.
-        if player.is_destroyed():
-            if WAVE_NUMBER < 18:
-                display_game_over_screen(player, Enemy.enemies_killed, ProjectileEnemy.projectile_enemies_killed, WAVE_NUMBER, 30000)
-                Enemy.enemies_killed = 0
-                ProjectileEnemy.projectile_enemies_killed = 0
-                WAVE_NUMBER = 0
-                selected = create_main_menu(game_screen)  # Go back to the main menu
+            pending_events = []
+            clock.tick() # Restart the frame timer so the time spent paused is not simulated
+            profiler.begin_frame()
+            if dirty_rendering:
+                screen.invalidate() # The pause menu was drawn over the whole screen
+
+        if not running:
+            break
+
+        outcome = None
+        while accumulator >= tick_ms and outcome is None:
+            if controller is not None:
+                inputs = controller.next_input(game)
+            else:
+                inputs = FrameInput(pending_events, pygame.mouse.get_pos())
+            if recorder is not None:
+                recorder.record(inputs)
+            outcome = game.step(inputs)
+            pending_events = []
+            accumulator -= tick_ms
+
+        game.draw(screen, accumulator / tick_ms)
+        profiler.draw(screen)
+        profiler.lap("draw")
+
+        if outcome == "defeat" or outcome == "victory": # Display game over or victory screen, then go back to the main menu
+            display_game_over_screen(game.player, game.enemies_killed, game.projectile_enemies_killed, game.wave_number, PLAYER_HEALTH, game.waves.final_wave)
             running = False
 
-        #Get Player speed
-        new_x = player.rect.x
-        new_y = player.rect.y
-
-        if player.moving_left:
-            new_x -= player.player_speed
-        if player.moving_right:
-            new_x += player.player_speed
-        if player.moving_up:
-            new_y -= player.player_speed
-        if player.moving_down:
-            new_y += player.player_speed
+        if dirty_rendering:
+            screen.present() # Update only the changed regions of the display
+        else:
+            pygame.display.flip() # Update display
+        profiler.lap("flip")
+        profiler.end_frame(game.wave_number)
+        accumulator = min(accumulator + clock.tick(RENDER_FPS), tick_ms * MAX_STEPS_PER_FRAME)
 
-        # Boundary check
-        player.rect.x = min(max(new_x, screen_boundary.left), screen_boundary.right - player.rect.width)
-        player.rect.y = min(max(new_y, screen_boundary.top), screen_boundary.bottom - player.rect.height)
-
-        #Update rest of Player
-        player.draw()
-        player.draw_projectiles()
-        player.render_health(game_screen)  # Rendering player health screen
-        cursor_position = pygame.mouse.get_pos()
-        player.update(cursor_position)
-
-        # Check if all enemies are destroyed, then spawn a new wave
-        if not enemies and not projectile_enemies and not fluid_enemies:
-            if WAVE_NUMBER == 17: # If Game is completed, display victory screen and then clear stats
-                display_game_over_screen(player, Enemy.enemies_killed, ProjectileEnemy.projectile_enemies_killed, WAVE_NUMBER, 30000)
-                Enemy.enemies_killed = 0
-                ProjectileEnemy.projectile_enemies_killed = 0
-                WAVE_NUMBER = -1
-                selected = create_main_menu(game_screen)  # Go back to the main menu
-                running = False
+    game.end()
+    if profile_path is not None:
+        profiler.export(profile_path)
+    if recorder is not None:
+        recorder.close()
 
-            else: #  If Wave is 0 (hasn't started yet) display the initial text alerting the Player that game is starting
-                if  WAVE_NUMBER == 0:
-                    initial_font = pygame.font.Font(None, 48)
-                    initial_text = f"Game Starting in 3 Seconds!"
-                    initial_label = initial_font.render(initial_text, True, (255, 255, 255))
-                    initial_rect = initial_label.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-                    
-                    game_screen.fill((0,0,0))
-                    game_screen.blit(stone_map, (0,0))
-                    game_screen.blit(initial_label, initial_rect)
-                    pygame.display.flip()
-
-                    pygame.time.delay(3000)
-
-                    pygame.display.flip()
-
-                else: # Otherwise, display the wave completed and the upcoming wave.
-                    completion_font = pygame.font.Font(None, 48)
-                    completion_text = f"Wave {WAVE_NUMBER} completed! Wave {WAVE_NUMBER + 1} starting..."
-                    completion_label = completion_font.render(completion_text, True, (255, 255, 255))
-                    completion_rect = completion_label.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-
-                    game_screen.blit(completion_label, completion_rect)
-                    pygame.display.flip()
-
-                    pygame.time.delay(5000)
-
-                    pygame.display.flip()
-
-            
-            if WAVE_NUMBER == 9: # At 9th wave, new enemies are introduced, so previous enemies are cleared from list
-                projectile_enemies.clear()
-                enemies.clear()
-
-            if WAVE_NUMBER == 13: # At 13th wave, new enemies are introduced, so previous enemies are cleared from list
-                projectile_enemies.clear()
-                enemies.clear()
-
-            if WAVE_NUMBER == 18: # At 18th wave, new enemies are introduced, so previous enemies are cleared from list
-                projectile_enemies.clear()
-                fluid_enemies.clear()
-                enemies.clear()
-                
-            WAVE_NUMBER += 1 # Add 1 to Wave after each completed wave
-            wave_label = font.render(f"Current Wave: {WAVE_NUMBER}", True, (255, 255, 255)) # Change the wave label
-            spawn_wave(enemies, projectile_enemies, fluid_enemies, WAVE_NUMBER, player) # Spawn new wave
-
-        
-        pygame.display.flip() # Update display
-        clock.tick(FPS) # Keep tick constant
-    
 
 def run_tutorial_screen():
     """
@@ -301,15 +247,18 @@ def run_tutorial_screen():
     
     # Get images
     player = Player(screen)
-    background = pygame.image.load('Images/StoneBrickFloor.jpg')
+    background = assets.get_image("Images/StoneBrickFloor.jpg", alpha=False)
     targets = [Target(50 + i * 200, 50, 1000, "Images/Target.png", "Images/TargetSmokeEffect.png", "Images/TargetDestroyEffect.png") for i in range(4)]
-    portal_image = pygame.image.load("Images/BluePortal.png")
+    portal_image = assets.get_image("Images/BluePortal.png")
     portal_rect = portal_image.get_rect(center=(400, 250))
     portal_active = False
 
     running = True
     paused = False
     panel_text = "W A S D to move! Hit the Targets Once or More!"
+    panel_font_size = 36
+    panel = None
+    panel_shown_text = None # Text the panel was built for, it is rebuilt only when the text changes
     while running:
         screen.blit(background, (0, 0)) # Blit background
 
@@ -318,10 +267,6 @@ def run_tutorial_screen():
             target.draw(screen)
             target.update()
 
-        panel = pygame.Surface((WIDTH, 100))
-        panel.fill((0, 0, 0))
-        font = pygame.font.Font("Fonts/AdventPro.ttf", 36)
-
         targets = [target for target in targets if not target.is_target_destroyed()]
         # Check for collisions between targets and projectiles
         for projectile in player.projectiles:
@@ -339,23 +284,25 @@ def run_tutorial_screen():
         player.update(cursor_position)  # Passing the targets list to the player's update method
         player.draw()
         player.update_projectiles()
+        projectile_pool.cull(player.projectiles, screen.get_rect())
         player.draw_projectiles()
 
         # Update target hit status and display appropriate panel text
         if portal_active:
-            font = pygame.font.Font("Fonts/AdventPro.ttf", 20)
+            panel_font_size = 20
             panel_text = "Target Hit! Time to face live enemies! Go through the portal."
             screen.blit(portal_image, portal_rect)
 
         if portal_active and player.rect.colliderect(portal_rect):
             running = False # Close window if Player goes through portal
 
-        text = font.render(panel_text, True, (255, 255, 255))
-        text_rect = text.get_rect(center=(WIDTH // 2, 50))
-
-        panel = pygame.Surface((WIDTH, 100)) # Blit text panel underneath the game window
-        panel.fill((0, 0, 0))
-        panel.blit(text, text_rect)
+        if panel_text != panel_shown_text: # Build the text panel underneath the game window
+            font = assets.get_font("Fonts/AdventPro.ttf", panel_font_size)
+            text = text_cache.render(font, panel_text, (255, 255, 255))
+            panel = pygame.Surface((WIDTH, 100))
+            panel.fill((0, 0, 0))
+            panel.blit(text, text.get_rect(center=(WIDTH // 2, 50)))
+            panel_shown_text = panel_text
         screen.blit(panel, (0, HEIGHT - 100))
 
         for event in pygame.event.get(): # If user tries to close window, running = False
@@ -378,28 +325,15 @@ def run_tutorial_screen():
             elif pause_option == "Exit":
                 running = False
 
-        # Get Player speed information
-        new_x = player.rect.x
-        new_y = player.rect.y
-
-        if player.moving_left:
-            new_x -= player.player_speed
-        if player.moving_right:
-            new_x += player.player_speed
-        if player.moving_up:
-            new_y -= player.player_speed
-        if player.moving_down:
-            new_y += player.player_speed
-
-        # Boundary check
-        player.rect.x = min(max(new_x, screen_boundary.left), screen_boundary.right - player.rect.width)
-        player.rect.y = min(max(new_y, screen_boundary.top), screen_boundary.bottom - player.rect.height)
-
+        # Move Player inside the play area
+        player.move_within(screen_boundary)
         player.move_player()
 
         pygame.display.flip()
         clock.tick(FPS)
 
+    projectile_pool.release_all(player.projectiles) # Shots still in flight go back to the shared pool
+
 
 def pause_screen(screen):
     """
@@ -412,7 +346,7 @@ def pause_screen(screen):
         str: The selected option.
     """
     # Create texts
-    font = pygame.font.Font("Fonts/Freedom-10eM.ttf", 40)
+    font = assets.get_font("Fonts/Freedom-10eM.ttf", 40)
     resume_text = font.render("Resume", True, BUTTON_COLOR)
     menu_text = font.render("Return to Menu", True, BUTTON_COLOR)
     resume_rect = resume_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
@@ -468,7 +402,7 @@ def pause_screen(screen):
         if selected_button:
             return selected_button
 
-def display_game_over_screen(player, enemies_killed, projectile_enemies_killed, waves, player_health):
+def display_game_over_screen(player, enemies_killed, projectile_enemies_killed, waves, player_health, final_wave):
     """
     Displays the game over screen with relevant statistics.
 
@@ -477,12 +411,14 @@ def display_game_over_screen(player, enemies_killed, projectile_enemies_killed,
         enemies_killed (int): Number of melee enemies killed.
         projectile_enemies_killed (int): Number of projectile enemies killed.
         waves (int): The wave number reached.
+        player_health (int): The health the player is restored to.
+        final_wave (int): The last wave of the game.
     """
-    font_large = pygame.font.Font(None, 60)
-    font_medium = pygame.font.Font(None, 40)
-    font_small = pygame.font.Font(None, 30)
+    font_large = assets.get_font(None, 60)
+    font_medium = assets.get_font(None, 40)
+    font_small = assets.get_font(None, 30)
 
-    if waves == 17: # If waves reached 17 (completed), the Player wins and win screen is displayed
+    if waves == final_wave: # If the final wave was reached (completed), the Player wins and win screen is displayed
         congrats_text = font_large.render("Congratulations! You Win!", True, (255, 255, 255))
     else: # If anything happens and 17 is not completed, a Game Over screen is displayed
         congrats_text = font_large.render("Game Over!", True, (255, 255, 255))
@@ -524,143 +460,54 @@ def display_game_over_screen(player, enemies_killed, projectile_enemies_killed,
         clock.tick(FPS)
 
 
-            
-def spawn_wave(enemies, projectile_enemies, fluid_enemies, wave_number, player):
+def main(argv=None):
     """
-    Spawns a wave of enemies based on the current wave number.
+    Starts pygame, opens the game window and runs the main menu loop.
 
     Args:
-        enemies (list): List of melee enemies.
-        projectile_enemies (list): List of projectile enemies.
-        fluid_enemies (list): List of fluid enemies.
-        wave_number (int): The current wave number.
-        player (Player): The player instance.
+        argv (list): The command line arguments, sys.argv is used if None.
     """
-    #Stage One Enemies Images
-    left_image_enemy = pygame.image.load("Images/EnemyAssets/StageOne/CombineCivilProtectionLeft.png")
-    right_image_enemy = pygame.image.load("Images/EnemyAssets/StageOne/CombineCivilProtectionRight.png")
-    
-    left_image_projectile_regular_enemy = pygame.image.load("Images/EnemyAssets/StageOne/CombineRegularSoldierLeft.png")
-    right_image_projectile_regular_enemy = pygame.image.load("Images/EnemyAssets/StageOne/CombineRegularSoldierRight.png")
-    
-    left_image_projectile_grunt = pygame.image.load("Images/EnemyAssets/StageOne/CombineHeavyLeft.png")
-    right_image_projectile_grunt = pygame.image.load("Images/EnemyAssets/StageOne/CombineHeavyRight.png")
-    
-    left_image_projectile_elite = pygame.image.load("Images/EnemyAssets/StageOne/CombineEliteLeft.png")
-    right_image_projectile_elite = pygame.image.load("Images/EnemyAssets/StageOne/CombineEliteRight.png")
-
-    #Stage Two Enemies Images
-    left_image_worker = pygame.image.load("Images/EnemyAssets/StageTwo/CombineWorkerLeft.png")
-    right_image_worker = pygame.image.load("Images/EnemyAssets/StageTwo/CombineWorkerRight.png")
-
-    left_image_hazmat = pygame.image.load("Images/EnemyAssets/StageTwo/CombineHazmatWorkerLeft.png")
-    right_image_hazmat = pygame.image.load("Images/EnemyAssets/StageTwo/CombineHazmatWorkerRight.png")
-
-    left_image_hazmat_2 = pygame.image.load("Images/EnemyAssets/StageTwo/CombineHazmatWorkerV2Left.png")
-    right_image_hazmat_2 = pygame.image.load("Images/EnemyAssets/StageTwo/CombineHazmatWorkerV2Right.png")
-
-    #Stage Three Enemies Images
-    left_image_qz_soldier = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZSoldierLeft.png")
-    right_image_qz_soldier = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZSoldierRight.png")
-
-    left_image_qz_commander = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZCommanderLeft.png")
-    right_image_qz_commander = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZCommanderRight.png")
-
-    left_image_qz_suppressor = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZSuppressorLeft.png")
-    right_image_qz_suppressor = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZSuppressorRight.png")
-
-    left_image_qz_charger = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZChargerLeft.png")
-    right_image_qz_charger = pygame.image.load("Images/EnemyAssets/StageThree/CombineQZChargerRight.png")
-
-    #Projectiles Images
-    regular_projectile_image = pygame.image.load("Images/Bullet.png")
-    grunt_projectile_image = pygame.image.load("Images/GruntBullet.png")
-    elite_projectile_image = pygame.image.load("Images/EliteBullet.png")
-    acid_projectile_image = pygame.image.load("Images/AcidicBullet.png")
-    flame_effect_left = pygame.image.load("Images/FlameEffectLeft.png")
-    flame_effect_right = pygame.image.load("Images/FlameEffectRight.png")
-
-    #Stage One
-    if wave_number <= 8:
-        num_enemies = wave_number + 3
-        num_regular_projectile_enemies = wave_number + 2
-        num_grunt_enemies = wave_number - 3
-        num_elite_enemies = wave_number - 5
-
-        for i in range(num_enemies):
-            enemy = Enemy(100 * (i + 1), 100 * (i + 1), 70, 3, player, left_image_enemy, right_image_enemy, 5, 360)
-            enemies.append(enemy)
-
-        for i in range(num_regular_projectile_enemies):
-            projectile_enemy = ProjectileEnemy(200 * (i + 1), 200 * (i + 1), 100, 0.7, player, left_image_projectile_regular_enemy, right_image_projectile_regular_enemy, 8, 60, regular_projectile_image, 6.5)
-            projectile_enemies.append(projectile_enemy)
-
-        for i in range(num_grunt_enemies):
-            grunt_enemy = ProjectileEnemy(300 * (i + 1), 300 * (i + 1), 300, 0.4, player, left_image_projectile_grunt, right_image_projectile_grunt, 10, 45, grunt_projectile_image, 4)
-            projectile_enemies.append(grunt_enemy)
-
-        for i in range(num_elite_enemies):
-            elite_enemy = ProjectileEnemy(400 * (i + 1), 400 * (i + 1), 200, 1.2, player, left_image_projectile_elite, right_image_projectile_elite, 20, 30, elite_projectile_image, 8)
-            projectile_enemies.append(elite_enemy)
-
-    #Stage 2
-    elif wave_number <= 13 and wave_number > 8:
-        num_worker = (wave_number) * 3 - 20
-        num_hazmat = wave_number + 3
-        num_hazmat_2 = wave_number - 5
-
-        for i in range(num_worker):
-            worker_enemy = FluidEnemy(100 * (i + 1), 100 * (i + 1), 25, 4, player, left_image_worker, right_image_worker, 10, 20, flame_effect_left, flame_effect_right, 300000)
-            fluid_enemies.append(worker_enemy)
-
-        for i in range(num_hazmat):
-            hazmat_enemy = ProjectileEnemy(400 * (i + 1), 400 * (i + 1), 100, 1.2, player, left_image_hazmat, right_image_hazmat, 20, 30, acid_projectile_image, 8)
-            projectile_enemies.append(hazmat_enemy)
-
-        for i in range(num_hazmat_2):
-            hazmat_enemy_2 = ProjectileEnemy(400 * (i + 1), 400 * (i + 1), 400, 3, player, left_image_hazmat_2, right_image_hazmat_2, 50, 160, grunt_projectile_image, 4)
-            projectile_enemies.append(hazmat_enemy_2)
-
-    #Stage 3
-    elif wave_number <= 17 and wave_number > 13:
-        num_qz_soldier = wave_number - 5
-        num_qz_commander = wave_number - 8
-        num_qz_suppressor = wave_number - 7
-        num_qz_charger = wave_number - 8
-
-        for i in range(num_qz_soldier):
-            qz_soldier_enemy = ProjectileEnemy(200 * (i + 1), 200 * (i + 1), 100, 0.7, player, left_image_qz_soldier, right_image_qz_soldier, 8, 40, regular_projectile_image, 7.5)
-            projectile_enemies.append(qz_soldier_enemy)
-
-        for i in range(num_qz_commander):
-            qz_commander_enemy = ProjectileEnemy(200 * (i + 1), 200 * (i + 1), 100, 0.7, player, left_image_qz_commander, right_image_qz_commander, 10, 60, regular_projectile_image, 7)
-            projectile_enemies.append(qz_commander_enemy)
-
-        for i in range(num_qz_suppressor):
-            qz_suppressor_enemy = ProjectileEnemy(300 * (i + 1), 300 * (i + 1), 300, 0.4, player, left_image_qz_suppressor, right_image_qz_suppressor, 8, 45, grunt_projectile_image, 5)
-            projectile_enemies.append(qz_suppressor_enemy)
-
-        for i in range(num_qz_charger):
-            qz_charger_enemy = ProjectileEnemy(400 * (i + 1), 400 * (i + 1), 200, 1.2, player, left_image_qz_charger, right_image_qz_charger, 3, 5, elite_projectile_image, 4)
-            projectile_enemies.append(qz_charger_enemy)
+    global game_screen, clock, dirty_rendering, profile_path, record_path, autopilot, use_atlas, startup_timing
+
+    parser = argparse.ArgumentParser(description="Half-Life themed wave shooter.")
+    parser.add_argument("--dirty", action="store_true", help="Only redraw and update the screen regions that changed during gameplay.")
+    parser.add_argument("--profile", metavar="PATH", help="Record the time of every frame phase and write it to PATH (.csv or .json) when a game ends.")
+    parser.add_argument("--record", metavar="PATH", help="Log the input of every tick to PATH, to be replayed with Replay.py.")
+    parser.add_argument("--no-atlas", action="store_true", help="Load every sprite as a separate image instead of from the texture atlas.")
+    parser.add_argument("--autopilot", action="store_true", help="Let the kiting bot play the game, e.g. to watch a long session.")
+    parser.add_argument("--startup-timing", action="store_true", help="Print how long every startup phase took until the first menu frame.")
+    args = parser.parse_args(argv)
+    dirty_rendering = args.dirty
+    profile_path = args.profile
+    record_path = args.record
+    autopilot = args.autopilot
+    use_atlas = not args.no_atlas
+    startup_timing = args.startup_timing
+    mark_startup("imports")
+
+    # Only the subsystems the game uses, pygame.init() would also start audio and joysticks
+    pygame.display.init()
+    pygame.font.init()
+    mark_startup("pygame init")
+    game_screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption('Game Menu')
+    clock = pygame.time.Clock()
+    mark_startup("window")
 
-    
-            
-    
+    #Main loop
+    selected = None
+    while selected != "Exit Game":
+        selected = create_main_menu(game_screen)
 
+        if selected == "Start":
+            run_start_screen()
 
+        if selected == "Tutorial":
+            run_tutorial_screen()
 
-#Main loop
-selected = None
-while selected != "Exit Game":
-    selected = create_main_menu(game_screen)
+    #Quit Pygame
+    pygame.quit()
 
-    if selected == "Start":
-        run_start_screen()
-    
-    if selected == "Tutorial":
-        run_tutorial_screen()
-        
 
-#Quit Pygame
-pygame.quit()
+if __name__ == "__main__":
+    main()
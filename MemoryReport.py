@@ -0,0 +1,157 @@
+import os
+import sys
+import argparse
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Reports run headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from Game import Game, WIDTH, HEIGHT
+from Projectile import Projectile
+from ProjectilePool import projectile_pool
+from EffectPool import effect_pool
+
+BULLET_ARRAYS = ("x", "y", "previous_x", "previous_y", "velocity_x", "velocity_y", "damage", "sprite") # One element per enemy bullet
+EFFECT_ARRAYS = ("left", "top", "remaining", "sprite", "layer") # One element per effect
+
+def attribute_values(entity):
+    """
+    Get the values of every attribute stored on an entity, in its __dict__ or its slots.
+
+    Args:
+        entity (object): The entity.
+
+    Returns:
+        list: The attribute values.
+    """
+    values = list(vars(entity).values()) if hasattr(entity, "__dict__") else []
+    for cls in type(entity).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if hasattr(entity, name):
+                values.append(getattr(entity, name))
+    return values
+
+def owned_size(value):
+    """
+    Get the bytes of an attribute value owned by a single entity: numbers, positions, lists, sets and rects.
+    Images, the player and shared type objects are referenced by many entities, so they count as 0.
+
+    Args:
+        value (object): The attribute value.
+
+    Returns:
+        int: The size in bytes.
+    """
+    if isinstance(value, bool) or (isinstance(value, int) and -5 <= value <= 256): # Singletons and cached small ints
+        return 0
+    if isinstance(value, (int, float, pygame.Rect)):
+        return sys.getsizeof(value)
+    if isinstance(value, (tuple, list, set)):
+        return sys.getsizeof(value) + sum(owned_size(item) for item in value)
+    return 0
+
+def footprint(entity):
+    """
+    Estimate the bytes a live entity takes: the instance, its __dict__ if it has one and the values it owns.
+
+    Args:
+        entity (object): The entity.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(vars(entity))
+    return size + sum(owned_size(value) for value in attribute_values(entity))
+
+def memory_report(game):
+    """
+    Sum the footprint of every live entity of a game by class. Pooled projectiles waiting for reuse are included.
+
+    Args:
+        game (Game): The game.
+
+    Returns:
+        dict: Class name -> count, total bytes and bytes per entity. Enemy bullets live in the BulletEngine's arrays
+              and splats and flames in the EffectPool's, "EnemyBullet" and "Effect" report their array bytes per slot.
+    """
+    entities = game.enemies + game.projectile_enemies + game.fluid_enemies + list(game.player.projectiles) + projectile_pool.free
+    report = {}
+    for entity in entities:
+        entry = report.setdefault(type(entity).__name__, {"count": 0, "bytes": 0})
+        entry["count"] += 1
+        entry["bytes"] += footprint(entity)
+
+    bullets = game.enemy_bullets
+    report["EnemyBullet"] = {"count": bullets.count, "bytes": sum(getattr(bullets, name).nbytes for name in BULLET_ARRAYS),
+                             "slots": len(bullets.x)}
+    report["Effect"] = {"count": effect_pool.count, "bytes": sum(getattr(effect_pool, name).nbytes for name in EFFECT_ARRAYS),
+                        "slots": len(effect_pool.remaining)}
+    for name, entry in report.items():
+        slots = entry.get("slots", entry["count"])
+        entry["bytes_per_entity"] = entry["bytes"] / slots if slots else 0
+    return report
+
+def allocated_per_entity(create, count=1000):
+    """
+    Measure with tracemalloc how many bytes creating an entity allocates, everything it owns included.
+
+    Args:
+        create (callable): Called with the index of the entity, returns a new entity.
+        count (int): The number of entities created for the measurement.
+
+    Returns:
+        float: The allocated bytes per entity.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create(index) for index in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(entities)
+    tracemalloc.stop()
+    return allocated / count
+
+def main(argv=None):
+    """
+    Print the memory taken by the entities of some waves from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Report the bytes taken per live entity, by class.")
+    parser.add_argument("--waves", nargs="+", type=int, help="The waves whose enemies are spawned, the last wave of every stage if not given.")
+    parser.add_argument("--projectiles", type=int, default=200, help="Player projectiles fired before the report.")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    game = Game()
+    waves = args.waves or [stage["last_wave"] for stage in game.waves.stages]
+    for wave_number in waves:
+        game.waves.spawn_wave(game.enemies, game.projectile_enemies, game.fluid_enemies, wave_number, game.player)
+    for index in range(args.projectiles):
+        game.player.shoot((index % WIDTH, 0))
+
+    print(f"{'class':>16} {'count':>6} {'total KB':>9} {'bytes/entity':>13} {'allocated/entity':>17}")
+    templates = {} # One template per class, to measure a fresh spawn with tracemalloc
+    for enemy in game.enemies + game.projectile_enemies + game.fluid_enemies:
+        templates.setdefault(type(enemy).__name__, enemy.enemy_type)
+    for name, entry in memory_report(game).items():
+        if name in templates:
+            template = templates[name]
+            allocated = allocated_per_entity(lambda index: template.spawn(index, index, game.player))
+        elif name == "Projectile":
+            image = game.player.projectiles.sprites()[0].image
+            allocated = allocated_per_entity(lambda index: Projectile(image, image.get_rect(center=(index, index)), [1, 1], 50))
+        else:
+            allocated = None
+        allocated_text = "-" if allocated is None else f"{allocated:.0f}"
+        print(f"{name:>16} {entry['count']:>6} {entry['bytes'] / 1024:>9.1f} {entry['bytes_per_entity']:>13.0f} {allocated_text:>17}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
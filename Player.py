@@ -1,6 +1,8 @@
 import pygame
-from Projectile import Projectile
-from Enemy import Enemy
+from AssetManager import assets
+from Projectile import ProjectileGroup
+from ProjectilePool import projectile_pool
+from EffectPool import effect_pool, SPLAT_IMAGE, OVERLAY
 import math
 
 class Player(pygame.sprite.Sprite):
@@ -17,16 +19,19 @@ class Player(pygame.sprite.Sprite):
         # Call the constructor of the parent class (pygame.sprite.Sprite)
         super().__init__()
         self.screen = screen
-        self.player_normal_left = pygame.image.load("Images/PlayerKunKunLeft.png")
-        self.player_normal_right = pygame.image.load("Images/PlayerKunKunRight.png")
+        self.player_normal_left = assets.get_image("Images/PlayerKunKunLeft.png")
+        self.player_normal_right = assets.get_image("Images/PlayerKunKunRight.png")
         self.player_image = self.player_normal_left
+        self.splat_image = assets.get_image(SPLAT_IMAGE)
         self.rect = self.player_image.get_rect()
         self.rect.center = (screen.get_width() // 2, screen.get_height() // 2)
+        self.x = float(self.rect.x) # Exact top left, the rect holds it rounded to whole pixels
+        self.y = float(self.rect.y)
+        self.previous_topleft = self.rect.topleft # Position at the previous simulation tick, used to interpolate drawing
 
-        self.projectiles = pygame.sprite.Group()   
+        self.projectiles = ProjectileGroup()
         self.projectile_damage = 50
 
-        self.is_hit = False
         self.is_killed = False
 
         self.player_speed = 2
@@ -37,16 +42,15 @@ class Player(pygame.sprite.Sprite):
 
         self.health = 30000
 
-        self.splat_timer = 0
-        self.splat_duration = 360
-        self.hit_position = None
+        self.splat_duration = 8 # Frames the splat of a hit is shown for
 
-    def update(self, cursor_position):
+    def update(self, cursor_position, dt=1):
         """
         Update the player's state.
 
         Args:
             cursor_position (tuple): The position of the cursor.
+            dt (float): The length of the simulation tick in 60 Hz frames.
         """
         direction_vector = pygame.math.Vector2(cursor_position[0] - self.rect.centerx, cursor_position[1] - self.rect.centery)
         angle = math.degrees(math.atan2(direction_vector.y, direction_vector.x))
@@ -56,48 +60,71 @@ class Player(pygame.sprite.Sprite):
         else:
             self.player_image = self.player_normal_left # If cursor is facing left half of screen, Player image is player_left
 
-        self.update_projectiles()
-
-        if self.splat_timer > 0:
-            self.splat_timer -= 1
-            if self.splat_timer == 0:
-                self.hit_position = None
-
-    def move_left(self):
+    def move_left(self, dt=1):
         """Move the player left."""
-        self.rect.x -= self.player_speed
+        self.x -= self.player_speed * dt
+        self.rect.x = self.x
 
-    def move_right(self):
+    def move_right(self, dt=1):
         """Move the player right."""
-        self.rect.x += self.player_speed
+        self.x += self.player_speed * dt
+        self.rect.x = self.x
 
-    def move_up(self):
+    def move_up(self, dt=1):
         """Move the player up."""
-        self.rect.y -= self.player_speed
+        self.y -= self.player_speed * dt
+        self.rect.y = self.y
 
-    def move_down(self):
+    def move_down(self, dt=1):
         """Move the player down."""
-        self.rect.y += self.player_speed
-
-    def draw(self):
-        """Draw the player on the screen."""
-        self.screen.blit(self.player_image, self.rect)
-        if self.hit_position is not None:
-            splat_image = pygame.image.load("Images/Splat.png")
-            splat_rect = splat_image.get_rect(center=self.hit_position)
-            self.screen.blit(splat_image, splat_rect)  # Draw the splat image above the enemy
-            self.hit_position = None
-
-    def move_player(self):
+        self.y += self.player_speed * dt
+        self.rect.y = self.y
+
+    def move_within(self, boundary, dt=1):
+        """
+        Move the player based on keyboard input while keeping it inside a boundary.
+
+        Args:
+            boundary (pygame.Rect): The area the player has to stay in.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        new_x = self.x
+        new_y = self.y
+        step = self.player_speed * dt
+
+        if self.moving_left:
+            new_x -= step
+        if self.moving_right:
+            new_x += step
+        if self.moving_up:
+            new_y -= step
+        if self.moving_down:
+            new_y += step
+
+        # Boundary check
+        self.x = min(max(new_x, boundary.left), boundary.right - self.rect.width)
+        self.y = min(max(new_y, boundary.top), boundary.bottom - self.rect.height)
+        self.rect.topleft = (self.x, self.y)
+
+    def draw(self, position=None):
+        """
+        Draw the player on the screen.
+
+        Args:
+            position (tuple): Where to draw the top left of the player, the current position if None.
+        """
+        self.screen.blit(self.player_image, self.rect if position is None else position)
+
+    def move_player(self, dt=1):
         """Move the player based on keyboard input."""
         if self.moving_left:
-            self.move_left()
+            self.move_left(dt)
         if self.moving_right:
-            self.move_right()
+            self.move_right(dt)
         if self.moving_up:
-            self.move_up()
+            self.move_up(dt)
         if self.moving_down:
-            self.move_down()
+            self.move_down(dt)
 
     def handle_movement(self, event):
         """
@@ -133,46 +160,42 @@ class Player(pygame.sprite.Sprite):
             target_position (tuple): The position of the target.
         """
         # Handle projectile speed and direction
-        projectile_image = pygame.image.load("Images/KunKunAttack.png")
-        projectile_rect = projectile_image.get_rect()
-        projectile_rect.center = self.rect.center
+        projectile_image = assets.get_image("Images/KunKunAttack.png")
         projectile_damage = self.projectile_damage
 
         direction = math.atan2(target_position[1] - self.rect.centery, target_position[0] - self.rect.centerx)
-        speed = 15 # Projectile speed
+        speed = 30 # Projectile speed (projectiles are updated once per frame)
         projectile_velocity = [speed * math.cos(direction), speed * math.sin(direction)]
 
-        self.projectiles.add(Projectile(self.screen, projectile_image, projectile_rect, projectile_velocity, projectile_damage))
+        self.projectiles.add(projectile_pool.acquire(projectile_image, self.rect.center, projectile_velocity, projectile_damage))
 
-    def draw_projectiles(self):
-        """Draw the player's projectiles on the screen."""
-        self.projectiles.draw(self.screen)
-
-    def handle_shooting(self, event):
+    def draw_projectiles(self, alpha=1):
         """
-        Handle mouse input for shooting projectiles.
+        Draw the player's projectiles on the screen.
 
         Args:
-            event (pygame.event.Event): The pygame event.
+            alpha (float): How far between the previous and the current tick to draw the projectiles.
         """
-        # Shoot at mouse position
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            self.shoot(mouse_pos)
+        if alpha >= 1:
+            self.projectiles.draw(self.screen)
+            return
 
-    def check_collision(self, enemies):
+        blit_sequence = []
+        for projectile in self.projectiles:
+            previous_x, previous_y = projectile.previous_topleft
+            blit_sequence.append((projectile.image, (previous_x + (projectile.rect.x - previous_x) * alpha, previous_y + (projectile.rect.y - previous_y) * alpha)))
+        self.screen.blits(blit_sequence, doreturn=False)
+
+    def handle_shooting(self, event):
         """
-        Check collision between player projectiles and enemies.
+        Handle mouse input for shooting projectiles.
 
         Args:
-            enemies (list): List of enemy instances.
+            event (pygame.event.Event): The pygame event.
         """
-        for projectile in self.projectiles:
-            for enemy in enemies:
-                if enemy.rect.colliderect(projectile.rect):
-                    enemy.receive_damage(projectile.damage)
-                    self.projectiles.remove(projectile)
-                    break  # Exit loop after handling one collision
+        # Shoot at mouse position (taken from the event so simulated clicks work without a window)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.shoot(event.pos)
 
     def handle_damage(self, damage):
         """
@@ -182,8 +205,7 @@ class Player(pygame.sprite.Sprite):
             damage (int): The amount of damage received.
         """
         self.health -= damage
-        self.hit_position = self.rect.center
-        self.splat_timer = self.splat_duration
+        effect_pool.emit(self.splat_image, self.rect.center, self.splat_duration, OVERLAY) # Splat drawn over the player
         if self.health <= 0:
             self.is_killed = True
 
@@ -205,9 +227,9 @@ class Player(pygame.sprite.Sprite):
         """
         return self.is_killed
 
-    def update_projectiles(self):
+    def update_projectiles(self, dt=1):
         """Update the player's projectiles."""
-        self.projectiles.update()
+        self.projectiles.update(dt)
 
     def get_health(self):
         """
@@ -218,17 +240,6 @@ class Player(pygame.sprite.Sprite):
         """
         return self.health
 
-    def render_health(self, screen):
-        """
-        Render the player's health on the screen.
-
-        Args:
-            screen (pygame.Surface): The game screen.
-        """
-        font = pygame.font.Font(None, 36) 
-        health_text = font.render(f"Health: {self.health}", True, (255, 255, 255))
-        screen.blit(health_text, (10, screen.get_height() - 50))
-
     def set_health(self, health):
         """Set Player health"""
         self.health = health
@@ -0,0 +1,188 @@
+import csv
+import json
+import time
+import numpy as np
+import pygame
+from AssetManager import assets
+from Hud import HUD_COLOR
+
+PHASES = ["events", "player", "enemies", "projectile_enemies", "fluid_enemies", "projectiles", "enemy_fire", "collision", "waves", "draw", "flip"]
+PHASE_INDEX = {phase: index for index, phase in enumerate(PHASES)}
+HISTOGRAM_BINS = 50 # 1 ms bins, the last one also counts every slower frame
+OVERLAY_REFRESH = 30 # Frames between two updates of the overlay text
+OVERLAY_WINDOW = 120 # Frames averaged by the overlay
+
+class Profiler:
+    """
+    Class measuring how long every phase of a frame takes, keeping the last frames in a ring buffer
+    and a frame time histogram per wave.
+
+    While disabled every call returns straight away, so the instrumentation can stay in the game loop.
+    """
+    def __init__(self, capacity=3600, enabled=False):
+        """
+        Initializes a new instance of the Profiler class.
+
+        Args:
+            capacity (int): The number of frames kept in the ring buffer.
+            enabled (bool): Whether frames are recorded from the start.
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(PHASES) + 1)) # Seconds per phase, the last column is the whole frame
+        self.sample_waves = np.zeros(capacity, dtype=np.int64)
+        self.frame_count = 0
+        self.histograms = {} # Wave number -> frame count per 1 ms bin
+        self.row = [0.0] * len(PHASES)
+        self.frame_start = 0.0
+        self.lap_start = 0.0
+
+        self.show_overlay = False
+        self.overlay = None
+
+    def toggle_overlay(self):
+        """
+        Show or hide the on-screen overlay. Showing it starts recording.
+        """
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            if not self.enabled: # Called mid-frame, begin_frame was skipped: the frame is timed from here on
+                self.frame_start = self.lap_start = time.perf_counter()
+                self.row = [0.0] * len(PHASES)
+            self.enabled = True
+            self.overlay = None
+
+    def begin_frame(self):
+        """
+        Start timing a frame.
+        """
+        if not self.enabled:
+            return
+        self.frame_start = self.lap_start = time.perf_counter()
+        self.row = [0.0] * len(PHASES)
+
+    def lap(self, phase):
+        """
+        Add the time since the last lap (or the start of the frame) to a phase.
+        A phase can be lapped several times per frame, e.g. once per simulation tick.
+
+        Args:
+            phase (str): One of PHASES.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.row[PHASE_INDEX[phase]] += now - self.lap_start
+        self.lap_start = now
+
+    def end_frame(self, wave_number):
+        """
+        Finish timing a frame and store it.
+
+        Args:
+            wave_number (int): The wave the frame belongs to.
+        """
+        if not self.enabled:
+            return
+        frame_time = time.perf_counter() - self.frame_start
+        index = self.frame_count % self.capacity
+        self.samples[index, :-1] = self.row
+        self.samples[index, -1] = frame_time
+        self.sample_waves[index] = wave_number
+        self.frame_count += 1
+
+        histogram = self.histograms.get(wave_number)
+        if histogram is None:
+            histogram = self.histograms[wave_number] = [0] * HISTOGRAM_BINS
+        histogram[min(int(frame_time * 1000), HISTOGRAM_BINS - 1)] += 1
+
+    def recent(self, frames=None):
+        """
+        Get the recorded frames in the order they were recorded.
+
+        Args:
+            frames (int): The number of most recent frames to return, every frame in the buffer if None.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The phase timings (one row per frame) and the wave of every frame.
+        """
+        stored = min(self.frame_count, self.capacity)
+        if frames is not None:
+            stored = min(stored, frames)
+        order = (np.arange(self.frame_count - stored, self.frame_count)) % self.capacity
+        return self.samples[order], self.sample_waves[order]
+
+    def summary(self):
+        """
+        Summarize the frames in the ring buffer.
+
+        Returns:
+            dict: mean, p50, p95 and p99 in milliseconds for every phase and the whole frame.
+        """
+        samples, _ = self.recent()
+        if len(samples) == 0:
+            return {}
+        summary = {}
+        for index, phase in enumerate(PHASES + ["frame"]):
+            column = samples[:, index] * 1000
+            p50, p95, p99 = np.percentile(column, [50, 95, 99]).tolist()
+            summary[phase] = {"mean": float(column.mean()), "p50": p50, "p95": p95, "p99": p99}
+        return summary
+
+    def draw(self, screen):
+        """
+        Draw the overlay with the average time of every phase over the last frames, if it is shown.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+        """
+        if not self.show_overlay:
+            return
+        if self.overlay is None or self.frame_count % OVERLAY_REFRESH == 0: # The text is only rebuilt every few frames
+            self.overlay = self.build_overlay()
+        screen.blit(self.overlay, (10, 10))
+
+    def build_overlay(self):
+        """
+        Render the overlay panel.
+
+        Returns:
+            pygame.Surface: The panel listing the average milliseconds of every phase.
+        """
+        font = assets.get_font(None, 20)
+        samples, _ = self.recent(OVERLAY_WINDOW)
+        means = samples.mean(axis=0) * 1000 if len(samples) else np.zeros(len(PHASES) + 1)
+        lines = [f"{phase:<20}{mean:6.2f} ms" for phase, mean in zip(PHASES + ["frame"], means.tolist())]
+
+        labels = [font.render(line, True, HUD_COLOR) for line in lines] # Not cached, the numbers rarely repeat
+        line_height = font.get_linesize()
+        panel = pygame.Surface((max(label.get_width() for label in labels) + 10, line_height * len(labels) + 10))
+        panel.set_alpha(180)
+        for row, label in enumerate(labels):
+            panel.blit(label, (5, 5 + row * line_height))
+        return panel
+
+    def export(self, path):
+        """
+        Write the recorded frames to a file: every frame of the ring buffer for .csv,
+        the phase summary and the per-wave histograms otherwise (JSON).
+
+        Args:
+            path (str): The output file path.
+        """
+        if path.endswith(".csv"):
+            samples, waves = self.recent()
+            with open(path, "w", newline="") as output_file:
+                writer = csv.writer(output_file)
+                writer.writerow(["wave"] + [f"{phase}_ms" for phase in PHASES + ["frame"]])
+                for wave_number, row in zip(waves.tolist(), (samples * 1000).tolist()):
+                    writer.writerow([wave_number] + [f"{value:.4f}" for value in row])
+            return
+
+        with open(path, "w") as output_file:
+            json.dump({
+                "frames": self.frame_count,
+                "phases": self.summary(),
+                "histogram_bin_ms": 1,
+                "histograms": {str(wave_number): counts for wave_number, counts in sorted(self.histograms.items())},
+            }, output_file, indent=2)
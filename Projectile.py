@@ -1,39 +1,75 @@
-import pygame
-
-class Projectile(pygame.sprite.Sprite):
+class Projectile:
     """
     Class representing a projectile in the game.
+    Its attributes are slots and it belongs to at most one ProjectileGroup, so it carries no pygame Sprite __dict__.
     """
-    def __init__(self, screen, image, rect, velocity, damage):
+    __slots__ = ("image", "rect", "x", "y", "previous_topleft", "velocity", "damage", "group")
+
+    def __init__(self, image, rect, velocity, damage):
         """
         Initializes a new instance of the Projectile class.
 
         Args:
-            screen (pygame.Surface): The game screen.
             image (pygame.Surface): The image representing the projectile.
             rect (pygame.Rect): The rectangular area of the projectile.
             velocity (list): The velocity of the projectile in the (x, y) direction.
             damage (int): The damage inflicted by the projectile.
         """ 
-        super().__init__()
-        self.screen = screen
         self.image = image
         self.rect = rect
+        self.x = float(rect.x) # Exact top left, the rect holds it rounded to whole pixels
+        self.y = float(rect.y)
+        self.previous_topleft = rect.topleft # Position before the last update, used to interpolate drawing
+        self.velocity = velocity
+        self.damage = damage
+        self.group = None # The ProjectileGroup holding the projectile
+
+    def reset(self, image, center, velocity, damage):
+        """
+        Reuses the projectile for a new shot.
+
+        Args:
+            image (pygame.Surface): The image representing the projectile.
+            center (tuple): The starting center of the projectile.
+            velocity (list): The velocity of the projectile in the (x, y) direction.
+            damage (int): The damage inflicted by the projectile.
+        """
+        self.image = image
+        self.rect.size = image.get_size()
+        self.rect.center = center
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+        self.previous_topleft = self.rect.topleft
         self.velocity = velocity
         self.damage = damage
 
-    def update(self):
+    def update(self, dt=1):
         """
         Updates the position of the projectile based on its velocity.
+
+        Args:
+            dt (float): The length of the simulation tick in 60 Hz frames.
         """
-        self.rect.x += self.velocity[0]
-        self.rect.y += self.velocity[1]
+        self.previous_topleft = self.rect.topleft
+        self.x += self.velocity[0] * dt # Moved in floats, so sub-pixel steps do not round away tick after tick
+        self.y += self.velocity[1] * dt
+        self.rect.topleft = (self.x, self.y)
 
-    def draw(self):
+    def draw(self, screen):
         """
         Draws the projectile on the game screen.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+        """
+        screen.blit(self.image, self.rect)
+
+    def kill(self):
+        """
+        Remove the projectile from its group, if it is in one.
         """
-        self.screen.blit(self.image, self.rect)
+        if self.group is not None:
+            self.group.remove(self)
 
     def handle_collision(self, target):
         """
@@ -53,3 +89,84 @@ class Projectile(pygame.sprite.Sprite):
             int: The damage value.
         """
         return self.damage
+
+class ProjectileGroup:
+    """
+    Class holding projectiles in the order they were added, with the parts of the pygame.sprite.Group interface
+    the game uses: adding, removing, iterating, updating and drawing.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the ProjectileGroup class.
+        """
+        self.projectiles = {} # Projectile -> None, a dict keeps the insertion order and removes in O(1)
+
+    def add(self, *projectiles):
+        """
+        Add projectiles to the group, taking them out of the group they were in.
+
+        Args:
+            *projectiles (Projectile): The projectiles to add.
+        """
+        for projectile in projectiles:
+            if projectile.group is not self:
+                projectile.kill()
+                projectile.group = self
+                self.projectiles[projectile] = None
+
+    def remove(self, projectile):
+        """
+        Remove a projectile from the group.
+
+        Args:
+            projectile (Projectile): The projectile to remove.
+        """
+        if projectile.group is self:
+            del self.projectiles[projectile]
+            projectile.group = None
+
+    def sprites(self):
+        """
+        Get the projectiles of the group.
+
+        Returns:
+            list: The projectiles, oldest first. Changing the group does not change the list.
+        """
+        return list(self.projectiles)
+
+    def update(self, dt=1):
+        """
+        Move every projectile of the group.
+
+        Args:
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        for projectile in self.projectiles:
+            projectile.update(dt)
+
+    def draw(self, screen):
+        """
+        Draw every projectile of the group with a single blits call.
+
+        Args:
+            screen (pygame.Surface): The game screen.
+        """
+        screen.blits([(projectile.image, projectile.rect) for projectile in self.projectiles], doreturn=False)
+
+    def __iter__(self):
+        """
+        Iterate over a copy of the group, so projectiles can be removed while iterating like with a sprite Group.
+        """
+        return iter(list(self.projectiles))
+
+    def __len__(self):
+        """
+        Get the number of projectiles in the group.
+        """
+        return len(self.projectiles)
+
+    def __contains__(self, projectile):
+        """
+        Check if a projectile is in the group.
+        """
+        return projectile in self.projectiles
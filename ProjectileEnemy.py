@@ -1,60 +1,68 @@
 import math
-import pygame
-from Projectile import Projectile
+from EffectPool import effect_pool
+
+STOP_DISTANCE = 100 # Distance threshold that ProjectileEnemies stop at
 
 class ProjectileEnemy:
     """
     Class representing projectile-firing enemies in the game.
+
+    The stats and images every enemy of a type has in common live on its EnemyTemplate,
+    an enemy only keeps its own state, in slots rather than a per-instance __dict__.
     """
+    __slots__ = ("x", "y", "health", "target", "enemy_type", "attack_timer", "player_in_range", "is_destroyed",
+                 "enemy_image", "rect", "previous_topleft")
     projectile_enemies_killed = 0
-    
-    def __init__(self, x, y, health, speed, target, left_image, right_image, damage, attack_cooldown, projectile_image, bullet_speed):
+    radius = 1000000 # Distance for tracking Player
+    splat_duration = 8 # Frames the splat of a hit is shown for
+
+    def __init__(self, x, y, enemy_type, target, health=None):
         """
         Initializes a new instance of the ProjectileEnemy class.
 
         Args:
             x (int): The initial x-coordinate of the enemy.
             y (int): The initial y-coordinate of the enemy.
-            health (int): The initial health of the enemy.
-            speed (float): The movement speed of the enemy.
+            enemy_type (EnemyTemplate): The type of the enemy: damage, attack cooldown, bullet speed and images.
             target (Player): The target player object.
-            left_image (pygame.Surface): The image of the enemy facing left.
-            right_image (pygame.Surface): The image of the enemy facing right.
-            damage (int): The damage dealt by the enemy.
-            attack_cooldown (int): The cooldown between enemy attacks.
-            projectile_image (pygame.Surface): The image of the projectile fired by the enemy.
-            bullet_speed (float): The speed of the projectile.
+            health (int): The initial health of the enemy, the health of its type if None.
         """
         self.x = x
         self.y = y
-        self.health = health
-        self.speed = speed
+        self.enemy_type = enemy_type
+        self.health = enemy_type.health if health is None else health
         self.target = target
-        self.radius = 1000000  # Distance for tracking Player
-        self.damage = damage
-        self.attack_cooldown = attack_cooldown
         self.attack_timer = 0
-        self.hit_position = None  # Initialize hit position
+        self.player_in_range = False
         self.is_destroyed = False
-        self.splat_duration = 120
-        self.splat_timer = 0
 
-        self.enemy_left_image = left_image
-        self.enemy_right_image = right_image
-        self.enemy_image = self.enemy_left_image
+        self.enemy_image = enemy_type.left_image
         self.rect = self.enemy_image.get_rect(topleft=(x, y))
+        self.previous_topleft = self.rect.topleft # Position at the previous simulation tick, used to interpolate drawing
 
-        self.projectiles = pygame.sprite.Group()
-        self.projectile_image = projectile_image
-        self.speed = bullet_speed
+    @property
+    def speed(self):
+        """float: The movement speed of the enemy. Projectile enemies walk as fast as their bullets fly."""
+        return self.enemy_type.bullet_speed
 
-    def move_towards(self, target_x, target_y):
+    @property
+    def damage(self):
+        """int: The damage dealt by the enemy's bullets."""
+        return self.enemy_type.damage
+
+    @property
+    def attack_cooldown(self):
+        """int: The cooldown between enemy attacks."""
+        return self.enemy_type.attack_cooldown
+
+    def move_towards(self, target_x, target_y, dt=1):
         """
         Move the projectile-firing enemy towards the specified target coordinates.
 
         Args:
             target_x (int): X-coordinate of the target.
             target_y (int): Y-coordinate of the target.
+            dt (float): The length of the simulation tick in 60 Hz frames.
         """
         delta_x = target_x - self.x
         delta_y = target_y - self.y
@@ -64,30 +72,68 @@ class ProjectileEnemy:
         if distance > 0:
             direction_x = delta_x / distance
             direction_y = delta_y / distance
-            
-            self.x += direction_x * self.speed
-            self.y += direction_y * self.speed
-            self.rect.topleft = (self.x, self.y)
 
-            if direction_x > 0: # If moving right, blit right image
-                self.enemy_image = self.enemy_right_image
-            elif direction_x < 0: # If moving left, blit left image
-                self.enemy_image = self.enemy_left_image
+            speed = self.enemy_type.bullet_speed
+            self.place(self.x + direction_x * speed * dt, self.y + direction_y * speed * dt, direction_x)
 
-    def draw(self, screen):
+    def follow(self, flow_field, target_x, target_y, dt=1):
+        """
+        Move the projectile-firing enemy one step in the direction of its cell of a flow field,
+        steering straight at the target next to it.
+
+        Args:
+            flow_field (FlowField): Field leading to the target.
+            target_x (int): X-coordinate of the target.
+            target_y (int): Y-coordinate of the target.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+        """
+        direction = flow_field.direction(self.x, self.y)
+        if direction is None:
+            self.move_towards(target_x, target_y, dt)
+            return
+        direction_x, direction_y = direction
+        speed = self.enemy_type.bullet_speed
+        self.place(self.x + direction_x * speed * dt, self.y + direction_y * speed * dt, direction_x)
+
+    def place(self, new_x, new_y, direction_x):
+        """
+        Move the projectile-firing enemy to new coordinates and face the direction of movement.
+
+        Args:
+            new_x (float): The new x-coordinate.
+            new_y (float): The new y-coordinate.
+            direction_x (float): The horizontal direction of movement.
+        """
+        self.x = new_x
+        self.y = new_y
+        self.rect.topleft = (self.x, self.y)
+
+        if direction_x > 0: # If moving right, blit right image
+            self.enemy_image = self.enemy_type.right_image
+        elif direction_x < 0: # If moving left, blit left image
+            self.enemy_image = self.enemy_type.left_image
+
+    def draw(self, screen, position=None):
         """
         Draw the projectile-firing enemy on the screen.
 
         Args:
             screen (pygame.Surface): The game screen.
+            position (tuple): Where to draw the top left of the enemy, the current position if None.
         """
-        if self.hit_position is not None: # If hit, blit splat image
-            splat_image = pygame.image.load("Images/Splat.png")
-            splat_rect = splat_image.get_rect(center=self.hit_position)
-            screen.blit(splat_image, splat_rect)
-            self.hit_position = None
+        sprites = []
+        self.collect_blits(sprites, position)
+        screen.blits(sprites, doreturn=False)
 
-        screen.blit(self.enemy_image, self.rect)
+    def collect_blits(self, sprites, position=None):
+        """
+        Add the sprite of the projectile-firing enemy to the blit sequence of the render pass. Its hit effects are drawn by the effect pool.
+
+        Args:
+            sprites (list): (image, position) pairs of the enemy sprites.
+            position (tuple): Where to draw the top left of the enemy, the current position if None.
+        """
+        sprites.append((self.enemy_image, self.rect if position is None else position))
 
     def is_enemy_destroyed(self):
         """
@@ -98,93 +144,73 @@ class ProjectileEnemy:
         """
         return self.is_destroyed
 
-    def receive_damage(self, damage, hit_position, screen):
+    def receive_damage(self, damage, hit_position):
         """
         Receive damage and update the projectile-firing enemy's state.
 
         Args:
             damage (int): The amount of damage received.
             hit_position (tuple): The position where the enemy was hit.
-            screen (pygame.Surface): The game screen.
         """
         self.health -= damage 
-        if self.health <= 0: # If hit and health lower or equal to zero, blit Splat and set is_destroyed to True
-            self.hit_position = hit_position
-            splat_image = pygame.image.load("Images/Splat.png")
-            splat_rect = splat_image.get_rect(center=self.hit_position)
-            screen.blit(splat_image, splat_rect)
-            
+        effect_pool.emit(self.enemy_type.splat_image, hit_position, self.splat_duration) # Splat where the enemy was hit
+        if self.health <= 0: # If hit and health lower or equal to zero, set is_destroyed to True
             self.is_destroyed = True
             ProjectileEnemy.projectile_enemies_killed += 1
-        else: # If not dead, record hit_position (Splat will be blitted in another function)
-            self.hit_position = hit_position
 
-    def update(self, projectiles, player, screen):
+    def update_movement(self, player, dt=1, flow_field=None):
         """
-        Update the projectile-firing enemy's state.
+        Move towards the player until within the stopping distance.
 
         Args:
-            projectiles (list): List of projectile instances.
             player (Player): The player object.
-            screen (pygame.Surface): The game screen.
+            dt (float): The length of the simulation tick in 60 Hz frames.
+            flow_field (FlowField): Field leading to the player, followed instead of steering straight at the player if given.
         """
+        # Distances are measured from the exact position, not the rounded rect, the same as the EnemyStore does
         player_coords = player.get_coords()
-        distance_to_player = math.sqrt((self.rect.x - player_coords[0]) ** 2 + (self.rect.y - player_coords[1]) ** 2)
-        distance_threshold = 100  # Distance threshold that ProjectileEnemies stop at
+        if flow_field is not None:
+            delta_x = self.x - player_coords[0]
+            delta_y = self.y - player_coords[1]
+            squared_distance = delta_x * delta_x + delta_y * delta_y # Compared squared, no square root per enemy
+            self.player_in_range = squared_distance <= self.radius * self.radius
+            if self.player_in_range and squared_distance > STOP_DISTANCE * STOP_DISTANCE:
+                self.follow(flow_field, player_coords[0], player_coords[1], dt)
+            return
 
-        if distance_to_player <= self.radius: # Makes sure Player is in range but not over the threshold 
-            if distance_to_player > distance_threshold:
-                self.move_towards(player_coords[0], player_coords[1])
-                
-            if self.attack_timer >= self.attack_cooldown:
-                self.fire_projectile(player, screen)
-                self.attack_timer = 0
+        distance_to_player = math.sqrt((self.x - player_coords[0]) ** 2 + (self.y - player_coords[1]) ** 2)
+        self.player_in_range = distance_to_player <= self.radius
+        if self.player_in_range and distance_to_player > STOP_DISTANCE: # Makes sure Player is in range but not over the threshold 
+            self.move_towards(player_coords[0], player_coords[1], dt)
 
-        self.attack_timer += 1 # Update projectiles and check for projectile collisions
-        self.projectiles.update()
-        self.projectiles.draw(screen)
-        self.check_collision(projectiles, screen)
-
-    def fire_projectile(self, player, screen):
+    def update_attack(self, player, bullets, dt=1):
         """
-        Fire a projectile towards the player.
+        Fire at the player if it is in range and the attack is not on cooldown.
 
         Args:
             player (Player): The player object.
-            screen (pygame.Surface): The game screen.
-        """
-        # Calculate direction and speed
-        delta_x = player.rect.centerx - self.rect.centerx
-        delta_y = player.rect.centery - self.rect.centery
-        angle = math.atan2(delta_y, delta_x)
-        velocity = [self.speed * math.cos(angle), self.speed * math.sin(angle)]
-        projectile_image = self.projectile_image
-        projectile_rect = projectile_image.get_rect(center=self.rect.center)
-        projectile = Projectile(screen, projectile_image, projectile_rect, velocity, self.damage) # Create Projectile
-        self.projectiles.add(projectile) # Add to list of projectiles fired by said ProjectileEnemy
-
-    def check_collision(self, projectiles, screen):
+            bullets (BulletEngine): The engine simulating every enemy bullet.
+            dt (float): The length of the simulation tick in 60 Hz frames.
         """
-        Check collision with Player projectiles.
+        if self.player_in_range and self.attack_timer >= self.enemy_type.attack_cooldown:
+            self.fire_projectile(player, bullets)
+            self.attack_timer = 0
 
-        Args:
-            projectiles (list): List of projectile instances.
-            screen (pygame.Surface): The game screen.
-        """
-        for projectile in projectiles: # Check for collisions between Player projectiles and self
-            if self.rect.colliderect(projectile.rect):
-                self.receive_damage(projectile.damage, projectile.rect.center, screen)
-                projectiles.remove(projectile) # Remove the projectiles if hit
-                break
+        self.attack_timer += dt
 
-    def deal_damage_to_player(self, player):
+    def fire_projectile(self, player, bullets):
         """
-        Deal damage to the player with projectiles.
+        Fire a projectile towards the player.
 
         Args:
             player (Player): The player object.
+            bullets (BulletEngine): The engine simulating every enemy bullet.
         """
-        for projectile in self.projectiles:
-            if projectile.rect.colliderect(player.rect):
-                player.handle_damage(self.damage)
-                projectile.kill() # Remove projectiles after collision
+        # Calculate direction and speed
+        delta_x = player.rect.centerx - self.rect.centerx
+        delta_y = player.rect.centery - self.rect.centery
+        angle = math.atan2(delta_y, delta_x)
+        center_x, center_y = self.rect.center
+        enemy_type = self.enemy_type
+        speed = enemy_type.bullet_speed
+        bullets.spawn(center_x, center_y, speed * math.cos(angle), speed * math.sin(angle), enemy_type.damage, enemy_type.projectile_image)
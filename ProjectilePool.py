@@ -0,0 +1,84 @@
+from Projectile import Projectile
+
+class ProjectilePool:
+    """
+    Class recycling Projectile objects so bullets are not allocated on every shot,
+    and removing projectiles that left the playfield.
+    """
+    def __init__(self, margin=50):
+        """
+        Initializes a new instance of the ProjectilePool class.
+
+        Args:
+            margin (int): How far outside the playfield a projectile may fly before it is culled.
+        """
+        self.margin = margin
+        self.free = []
+        self.live_count = 0
+
+    def acquire(self, image, center, velocity, damage):
+        """
+        Get a projectile, reusing a released one if possible.
+
+        Args:
+            image (pygame.Surface): The image representing the projectile.
+            center (tuple): The starting center of the projectile.
+            velocity (list): The velocity of the projectile in the (x, y) direction.
+            damage (int): The damage inflicted by the projectile.
+
+        Returns:
+            Projectile: The projectile, not yet in any group.
+        """
+        self.live_count += 1
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(image, center, velocity, damage)
+            return projectile
+        return Projectile(image, image.get_rect(center=center), velocity, damage)
+
+    def release(self, projectile):
+        """
+        Remove a projectile from its groups and keep it for reuse.
+
+        Args:
+            projectile (Projectile): The projectile to release.
+        """
+        projectile.kill()
+        self.live_count -= 1
+        self.free.append(projectile)
+
+    def release_all(self, group):
+        """
+        Release every projectile of a group.
+
+        Args:
+            group (ProjectileGroup): The group to empty.
+        """
+        for projectile in group.sprites():
+            self.release(projectile)
+
+    def cull(self, group, playfield):
+        """
+        Release the projectiles of a group that flew off the playfield (plus the margin).
+
+        Args:
+            group (ProjectileGroup): The group to cull.
+            playfield (pygame.Rect): The visible area of the game.
+        """
+        bounds = playfield.inflate(self.margin * 2, self.margin * 2)
+        for projectile in group.sprites():
+            if not bounds.colliderect(projectile.rect):
+                self.release(projectile)
+
+    def counts(self):
+        """
+        Get the number of projectiles in play and waiting for reuse.
+
+        Returns:
+            dict: The live and free projectile counts.
+        """
+        return {"live": self.live_count, "free": len(self.free)}
+
+
+# Shared pool of the player's projectiles, enemy bullets live in the BulletEngine
+projectile_pool = ProjectilePool()
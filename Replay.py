@@ -0,0 +1,105 @@
+import os
+import sys
+import time
+import zlib
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Replays run headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from Game import Game, WIDTH, HEIGHT
+from InputLog import InputReplayer
+from Profiler import Profiler
+
+def state_checksum(game):
+    """
+    Get a checksum of the game state, to check that two replays of the same log ended in the same state.
+
+    Args:
+        game (Game): The game.
+
+    Returns:
+        int: CRC32 of the wave, the kills, the player's health and position and every enemy position.
+    """
+    player = game.player
+    state = [game.wave_number, game.enemies_killed, game.projectile_enemies_killed, round(player.health), player.rect.topleft]
+    for enemy in game.enemies + game.projectile_enemies + game.fluid_enemies:
+        state.append((round(enemy.x, 3), round(enemy.y, 3), enemy.health))
+    return zlib.crc32(repr(state).encode())
+
+def replay(path, draw=False, use_enemy_store=False, profiler=None):
+    """
+    Step a game through a recorded input log as fast as possible.
+
+    Args:
+        path (str): The input log file path.
+        draw (bool): Whether every tick is also drawn (off-screen).
+        use_enemy_store (bool): Whether the game advances enemies through an EnemyStore.
+        profiler (Profiler): Records the phase timings of every tick, if given.
+
+    Returns:
+        dict: The number of ticks, the wall time, the outcome and the final state of the game.
+    """
+    replayer = InputReplayer(path)
+    game = Game(use_enemy_store=use_enemy_store, tick_rate=replayer.tick_rate, profiler=profiler)
+    screen = game.screen
+    if profiler is None:
+        profiler = game.profiler
+
+    outcome = None
+    start = time.perf_counter()
+    while not replayer.finished():
+        profiler.begin_frame()
+        outcome = game.step(replayer.next_input())
+        if draw:
+            game.draw(screen)
+            profiler.lap("draw")
+        profiler.end_frame(game.wave_number)
+        if outcome == "defeat" or outcome == "victory":
+            break
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "ticks": replayer.tick,
+        "seconds": elapsed,
+        "outcome": outcome,
+        "wave": game.wave_number,
+        "health": game.player.health,
+        "kills": game.enemies_killed + game.projectile_enemies_killed,
+        "checksum": state_checksum(game),
+    }
+    game.end()
+    return result
+
+def main(argv=None):
+    """
+    Replay an input log from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded game session headless and uncapped.")
+    parser.add_argument("log", help="An input log written by Main.py --record.")
+    parser.add_argument("--draw", action="store_true", help="Also draw every tick, to include rendering in the timing.")
+    parser.add_argument("--enemy-store", action="store_true", help="Advance enemies with the NumPy EnemyStore.")
+    parser.add_argument("--profile", metavar="PATH", help="Write the per-phase timings of every tick to PATH (.csv or .json).")
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    profiler = Profiler(enabled=True) if args.profile else None
+
+    result = replay(args.log, args.draw, args.enemy_store, profiler)
+    print(f"{result['ticks']} ticks in {result['seconds']:.2f} s ({result['ticks'] / result['seconds']:.0f} ticks/s)")
+    print(f"outcome: {result['outcome']}, wave: {result['wave']}, health: {int(result['health'])}, kills: {result['kills']}, checksum: {result['checksum']:08x}")
+
+    if profiler is not None:
+        profiler.export(args.profile)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,175 @@
+import os
+import gc
+import sys
+import csv
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Soak runs are headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from Game import Game, WIDTH, HEIGHT, BASE_TICK_RATE
+from Controller import KitingBot
+from AssetManager import assets
+from ProjectilePool import projectile_pool
+from Hud import text_cache
+from Benchmark import percentile, UNKILLABLE
+
+COLUMNS = ["game", "wave", "outcome", "ticks", "enemies", "tick_mean_ms", "tick_p99_ms", "memory_mb", "objects",
+           "cached_images", "cached_text", "pooled_projectiles"]
+
+def memory_usage():
+    """
+    Get the resident memory of the process.
+
+    Returns:
+        float: The resident memory in MB, or None where /proc is not available (only Linux has it).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+def play(game_index, draw, invulnerable, max_ticks, tick_rate, report):
+    """
+    Play one game with the kiting bot as fast as possible and report every wave.
+
+    Args:
+        game_index (int): The number of the game in the soak run.
+        draw (bool): Whether every tick is also drawn (off-screen).
+        invulnerable (bool): Whether the player can not die, so every wave is reached.
+        max_ticks (int): The number of ticks after which the game is stopped.
+        tick_rate (int): The simulation tick rate.
+        report (callable): Called with the row of every wave once it ends.
+
+    Returns:
+        str: "defeat", "victory" or "timeout".
+    """
+    game = Game(tick_rate=tick_rate, wave_delays=False)
+    if invulnerable:
+        game.player.set_health(UNKILLABLE)
+    bot = KitingBot()
+    screen = game.screen
+    clock = time.perf_counter
+
+    wave_number = game.wave_number
+    enemies = 0
+    tick_times = []
+    outcome = "timeout"
+
+    for _ in range(max_ticks):
+        start = clock()
+        result = game.step(bot.next_input(game))
+        if draw:
+            game.draw(screen)
+        tick_times.append(clock() - start)
+
+        if result == "defeat" or result == "victory":
+            outcome = result
+            break
+        if game.wave_number != wave_number: # The next wave spawned
+            if wave_number > 0:
+                report(wave_row(game_index, wave_number, "cleared", enemies, tick_times))
+            wave_number = game.wave_number
+            enemies = len(game.enemies) + len(game.projectile_enemies) + len(game.fluid_enemies)
+            tick_times = []
+
+    report(wave_row(game_index, wave_number, outcome, enemies, tick_times))
+    game.end()
+    return outcome
+
+def wave_row(game_index, wave_number, outcome, enemies, tick_times):
+    """
+    Build the report row of a wave, with the process state at its end.
+
+    Args:
+        game_index (int): The number of the game in the soak run.
+        wave_number (int): The wave.
+        outcome (str): How the wave ended.
+        enemies (int): The number of enemies the wave spawned.
+        tick_times (list): The seconds every tick of the wave took.
+
+    Returns:
+        dict: The values of COLUMNS.
+    """
+    ordered = sorted(tick_times) or [0]
+    memory = memory_usage()
+    pool = projectile_pool.counts()
+    return {
+        "game": game_index,
+        "wave": wave_number,
+        "outcome": outcome,
+        "ticks": len(tick_times),
+        "enemies": enemies,
+        "tick_mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "tick_p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+        "memory_mb": None if memory is None else round(memory, 1),
+        "objects": len(gc.get_objects()),
+        "cached_images": assets.stats()["images"],
+        "cached_text": text_cache.stats()["surfaces"],
+        "pooled_projectiles": pool["live"] + pool["free"],
+    }
+
+def main(argv=None):
+    """
+    Run a soak test from the command line.
+
+    Args:
+        argv (list): The command line arguments, sys.argv is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Play games back to back with the kiting bot to catch slowdowns and memory growth.")
+    parser.add_argument("--games", type=int, help="Number of games to play, unlimited if not given.")
+    parser.add_argument("--hours", type=float, help="Wall time after which no new game is started, unlimited if not given.")
+    parser.add_argument("--draw", action="store_true", help="Also draw every tick, to soak the rendering too.")
+    parser.add_argument("--invulnerable", action="store_true", help="Keep the player alive so every game goes through all waves.")
+    parser.add_argument("--max-minutes", type=float, default=30, help="Game time after which a game is stopped.")
+    parser.add_argument("--tick-rate", type=int, default=BASE_TICK_RATE)
+    parser.add_argument("--output", default="soak.csv", help="Where to write one CSV row per wave.")
+    args = parser.parse_args(argv)
+    if args.games is None and args.hours is None:
+        args.games = 1
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    max_ticks = int(args.max_minutes * 60 * args.tick_rate)
+    deadline = None if args.hours is None else time.perf_counter() + args.hours * 3600
+
+    rows = []
+    with open(args.output, "w", newline="") as output_file:
+        writer = csv.DictWriter(output_file, COLUMNS)
+        writer.writeheader()
+
+        def report(row):
+            """
+            Print a wave row and write it out straight away, so an interrupted run keeps its results.
+            """
+            rows.append(row)
+            writer.writerow(row)
+            output_file.flush()
+            print(" ".join(f"{column}={row[column]}" for column in COLUMNS))
+
+        game_index = 0
+        while (args.games is None or game_index < args.games) and (deadline is None or time.perf_counter() < deadline):
+            game_index += 1
+            play(game_index, args.draw, args.invulnerable, max_ticks, args.tick_rate, report)
+
+    # Compare the same wave in the first and the last game, growth there points at a leak or a slowdown
+    first = {row["wave"]: row for row in rows if row["game"] == 1}
+    last = {row["wave"]: row for row in rows if row["game"] == game_index}
+    print(f"\n{game_index} game(s), {len(rows)} waves, results written to {args.output}")
+    if game_index > 1:
+        for wave_number in sorted(first.keys() & last.keys()):
+            before = first[wave_number]
+            after = last[wave_number]
+            print(f"wave {wave_number:>2}: tick {before['tick_mean_ms']:.3f} -> {after['tick_mean_ms']:.3f} ms, "
+                  f"memory {before['memory_mb']} -> {after['memory_mb']} MB, objects {before['objects']} -> {after['objects']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
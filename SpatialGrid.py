@@ -0,0 +1,86 @@
+class SpatialGrid:
+    """
+    Class representing a uniform grid that buckets entities by the cell holding the center of their rect,
+    so overlap checks only have to look at entities in neighbouring cells.
+    """
+    def __init__(self, cell_size=64):
+        """
+        Initializes a new instance of the SpatialGrid class.
+
+        Args:
+            cell_size (int): The minimum width and height of a cell. It grows to fit the largest entity.
+        """
+        self.min_cell_size = cell_size
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, *groups):
+        """
+        Clear the grid and insert every entity of the given groups.
+
+        Args:
+            *groups (list): Lists of entities with a rect attribute.
+        """
+        # Cells have to be at least as large as the largest entity so overlapping entities are always in neighbouring cells
+        size = self.min_cell_size
+        for group in groups:
+            for entity in group:
+                rect = entity.rect
+                if rect.width > size:
+                    size = rect.width
+                if rect.height > size:
+                    size = rect.height
+        self.cell_size = size
+
+        cells = {}
+        for group in groups:
+            for entity in group:
+                center_x, center_y = entity.rect.center
+                key = (center_x // size, center_y // size)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [entity]
+                else:
+                    bucket.append(entity)
+        self.cells = cells
+
+    def query(self, rect):
+        """
+        Get the entities that may overlap a rectangle.
+
+        Entities may have moved up to half a cell since the last rebuild and still be found.
+
+        Args:
+            rect (pygame.Rect): The rectangle to look around. It must not be larger than a cell.
+
+        Returns:
+            list: The entities in the cells around the rectangle.
+        """
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cell_x in range((rect.left - size) // size, (rect.right + size) // size + 1):
+            for cell_y in range((rect.top - size) // size, (rect.bottom + size) // size + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is not None:
+                    found.extend(bucket)
+        return found
+
+    def find_collisions(self, items):
+        """
+        Find, for every item, the first entity in the grid whose rect collides with the item's rect.
+
+        Args:
+            items (iterable): Objects with a rect attribute, e.g. projectiles. Their rects must not be larger than a cell.
+
+        Returns:
+            list: (item, entity) pairs, with at most one pair per item.
+        """
+        collisions = []
+        for item in items:
+            rect = item.rect
+            for entity in self.query(rect):
+                if entity.rect.colliderect(rect):
+                    collisions.append((item, entity))
+                    break
+        return collisions
@@ -1,9 +1,12 @@
-import pygame
+from AssetManager import assets
 
 class Target:
     """
     Class representing a target in the game.
     """
+    __slots__ = ("image", "rect", "hit_effect_timer", "hit_effect_image", "destroy_effect_image", "health", "is_destroyed", "is_hit")
+    hit_effect_duration = 30
+
     def __init__(self, x, y, health, image, hit_image, destroy_image):
         """
         Initializes a new instance of the Target class.
@@ -16,12 +19,11 @@ class Target:
             hit_image (str): The image file path for the hit effect.
             destroy_image (str): The image file path for the destroy effect.
         """
-        self.image = pygame.image.load(image)
+        self.image = assets.get_image(image)
         self.rect = self.image.get_rect(center=(x, y))
-        self.hit_effect_duration = 30
         self.hit_effect_timer = 0
-        self.hit_effect_image = pygame.image.load(hit_image)
-        self.destroy_effect_image = pygame.image.load(destroy_image)
+        self.hit_effect_image = assets.get_image(hit_image)
+        self.destroy_effect_image = assets.get_image(destroy_image)
         self.health = health
         self.is_destroyed = False
         self.is_hit = False
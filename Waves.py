@@ -0,0 +1,203 @@
+import json
+from Enemy import Enemy
+from ProjectileEnemy import ProjectileEnemy
+from FluidEnemy import FluidEnemy
+from AssetManager import assets
+from EffectPool import SPLAT_IMAGE
+
+WAVE_TABLE_PATH = "Waves.json"
+FLOW_FIELD_CROWD = 25 # Live enemies from which they follow the flow field, if the wave table does not set flow_field_crowd
+IMAGE_KEYS = ("left_image", "right_image", "projectile_image", "left_flame_image", "right_flame_image") # Enemy entries naming sprites
+
+_definitions = {} # Parsed wave tables by path, every file is only read once
+
+def load_definitions(path):
+    """
+    Read a wave table file, parsing it on first use.
+
+    Args:
+        path (str): The JSON file path.
+
+    Returns:
+        dict: The "enemies" and "stages" of the table.
+    """
+    definitions = _definitions.get(path)
+    if definitions is None:
+        with open(path) as table_file:
+            definitions = _definitions[path] = json.load(table_file)
+    return definitions
+
+class EnemyTemplate:
+    """
+    Class holding everything needed to create an enemy of one type, with its images already loaded,
+    so spawning only has to fill in the position. Enemies keep a reference to their template for
+    the stats and images they share with their type.
+    """
+    def __init__(self, name, definition):
+        """
+        Initializes a new instance of the EnemyTemplate class.
+
+        Args:
+            name (str): The enemy type name used by the stage groups.
+            definition (dict): The enemy entry of the wave table: type ("melee", "projectile" or "fluid"),
+                               health, speed, damage, attack_cooldown, left_image and right_image,
+                               plus projectile_image and bullet_speed or the flame images and flame_duration (frames a flame is shown for).
+        """
+        self.name = name
+        self.kind = definition["type"]
+        self.health = definition["health"]
+        self.speed = definition["speed"]
+        self.damage = definition["damage"]
+        self.attack_cooldown = definition["attack_cooldown"]
+        self.left_image = assets.get_image(definition["left_image"])
+        self.right_image = assets.get_image(definition["right_image"])
+        self.splat_image = assets.get_image(SPLAT_IMAGE) # Shown where an enemy of the type is hit
+
+        if self.kind == "projectile":
+            self.projectile_image = assets.get_image(definition["projectile_image"])
+            self.bullet_speed = definition["bullet_speed"]
+        elif self.kind == "fluid":
+            self.left_flame_image = assets.get_image(definition["left_flame_image"])
+            self.right_flame_image = assets.get_image(definition["right_flame_image"])
+            self.flame_duration = definition["flame_duration"]
+
+    def spawn(self, x, y, player, health=None):
+        """
+        Create an enemy of this type. The enemy refers to the template for everything it shares with its type.
+
+        Args:
+            x (int): The x-coordinate of the enemy.
+            y (int): The y-coordinate of the enemy.
+            player (Player): The player targeted by the enemy.
+            health (int): The initial health of the enemy, the health of the type if None.
+
+        Returns:
+            Enemy, ProjectileEnemy or FluidEnemy: The new enemy.
+        """
+        if self.kind == "projectile":
+            return ProjectileEnemy(x, y, self, player, health)
+        if self.kind == "fluid":
+            return FluidEnemy(x, y, self, player, health)
+        return Enemy(x, y, self, player, health)
+
+class WaveTable:
+    """
+    Class compiling the declarative wave table into enemy templates and spawning waves from it.
+
+    The table lists the enemy types and the stages in order. A stage lasts until its last_wave and has a map and
+    groups of enemies: every group spawns max(0, per_wave * wave + offset) enemies of one type on a diagonal,
+    the i-th one at (spacing * (i + 1), spacing * (i + 1)). The optional flow_field_crowd is the number of live enemies
+    from which they follow the flow field instead of each steering straight at the player.
+    """
+    def __init__(self, path=WAVE_TABLE_PATH):
+        """
+        Initializes a new instance of the WaveTable class.
+
+        Args:
+            path (str): The JSON file holding the wave table.
+        """
+        definitions = load_definitions(path)
+        self.enemy_definitions = definitions["enemies"]
+        self.templates = {} # Compiled the first time an enemy type spawns, so a new game does not load every stage's images
+        self.stages = definitions["stages"]
+        self.final_wave = self.stages[-1]["last_wave"]
+        self.flow_field_crowd = definitions.get("flow_field_crowd", FLOW_FIELD_CROWD)
+
+    def template(self, name):
+        """
+        Get the template of an enemy type, compiling it on first use.
+
+        Args:
+            name (str): The enemy type name.
+
+        Returns:
+            EnemyTemplate: The template.
+        """
+        template = self.templates.get(name)
+        if template is None:
+            template = self.templates[name] = EnemyTemplate(name, self.enemy_definitions[name])
+        return template
+
+    def sprite_paths(self):
+        """
+        Get the sprite of every enemy type, bullets and flames included.
+
+        Returns:
+            list: The image file paths, without duplicates.
+        """
+        paths = {}
+        for definition in self.enemy_definitions.values():
+            for key in IMAGE_KEYS:
+                if key in definition:
+                    paths[definition[key]] = True
+        return list(paths)
+
+    def preload(self, wave_number=None):
+        """
+        Start decoding the map and enemy sprites of a stage in the background.
+
+        Args:
+            wave_number (int): A wave of the stage to preload, every stage if None.
+        """
+        stages = self.stages if wave_number is None else [self.stage(wave_number)]
+        for stage in stages:
+            if stage is None:
+                continue
+            assets.load_async([stage["map"]], alpha=False)
+            for group in stage["groups"]:
+                definition = self.enemy_definitions[group["enemy"]]
+                assets.load_async([definition[key] for key in IMAGE_KEYS if key in definition])
+
+    def stage(self, wave_number):
+        """
+        Get the stage a wave belongs to.
+
+        Args:
+            wave_number (int): The wave.
+
+        Returns:
+            dict: The stage entry of the table, or None after the final stage.
+        """
+        for stage in self.stages:
+            if wave_number <= stage["last_wave"]:
+                return stage
+        return None
+
+    def stage_map(self, wave_number):
+        """
+        Get the floor map for a wave.
+
+        Args:
+            wave_number (int): The wave. Wave 0, before the game starts, uses the first stage's map.
+
+        Returns:
+            pygame.Surface: The map image, or None after the final stage.
+        """
+        stage = self.stage(wave_number)
+        if stage is None:
+            return None
+        return assets.get_image(stage["map"], alpha=False)
+
+    def spawn_wave(self, enemies, projectile_enemies, fluid_enemies, wave_number, player):
+        """
+        Spawns a wave of enemies based on the wave number.
+
+        Args:
+            enemies (list): List of melee enemies.
+            projectile_enemies (list): List of projectile enemies.
+            fluid_enemies (list): List of fluid enemies.
+            wave_number (int): The wave to spawn.
+            player (Player): The player instance.
+        """
+        stage = self.stage(wave_number)
+        if stage is None:
+            return
+        lists = {"melee": enemies, "projectile": projectile_enemies, "fluid": fluid_enemies}
+
+        for group in stage["groups"]:
+            template = self.template(group["enemy"])
+            count = group["count"]["per_wave"] * wave_number + group["count"]["offset"]
+            spacing = group["spacing"]
+            target = lists[template.kind]
+            for i in range(count): # A negative count spawns nothing, the group only appears in later waves
+                target.append(template.spawn(spacing * (i + 1), spacing * (i + 1), player))
@@ -0,0 +1,49 @@
+import os
+import sys
+import shutil
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # Tests run headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY)
+
+import pygame
+from Atlas import GAMEPLAY_SPRITES
+from Waves import load_definitions, IMAGE_KEYS, WAVE_TABLE_PATH
+
+@pytest.fixture(scope="session")
+def display():
+    """
+    Set a display mode, images can only be converted once one is set.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.display.quit()
+
+@pytest.fixture(scope="session")
+def game_directory(display, tmp_path_factory):
+    """
+    Run the test from a directory holding the wave table and a plain stand-in for every sprite and map it names,
+    so games can be played without the art.
+    """
+    directory = tmp_path_factory.mktemp("game")
+    shutil.copy(os.path.join(REPOSITORY, WAVE_TABLE_PATH), directory)
+    definitions = load_definitions(os.path.join(REPOSITORY, WAVE_TABLE_PATH))
+
+    sizes = {path: (48, 48) for path in GAMEPLAY_SPRITES}
+    for definition in definitions["enemies"].values():
+        sizes.update((definition[key], (48, 48)) for key in IMAGE_KEYS if key in definition)
+    sizes.update((stage["map"], (800, 600)) for stage in definitions["stages"])
+    for path, size in sizes.items():
+        os.makedirs(directory / os.path.dirname(path), exist_ok=True)
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        image.fill((200, 50, 50, 255))
+        pygame.image.save(image, str(directory / path))
+
+    working_directory = os.getcwd()
+    os.chdir(directory)
+    yield directory
+    os.chdir(working_directory)
@@ -0,0 +1,33 @@
+import time
+import pygame
+from AssetManager import AssetManager
+
+def save_image(directory, name):
+    """
+    Write a small image file and return its path.
+    """
+    path = str(directory / name)
+    pygame.image.save(pygame.Surface((4, 4)), path)
+    return path
+
+def test_background_loads_are_not_counted_as_misses(tmp_path):
+    assets = AssetManager()
+    path = save_image(tmp_path, "background.png")
+    assets.load_async([path])
+    while assets.collect():
+        time.sleep(0.001)
+
+    assets.get_image(path)
+    assert assets.stats()["misses"] == 0
+    assert assets.stats()["background_loads"] == 1
+    assert assets.stats()["hits"] == 1
+
+def test_loads_on_the_main_thread_are_misses(tmp_path):
+    assets = AssetManager()
+    path = save_image(tmp_path, "sprite.png")
+    assets.get_image(path)
+    assets.get_image(path)
+    assert (assets.stats()["misses"], assets.stats()["hits"]) == (1, 1)
+
+    assets.reset_stats()
+    assert (assets.stats()["misses"], assets.stats()["hits"], assets.stats()["background_loads"]) == (0, 0, 0)
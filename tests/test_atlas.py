@@ -0,0 +1,18 @@
+import time
+import pygame
+from AssetManager import assets
+from Atlas import load_or_build_atlas, sprite_paths
+
+def test_atlas_built_in_the_background_serves_the_same_pixels(game_directory, tmp_path):
+    paths = sprite_paths()
+    manifest_path = str(tmp_path / "atlas" / "manifest.json")
+    assert load_or_build_atlas(paths, manifest_path, background=True)
+    while assets.pending_atlas is not None:
+        assets.collect()
+        time.sleep(0.001)
+
+    for path in paths:
+        sprite = assets.get_image(path)
+        assert sprite.get_parent() is not None # A region of an atlas page
+        original = pygame.image.load(path).convert_alpha()
+        assert pygame.image.tobytes(sprite, "RGBA") == pygame.image.tobytes(original, "RGBA")
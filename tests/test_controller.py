@@ -0,0 +1,24 @@
+import pytest
+import pygame
+from Game import Game
+from Controller import Controller, ScriptedPlayer, KitingBot
+
+def test_controllers_must_implement_next_input():
+    with pytest.raises(TypeError):
+        Controller()
+
+@pytest.mark.parametrize("make_controller", [lambda: ScriptedPlayer(1), KitingBot])
+def test_controllers_fire_as_often_at_every_tick_rate(game_directory, make_controller):
+    shots = {}
+    for tick_rate in (60, 120, 144):
+        game = Game(tick_rate=tick_rate, wave_delays=False)
+        controller = make_controller()
+        shots[tick_rate] = 0
+        for _ in range(tick_rate * 5): # Five seconds of play
+            inputs = controller.next_input(game)
+            shots[tick_rate] += sum(1 for event in inputs.events if event.type == pygame.MOUSEBUTTONDOWN)
+            game.step(inputs)
+        game.end()
+    assert shots[60] > 0
+    assert shots[120] == pytest.approx(shots[60], abs=2)
+    assert shots[144] == pytest.approx(shots[60], abs=2)
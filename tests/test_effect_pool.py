@@ -0,0 +1,49 @@
+import pygame
+from EffectPool import EffectPool, GROUND, OVERLAY
+
+IMAGE = pygame.Surface((2, 2))
+
+def centers(pool):
+    """
+    Get the x-coordinate of the center of every live effect, in slot order.
+    """
+    return [left + 1 for left in pool.left[:pool.count].tolist()]
+
+def test_expired_effects_are_removed():
+    pool = EffectPool(capacity=8)
+    pool.emit(IMAGE, (10, 0), 2)
+    pool.emit(IMAGE, (20, 0), 5, OVERLAY)
+    pool.update(3)
+    assert centers(pool) == [20]
+    assert pool.layer[0] == OVERLAY
+    pool.update(2)
+    assert pool.count == 0
+
+def test_same_effect_at_the_same_spot_restarts_its_lifetime():
+    pool = EffectPool(capacity=8)
+    pool.emit(IMAGE, (10, 10), 4)
+    pool.update(3)
+    pool.emit(IMAGE, (10, 10), 4)
+    pool.emit(IMAGE, (10, 10), 4, GROUND)
+    assert pool.count == 1
+    assert pool.remaining[0] == 4
+
+def test_a_full_pool_replaces_the_oldest_effect():
+    pool = EffectPool(capacity=3)
+    for x in (10, 20, 30, 40, 50):
+        pool.emit(IMAGE, (x, 0), 10)
+    assert pool.count == 3
+    assert sorted(centers(pool)) == [30, 40, 50]
+
+def test_eviction_stays_oldest_first_after_expired_effects_are_removed():
+    pool = EffectPool(capacity=4)
+    for x, lifetime in ((10, 10), (20, 10), (30, 1), (40, 10), (50, 10), (60, 10)):
+        pool.emit(IMAGE, (x, 0), lifetime)
+    assert centers(pool) == [50, 60, 30, 40] # 10 and 20 made room for 50 and 60
+
+    pool.update(1) # 30 expires
+    assert centers(pool) == [40, 50, 60]
+
+    pool.emit(IMAGE, (70, 0), 10)
+    pool.emit(IMAGE, (80, 0), 10) # Full again, 40 is the oldest
+    assert sorted(centers(pool)) == [50, 60, 70, 80]
@@ -0,0 +1,34 @@
+import pytest
+from Game import Game
+from Controller import ScriptedPlayer
+from Replay import state_checksum
+
+def play(seed, use_enemy_store, ticks=6000):
+    """
+    Play a game with a scripted player and take a checksum of its state every tick.
+
+    Returns:
+        Tuple[list, int]: The checksums and the most FluidEnemies on screen at once.
+    """
+    game = Game(use_enemy_store=use_enemy_store, wave_delays=False)
+    player = ScriptedPlayer(seed)
+    checksums = []
+    most_fluid_enemies = 0
+    for _ in range(ticks):
+        outcome = game.step(player.next_input(game))
+        checksums.append(state_checksum(game))
+        most_fluid_enemies = max(most_fluid_enemies, len(game.fluid_enemies))
+        if outcome == "defeat" or outcome == "victory":
+            break
+    game.end()
+    return checksums, most_fluid_enemies
+
+@pytest.mark.parametrize("seed", [1, 3, 5])
+def test_enemy_store_plays_like_the_enemy_objects(game_directory, seed):
+    with_objects, most_fluid_enemies = play(seed, use_enemy_store=False)
+    with_store, _ = play(seed, use_enemy_store=True)
+    assert most_fluid_enemies > 1, "the game has to last into stage two, where FluidEnemies are pushed out of each other"
+
+    diverged = next((tick for tick, (expected, actual) in enumerate(zip(with_objects, with_store)) if expected != actual), None)
+    assert diverged is None, f"the states differ from tick {diverged} on"
+    assert len(with_objects) == len(with_store)
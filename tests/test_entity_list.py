@@ -0,0 +1,39 @@
+from EntityList import EntityList
+
+class Entity:
+    """
+    Stand-in entity, only is_destroyed matters to the list.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.is_destroyed = False
+
+def test_compact_removes_the_destroyed_entities_in_order():
+    entities = EntityList(Entity(name) for name in "abcde")
+    for entity in entities:
+        if entity.name in "bd":
+            entity.is_destroyed = True
+            entities.mark_dead()
+
+    removed = entities.compact()
+    assert [entity.name for entity in removed] == ["b", "d"]
+    assert [entity.name for entity in entities] == ["a", "c", "e"]
+    assert entities.dead_count == 0
+
+def test_compact_does_nothing_until_an_entity_is_marked_dead():
+    entities = EntityList([Entity("a"), Entity("b")])
+    entities[0].is_destroyed = True
+    assert entities.compact() == []
+    assert len(entities) == 2
+
+    entities.mark_dead()
+    assert len(entities.compact()) == 1
+    assert entities.compact() == []
+
+def test_compact_keeps_the_list_object():
+    entities = EntityList([Entity("a")])
+    alias = entities
+    entities[0].is_destroyed = True
+    entities.mark_dead()
+    entities.compact()
+    assert alias is entities and len(alias) == 0
@@ -0,0 +1,49 @@
+import numpy as np
+from FlowField import FlowField
+
+def test_open_field_points_straight_at_the_target():
+    field = FlowField(320, 320, cell_size=32)
+    assert field.update(16, 16)
+    assert field.direction(9 * 32, 16) == (-1.0, 0.0)
+    assert field.direction(16, 9 * 32) == (0.0, -1.0)
+    direction_x, direction_y = field.direction(9 * 32, 9 * 32)
+    assert np.isclose(direction_x, direction_y) and direction_x < 0
+
+def test_enemies_next_to_the_target_steer_straight_at_it():
+    field = FlowField(320, 320, cell_size=32)
+    field.update(160, 160)
+    assert field.direction(160 + 32, 160) is None
+    assert field.direction(160 + 64, 160) is not None
+
+def test_field_is_only_rebuilt_when_the_target_changes_cell():
+    field = FlowField(320, 320, cell_size=32)
+    assert field.update(10, 10)
+    assert not field.update(20, 20)
+    assert field.update(40, 10)
+    assert field.rebuild_count == 2
+
+def test_paths_go_around_walls():
+    # A wall on column 5 from the top down to row 8, the target on its left, the enemy on its right
+    field = FlowField(320, 320, cell_size=32, blocked=[(5, row) for row in range(9)])
+    field.update(3 * 32, 16)
+    assert field.distance[0, 7] > 4 # Longer than the straight line through the wall
+    assert field.direction(7 * 32, 16)[1] > 0 # It first heads down, to get around the wall
+    assert np.isinf(field.distance[0, 5])
+
+def test_unreachable_cells_steer_straight_at_the_target():
+    # Cell (0, 0) is boxed in
+    field = FlowField(320, 320, cell_size=32, blocked=[(1, 0), (0, 1), (1, 1)])
+    field.update(300, 300)
+    assert field.direction(0, 0) is None
+
+def test_sample_matches_direction():
+    field = FlowField(320, 320, cell_size=32, blocked=[(5, row) for row in range(9)])
+    field.update(100, 30)
+    x = np.array([10.0, 250.0, 300.0, 150.0])
+    y = np.array([300.0, 20.0, 310.0, 40.0])
+    direction_x, direction_y, steer = field.sample(x, y)
+    for index in range(len(x)):
+        expected = field.direction(x[index], y[index])
+        assert steer[index] == (expected is not None)
+        if expected is not None:
+            assert (direction_x[index], direction_y[index]) == expected
@@ -0,0 +1,36 @@
+import pytest
+import pygame
+from Game import FrameInput
+from InputLog import InputRecorder, InputReplayer
+
+def test_recorded_input_replays_tick_for_tick(tmp_path):
+    path = str(tmp_path / "session.log")
+    inputs = [
+        FrameInput([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w)], (10, 20)),
+        FrameInput([], (10, 20)),
+        FrameInput([pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(300, 200)),
+                    pygame.event.Event(pygame.KEYUP, key=pygame.K_w)], (300, 200)),
+        FrameInput([], (300, 200)),
+        FrameInput([], (300, 200)), # The session ends on ticks without input
+    ]
+    recorder = InputRecorder(path, 120)
+    for frame_input in inputs:
+        recorder.record(frame_input)
+    recorder.close()
+
+    replayer = InputReplayer(path)
+    assert replayer.tick_rate == 120
+    replayed = []
+    while not replayer.finished():
+        replayed.append(replayer.next_input())
+
+    assert len(replayed) == len(inputs)
+    for expected, actual in zip(inputs, replayed):
+        assert actual.cursor_position == expected.cursor_position
+        assert [(event.type, event.dict) for event in actual.events] == [(event.type, event.dict) for event in expected.events]
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "other.log"
+    path.write_bytes(b"PNG\x00" + bytes(16))
+    with pytest.raises(ValueError):
+        InputReplayer(str(path))
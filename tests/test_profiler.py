@@ -0,0 +1,13 @@
+from Profiler import Profiler
+
+def test_showing_the_overlay_mid_frame_times_the_frame_from_then_on():
+    profiler = Profiler()
+    profiler.begin_frame() # Skipped, the profiler is off
+    profiler.lap("events")
+    profiler.toggle_overlay() # F3 pressed while handling the frame's events
+    profiler.lap("player")
+    profiler.end_frame(1)
+
+    frame = profiler.summary()["frame"]
+    assert profiler.frame_count == 1
+    assert frame["mean"] < 1000 # Milliseconds, not the whole perf_counter value
@@ -0,0 +1,51 @@
+import pygame
+from Projectile import ProjectileGroup
+from ProjectilePool import ProjectilePool
+
+IMAGE = pygame.Surface((4, 4))
+PLAYFIELD = pygame.Rect(0, 0, 800, 600)
+
+def fire(pool, group, count, center=(100, 100)):
+    """
+    Acquire projectiles from the pool into a group.
+    """
+    projectiles = [pool.acquire(IMAGE, center, [1, 0], 10) for _ in range(count)]
+    group.add(*projectiles)
+    return projectiles
+
+def test_acquire_and_release_update_the_counts():
+    pool = ProjectilePool()
+    group = ProjectileGroup()
+    projectiles = fire(pool, group, 3)
+    assert pool.counts() == {"live": 3, "free": 0}
+
+    pool.release(projectiles[0])
+    assert pool.counts() == {"live": 2, "free": 1}
+    assert projectiles[0] not in group
+
+    pool.release_all(group)
+    assert pool.counts() == {"live": 0, "free": 3}
+    assert len(group) == 0
+
+def test_released_projectiles_are_reused():
+    pool = ProjectilePool()
+    group = ProjectileGroup()
+    first, = fire(pool, group, 1)
+    pool.release(first)
+
+    second = pool.acquire(IMAGE, (300, 200), [0, 2], 25)
+    assert second is first
+    assert second.rect.center == (300, 200)
+    assert (second.velocity, second.damage) == ([0, 2], 25)
+    assert pool.counts() == {"live": 1, "free": 0}
+
+def test_cull_releases_projectiles_past_the_margin():
+    pool = ProjectilePool(margin=50)
+    group = ProjectileGroup()
+    inside, = fire(pool, group, 1, center=(400, 300))
+    in_margin, = fire(pool, group, 1, center=(-30, 300))
+    outside, = fire(pool, group, 1, center=(-100, 300))
+
+    pool.cull(group, PLAYFIELD)
+    assert set(group) == {inside, in_margin}
+    assert pool.counts() == {"live": 2, "free": 1}
@@ -0,0 +1,48 @@
+import pygame
+from SpatialGrid import SpatialGrid
+
+class Box:
+    """
+    Stand-in entity, only the rect matters to the grid.
+    """
+    def __init__(self, x, y, size=10):
+        self.rect = pygame.Rect(x, y, size, size)
+
+def test_find_collisions_pairs_each_item_with_an_overlapping_entity():
+    near = Box(100, 100)
+    far = Box(500, 500)
+    grid = SpatialGrid(cell_size=64)
+    grid.rebuild([near, far])
+
+    hit = Box(105, 105)
+    miss = Box(300, 300)
+    assert grid.find_collisions([hit, miss]) == [(hit, near)]
+
+def test_find_collisions_reports_at_most_one_entity_per_item():
+    first = Box(100, 100)
+    second = Box(102, 102)
+    grid = SpatialGrid()
+    grid.rebuild([first], [second])
+
+    item = Box(101, 101)
+    collisions = grid.find_collisions([item])
+    assert len(collisions) == 1
+    assert collisions[0][0] is item
+    assert collisions[0][1] in (first, second)
+
+def test_find_collisions_across_cell_borders():
+    entity = Box(60, 60)
+    grid = SpatialGrid(cell_size=64)
+    grid.rebuild([entity])
+
+    item = Box(66, 66) # Its center is in the next cell
+    assert grid.find_collisions([item]) == [(item, entity)]
+
+def test_cells_grow_to_fit_the_largest_entity():
+    large = Box(0, 0, size=200)
+    grid = SpatialGrid(cell_size=64)
+    grid.rebuild([large, Box(300, 300)])
+    assert grid.cell_size == 200
+
+    item = Box(5, 5)
+    assert grid.find_collisions([item]) == [(item, large)]